@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark compositors and enhancements on synthetic data."""
+
+import dask
+
+from benchmarks.utils import get_synthetic_area, get_synthetic_data_array
+
+
+class Composites:
+    """Benchmark the main compositors on synthetic data, no data files needed."""
+
+    timeout = 300
+
+    def setup(self):
+        """Create the input channels."""
+        area = get_synthetic_area()
+        self.red, self.green, self.blue = (get_synthetic_data_array(name, area) for name in ("C01", "C02", "C03"))
+        self.red_hr = get_synthetic_data_array("C01_hr", area, resolution=500)
+        self.dnb = get_synthetic_data_array("DNB", area, units="W m-2 sr-1",
+                                            standard_name="toa_outgoing_radiance_per_unit_wavelength")
+        self.sza = get_synthetic_data_array("solar_zenith_angle", area, units="degrees",
+                                            standard_name="solar_zenith_angle") * 1.8
+
+    def _day_night(self):
+        from satpy.composites.fill import DayNightCompositor
+        comp = DayNightCompositor("day_night", day_night="day_night")
+        return comp((self.red, self.blue))
+
+    def _ratio_sharpened(self):
+        from satpy.composites.resolution import RatioSharpenedRGB
+        comp = RatioSharpenedRGB("ratio_sharpened")
+        return comp((self.red, self.green, self.blue), optional_datasets=(self.red_hr,))
+
+    def _histogram_dnb(self):
+        from satpy.composites.viirs import HistogramDNB
+        comp = HistogramDNB("histogram_dnb")
+        return comp((self.dnb, self.sza))
+
+    def time_day_night(self):
+        """Time blending day and night data using generated solar zenith angles."""
+        self._day_night().compute()
+
+    def peakmem_day_night(self):
+        """Check peak memory usage of blending day and night data using generated solar zenith angles."""
+        self._day_night().compute()
+
+    def time_ratio_sharpened_rgb(self):
+        """Time sharpening an RGB with a high resolution band."""
+        self._ratio_sharpened().compute()
+
+    def peakmem_ratio_sharpened_rgb(self):
+        """Check peak memory usage of sharpening an RGB with a high resolution band."""
+        self._ratio_sharpened().compute()
+
+    def time_histogram_dnb(self):
+        """Time the histogram equalization of DNB data."""
+        self._histogram_dnb().compute()
+
+    def peakmem_histogram_dnb(self):
+        """Check peak memory usage of the histogram equalization of DNB data."""
+        self._histogram_dnb().compute()
+
+
+class Enhancements:
+    """Benchmark the default enhancement chains on synthetic data."""
+
+    timeout = 300
+
+    def setup(self):
+        """Create an RGB composite and a single channel."""
+        from satpy.composites.core import GenericCompositor
+        area = get_synthetic_area()
+        self.channel = get_synthetic_data_array("C01", area)
+        channels = [get_synthetic_data_array(name, area) for name in ("C01", "C02", "C03")]
+        self.rgb = GenericCompositor("true_color")(channels)
+
+    @staticmethod
+    def _enhance_and_compute(data_arr):
+        from satpy.enhancements.enhancer import get_enhanced_image
+        img = get_enhanced_image(data_arr)
+        dask.compute(img.finalize()[0])
+
+    def time_enhance_channel(self):
+        """Time enhancing a single channel."""
+        self._enhance_and_compute(self.channel)
+
+    def peakmem_enhance_channel(self):
+        """Check peak memory usage of enhancing a single channel."""
+        self._enhance_and_compute(self.channel)
+
+    def time_enhance_rgb(self):
+        """Time enhancing an RGB composite."""
+        self._enhance_and_compute(self.rgb)
+
+    def peakmem_enhance_rgb(self):
+        """Check peak memory usage of enhancing an RGB composite."""
+        self._enhance_and_compute(self.rgb)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark unpacking of 10-bit SEVIRI data."""
+
+import numpy as np
+
+
+def dec10216_reference(inbuf):
+    """Unpack 10-bit data the way dec10216 did before it unpacked block-wise."""
+    arr10 = inbuf.astype(np.uint16)
+    arr16_len = int(len(arr10) * 4 / 5)
+    arr10_len = int((arr16_len * 5) / 4)
+    arr10 = arr10[:arr10_len]
+
+    arr10_0 = arr10[::5]
+    arr10_1 = arr10[1::5]
+    arr10_2 = arr10[2::5]
+    arr10_3 = arr10[3::5]
+    arr10_4 = arr10[4::5]
+
+    arr16_0 = (arr10_0 << 2) + (arr10_1 >> 6)
+    arr16_1 = ((arr10_1 & 63) << 4) + (arr10_2 >> 4)
+    arr16_2 = ((arr10_2 & 15) << 6) + (arr10_3 >> 2)
+    arr16_3 = ((arr10_3 & 3) << 8) + arr10_4
+    return np.stack([arr16_0, arr16_1, arr16_2, arr16_3], axis=-1).ravel()
+
+
+class Dec10216:
+    """Benchmark the 10-bit unpacking on one SEVIRI HRIT segment and one full disk channel."""
+
+    params = [464, 3712]
+    param_names = ["lines"]
+
+    def setup(self, lines):
+        """Create the packed data."""
+        rng = np.random.default_rng(42)
+        self.packed = rng.integers(0, 256, size=(lines, 3712 * 10 // 8), dtype=np.uint8)
+        self.flat = self.packed.ravel()
+        self.out = np.empty(lines * 3712, dtype=np.uint16)
+
+    def time_reference(self, lines):
+        """Time the former implementation."""
+        dec10216_reference(self.flat)
+
+    def peakmem_reference(self, lines):
+        """Check peak memory usage of the former implementation."""
+        dec10216_reference(self.flat)
+
+    def time_dec10216(self, lines):
+        """Time unpacking into a new array."""
+        from satpy.readers.core.seviri import dec10216
+        dec10216(self.flat)
+
+    def peakmem_dec10216(self, lines):
+        """Check peak memory usage of unpacking into a new array."""
+        from satpy.readers.core.seviri import dec10216
+        dec10216(self.flat)
+
+    def time_dec10216_out(self, lines):
+        """Time unpacking into a preallocated array."""
+        from satpy.readers.core.seviri import dec10216
+        dec10216(self.flat, out=self.out)
+
+    def time_dec10216_line_window(self, lines):
+        """Time unpacking only a tenth of the lines."""
+        from satpy.readers.core.seviri import dec10216
+        dec10216(self.packed, lines=slice(lines // 2, lines // 2 + lines // 10))
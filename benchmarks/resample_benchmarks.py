@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark resampling of synthetic data."""
+
+from benchmarks.utils import (
+    get_synthetic_area,
+    get_synthetic_data_array,
+    get_synthetic_scene,
+    get_synthetic_target_area,
+)
+
+
+class Resample:
+    """Benchmark the resamplers on synthetic data, no data files needed."""
+
+    timeout = 600
+    params = ["nearest", "bilinear", "bucket_avg"]
+    param_names = ["resampler"]
+
+    def setup(self, resampler):
+        """Create the scene and target area."""
+        self.scn = get_synthetic_scene()
+        self.target = get_synthetic_target_area()
+
+    def _resample_and_compute(self, resampler):
+        new_scn = self.scn.resample(self.target, resampler=resampler)
+        new_scn.compute()
+
+    def time_resample(self, resampler):
+        """Time resampling and computing three channels."""
+        self._resample_and_compute(resampler)
+
+    def peakmem_resample(self, resampler):
+        """Check peak memory usage of resampling and computing three channels."""
+        self._resample_and_compute(resampler)
+
+
+class NativeResample:
+    """Benchmark the native resampler replicating and aggregating synthetic data."""
+
+    timeout = 300
+
+    def setup(self):
+        """Create a scene with channels at two resolutions."""
+        self.scn = get_synthetic_scene(names=("C01", "C03"), shape=(1000, 1000))
+        self.scn["C02"] = get_synthetic_data_array("C02", get_synthetic_area((2000, 2000), "synthetic_geos_hr"))
+
+    def _resample_and_compute(self, destination):
+        new_scn = self.scn.resample(destination, resampler="native")
+        new_scn.compute()
+
+    def time_native_replicate(self):
+        """Time replicating the low resolution channels to the finest area."""
+        self._resample_and_compute(self.scn.finest_area())
+
+    def peakmem_native_replicate(self):
+        """Check peak memory usage of replicating the low resolution channels to the finest area."""
+        self._resample_and_compute(self.scn.finest_area())
+
+    def time_native_aggregate(self):
+        """Time aggregating the high resolution channel to the coarsest area."""
+        self._resample_and_compute(self.scn.coarsest_area())
+
+    def peakmem_native_aggregate(self):
+        """Check peak memory usage of aggregating the high resolution channel to the coarsest area."""
+        self._resample_and_compute(self.scn.coarsest_area())
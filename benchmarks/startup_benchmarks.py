@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark the startup latency of fresh Python processes.
+
+The ``timeraw_`` benchmarks are run by asv in a new interpreter every time, so
+they include the cost of importing all modules and parsing the configuration
+files, like in short-lived processes. Readers without demo data available in
+``SATPY_DEMO_DATA_DIR`` are skipped, the other benchmark modules download them.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+
+from benchmarks.utils import get_filenames
+
+READER_FILES = {
+    "abi_l1b": (os.path.join("abi_l1b", "20190314_us_midlatitude_cyclone"), "*.nc"),
+    "ahi_hsd": (os.path.join("ahi_hsd", "20210417_0500_typhoon_surigae"), "*.DAT*"),
+    "seviri_l1b_hrit": (os.path.join("seviri_hrit", "20180228_1500"), "*"),
+    "viirs_sdr": (os.path.join("viirs_sdr", "20170128_1229"), "*.h5"),
+}
+
+
+class Startup:
+    """Benchmark importing satpy in a new process."""
+
+    timeout = 120
+
+    def timeraw_import_satpy(self):
+        """Time importing satpy."""
+        return "import satpy"
+
+    def timeraw_available_readers(self):
+        """Time importing satpy and listing the available readers."""
+        return "import satpy; satpy.available_readers()"
+
+
+class SceneStartup:
+    """Benchmark the first Scene creation in a new process for each reader."""
+
+    timeout = 300
+    params = sorted(READER_FILES)
+    param_names = ["reader"]
+
+    def setup(self, reader):
+        """Check that the data files are available."""
+        if not self._get_filenames(reader):
+            raise NotImplementedError(f"No demo data available for {reader}")
+
+    def _get_filenames(self, reader):
+        subdir, pattern = READER_FILES[reader]
+        return sorted(fn for fn in get_filenames(subdir) if fnmatch.fnmatch(os.path.basename(fn), pattern))
+
+    def timeraw_create_scene(self, reader):
+        """Time importing satpy and creating a Scene."""
+        filenames = self._get_filenames(reader)
+        return f"from satpy import Scene; Scene(reader={reader!r}, filenames={filenames!r})"
+
+    def timeraw_create_scene_and_list_datasets(self, reader):
+        """Time importing satpy, creating a Scene and listing its available datasets."""
+        filenames = self._get_filenames(reader)
+        return (f"from satpy import Scene; "
+                f"Scene(reader={reader!r}, filenames={filenames!r}).available_dataset_names()")
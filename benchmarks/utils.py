@@ -70,3 +70,53 @@ class GeoBenchmarks:
         """Load and compute one channel."""
         scn = self.load_no_padding(channel, filenames=filenames)
         scn[channel].compute()
+
+
+def get_synthetic_area(shape=(1000, 1000), area_id="synthetic_geos"):
+    """Get a geostationary area covering Europe and Africa with the given shape."""
+    from pyresample.geometry import AreaDefinition
+    proj_dict = {"proj": "geos", "lon_0": 0.0, "h": 35785831.0, "a": 6378169.0, "b": 6356583.8, "units": "m"}
+    extents = (-3000000.0, 1000000.0, 3000000.0, 5000000.0)
+    return AreaDefinition(area_id, area_id, area_id, proj_dict, shape[1], shape[0], extents)
+
+
+def get_synthetic_target_area(shape=(800, 800)):
+    """Get a lat/lon target area inside the synthetic source area."""
+    from pyresample.geometry import AreaDefinition
+    return AreaDefinition("synthetic_latlon", "synthetic_latlon", "synthetic_latlon",
+                          {"proj": "longlat", "datum": "WGS84"}, shape[1], shape[0],
+                          (-15.0, 15.0, 15.0, 45.0))
+
+
+def get_synthetic_data_array(name, area, chunks=500, **attrs):
+    """Get a DataArray of random reflectance-like data without reading any file."""
+    import datetime as dt
+
+    import dask.array as da
+    import xarray as xr
+
+    start_time = dt.datetime(2024, 6, 21, 17, 0)
+    data = da.random.default_rng(42).uniform(0.0, 100.0, size=area.shape, chunks=chunks).astype("float32")
+    all_attrs = {
+        "name": name,
+        "area": area,
+        "start_time": start_time,
+        "end_time": start_time + dt.timedelta(minutes=15),
+        "platform_name": "Synthetic-1",
+        "sensor": "synthetic",
+        "units": "%",
+        "standard_name": "toa_bidirectional_reflectance",
+        "calibration": "reflectance",
+    }
+    all_attrs.update(attrs)
+    return xr.DataArray(data, dims=("y", "x"), attrs=all_attrs)
+
+
+def get_synthetic_scene(names=("C01", "C02", "C03"), shape=(1000, 1000), chunks=500):
+    """Get a Scene holding synthetic channels on the same area."""
+    from satpy import Scene
+    area = get_synthetic_area(shape)
+    scn = Scene()
+    for name in names:
+        scn[name] = get_synthetic_data_array(name, area, chunks=chunks)
+    return scn
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark writers on synthetic data."""
+
+import shutil
+import tempfile
+
+from benchmarks.utils import get_synthetic_area, get_synthetic_data_array
+
+
+class Writers:
+    """Benchmark saving synthetic data with the main writers, no data files needed."""
+
+    timeout = 600
+    params = ["geotiff", "cf", "awips_tiled"]
+    param_names = ["writer"]
+
+    def setup(self, writer):
+        """Create the scene and output directory."""
+        from satpy import Scene
+        from satpy.coords import add_crs_xy_coords
+        self.scn = Scene()
+        area = get_synthetic_area()
+        for name in ("C01", "C02"):
+            self.scn[name] = add_crs_xy_coords(get_synthetic_data_array(name, area), area)
+        self.base_dir = tempfile.mkdtemp()
+
+    def teardown(self, writer):
+        """Remove the written files."""
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def _save(self, writer):
+        kwargs = {}
+        if writer == "awips_tiled":
+            kwargs = {"sector_id": "TEST", "source_name": "SYNTH", "tile_count": (4, 4)}
+        self.scn.save_datasets(writer=writer, base_dir=self.base_dir, **kwargs)
+
+    def time_save_datasets(self, writer):
+        """Time saving two channels."""
+        self._save(writer)
+
+    def peakmem_save_datasets(self, writer):
+        """Check peak memory usage of saving two channels."""
+        self._save(writer)
@@ -17,6 +17,11 @@
 # satpy.  If not, see <http://www.gnu.org/licenses/>.
 """Satpy Package initializer."""
 
+from satpy import _startup_profile
+
+if _startup_profile.enabled_in_environment():
+    _startup_profile.enable(report_at_exit=True)
+
 try:
     from satpy.version import version as __version__  # noqa
 except ModuleNotFoundError:
@@ -36,3 +41,5 @@ from satpy.utils import get_logger  # noqa
 from satpy.writers.core.config import available_writers  # noqa
 
 log = get_logger("satpy")
+
+_startup_profile.record_package_import()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Cache of the slices of an area covering another area.
+
+Reducing the data before resampling and cropping a Scene compute the slices
+of the source area covering the destination area, which needs the boundaries
+of both areas and the intersection of their polygons. The slices between
+area definitions are kept in memory for the rest of the process, for the
+last :data:`MEMORY_CACHE_SIZE` pairs of areas used.
+
+With the ``cache_area_slices`` setting enabled (see :doc:`config`), they are
+also stored in ``<cache_dir>/area_slices`` as small JSON files shared by all
+processes, and reused for example by hourly jobs resampling the same source
+area to the same target areas. When there are more than
+``area_slices_cache_max_entries`` files, the least recently used ones are
+removed.
+
+Entries are identified by the hashes of the two areas, which depend on their
+projection, shape and extent, and by the version of pyresample. Swath
+definitions are never cached.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+
+import satpy
+
+LOG = logging.getLogger(__name__)
+
+CACHE_CONFIG_KEY = "cache_area_slices"
+MAX_ENTRIES_CONFIG_KEY = "area_slices_cache_max_entries"
+CACHE_SUBDIR = "area_slices"
+# increase when the layout of the stored entries changes
+CACHE_FORMAT_VERSION = 1
+# number of pairs of areas kept in memory
+MEMORY_CACHE_SIZE = 256
+
+_MEMORY_CACHE: OrderedDict[str, tuple[slice, slice]] = OrderedDict()
+
+
+def get_area_slices(source_area, destination_area, shape_divisible_by=None) -> tuple[slice, slice]:
+    """Get the slices of *source_area* covering *destination_area*, from the cache if possible.
+
+    Args:
+        source_area: Area to slice.
+        destination_area: Area to cover.
+        shape_divisible_by: Make the shape of the sliced area divisible by
+            this factor, see
+            :meth:`pyresample.geometry.AreaDefinition.get_area_slices`.
+
+    Returns:
+        The x and y slices.
+
+    Raises:
+        NotImplementedError: if the slices can't be computed for these areas.
+
+    """
+    cache_id = _get_cache_id(source_area, destination_area, shape_divisible_by)
+    if cache_id is None:
+        return _compute_area_slices(source_area, destination_area, shape_divisible_by)
+    slices = _MEMORY_CACHE.get(cache_id)
+    if slices is not None:
+        _MEMORY_CACHE.move_to_end(cache_id)
+        return slices
+    use_disk = satpy.config.get(CACHE_CONFIG_KEY, False)
+    slices = _load_cached(cache_id) if use_disk else None
+    if slices is None:
+        slices = _compute_area_slices(source_area, destination_area, shape_divisible_by)
+        if use_disk:
+            _write_cache_file(cache_id, slices)
+    _remember(cache_id, slices)
+    return slices
+
+
+def _compute_area_slices(source_area, destination_area, shape_divisible_by):
+    try:
+        return source_area.get_area_slices(destination_area, shape_divisible_by=shape_divisible_by)
+    except TypeError:
+        return source_area.get_area_slices(destination_area)
+
+
+def _get_cache_id(source_area, destination_area, shape_divisible_by):
+    from pyresample import __version__ as pyresample_version
+    from pyresample.geometry import AreaDefinition
+
+    if not isinstance(source_area, AreaDefinition) or not isinstance(destination_area, AreaDefinition):
+        return None
+    try:
+        area_hashes = [area.update_hash().hexdigest() for area in (source_area, destination_area)]
+    except (AttributeError, TypeError, ValueError):
+        return None
+    cache_id = (CACHE_FORMAT_VERSION, pyresample_version, area_hashes, shape_divisible_by)
+    return hashlib.sha1(repr(cache_id).encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _remember(cache_id, slices):
+    _MEMORY_CACHE[cache_id] = slices
+    _MEMORY_CACHE.move_to_end(cache_id)
+    while len(_MEMORY_CACHE) > MEMORY_CACHE_SIZE:
+        _MEMORY_CACHE.popitem(last=False)
+
+
+def _get_cache_path(cache_id):
+    return os.path.join(get_cache_dir(), cache_id + ".json")
+
+
+def _load_cached(cache_id):
+    cache_path = _get_cache_path(cache_id)
+    try:
+        with open(cache_path) as cache_file:
+            content = json.load(cache_file)
+        slices = tuple(slice(*content[name]) for name in ("x", "y"))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    try:
+        # the modification time tells which entries were used last
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return slices
+
+
+def _write_cache_file(cache_id, slices):
+    cache_dir = get_cache_dir()
+    content = {name: [None if value is None else int(value) for value in (slc.start, slc.stop, slc.step)]
+               for name, slc in zip(("x", "y"), slices)}
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first so concurrent readers never see partial files
+        with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp", delete=False) as tmp_file:
+            json.dump(content, tmp_file)
+        os.replace(tmp_file.name, _get_cache_path(cache_id))
+    except (OSError, TypeError) as err:
+        LOG.debug("Could not cache area slices %s: %s", cache_id, err)
+        try:
+            os.remove(tmp_file.name)
+        except (OSError, NameError):
+            pass
+        return
+    _remove_old_entries(cache_dir)
+
+
+def _remove_old_entries(cache_dir):
+    max_entries = satpy.config.get(MAX_ENTRIES_CONFIG_KEY, None)
+    if max_entries is None:
+        return
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(".json")]
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=_get_mtime)
+    for entry in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _get_mtime(entry):
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        return 0
+
+
+def get_cache_dir() -> str:
+    """Get the directory where the slices of areas are cached."""
+    return os.path.join(satpy.config.get("cache_dir"), CACHE_SUBDIR)
+
+
+def clear_cache():
+    """Remove all the cached slices of areas, on disk and in memory."""
+    _MEMORY_CACHE.clear()
+    shutil.rmtree(get_cache_dir(), ignore_errors=True)
@@ -46,6 +46,17 @@ _CONFIG_DEFAULTS = {
     "cache_dir": _satpy_dirs.user_cache_dir,
     "cache_lonlats": False,
     "cache_sensor_angles": False,
+    "zarr_cache_max_size": None,
+    "zarr_cache_max_age": None,
+    "zarr_cache_min_age": 600,
+    "geometry_memo_max_entries": 32,
+    "geometry_memo_time_bucket": 0,
+    "cache_file_headers": False,
+    "file_header_cache_max_size": 100 * 1024 ** 2,
+    "cache_yaml_configs": False,
+    "cache_area_slices": False,
+    "area_slices_cache_max_entries": 10000,
+    "resample_index_store_max_size": None,
     "config_path": [],
     "data_dir": _satpy_dirs.user_data_dir,
     "demo_data_dir": ".",
@@ -53,6 +64,7 @@ _CONFIG_DEFAULTS = {
     "sensor_angles_position_preference": "actual",
     "readers": {
         "clip_negative_radiances": False,
+        "hdf5_max_open_files": 128,
     },
 }
 
@@ -134,17 +146,32 @@ def cached_entry_point(group_name: str) -> Iterable[EntryPoint]:
     """Return entry_point for specified ``group``.
 
     This is a dummy proxy to allow caching and provide compatibility between
-    versions of Python and importlib_metadata.
+    versions of Python and importlib_metadata. The installed packages are
+    only scanned once for all the satpy groups, see
+    :func:`_get_satpy_entry_points`.
 
     """
-    try:
-        # mypy in pre-commit currently checks for Python 3.8 compatibility
-        # this line is for Python 3.10+ so it will fail checks
-        return entry_points(group=group_name)  # type: ignore
-    except TypeError:
+    return _get_satpy_entry_points().get(group_name, [])
+
+
+@cache
+def _get_satpy_entry_points() -> dict[str, list[EntryPoint]]:
+    """Get the entry points of all ``satpy.*`` groups.
+
+    Looking up a single group still reads the entry points of every installed
+    package, so the readers, writers, composites and enhancements groups are
+    collected in one go.
+
+    """
+    all_entry_points = entry_points()
+    if isinstance(all_entry_points, dict):
         # Python <3.10
-        entry_points_list = entry_points()
-        return entry_points_list.get(group_name, [])
+        return all_entry_points
+    groups: dict[str, list[EntryPoint]] = {}
+    for entry_point in all_entry_points:
+        if entry_point.group.startswith("satpy."):
+            groups.setdefault(entry_point.group, []).append(entry_point)
+    return groups
 
 
 def _entry_point_module(entry_point):
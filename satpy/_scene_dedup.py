@@ -0,0 +1,128 @@
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Helper functions for merging the equivalent tasks of the dask graphs of a Scene.
+
+Dask only shares the tasks of different arrays when their keys are equal.
+Composites and modifiers applied to the same inputs can produce equivalent
+tasks with different keys, for example when the names of the arrays are
+derived from attributes which differ between the composites. These tasks
+would be computed once for every array.
+
+Two tasks are equivalent if they call the same function with the same
+arguments, after the keys of their dependencies have been replaced by the keys
+of the equivalent tasks found before them. Tasks are compared by their dask
+token, so tasks with arguments that can't be tokenized deterministically are
+never merged.
+
+The arrays keep the layers of their original graphs, with their annotations.
+Layers whose tasks were merged or use merged tasks are materialized though,
+so dask can't fuse them with their neighbouring blockwise layers anymore.
+
+"""
+
+from __future__ import annotations
+
+import dask.array as da
+from dask.base import tokenize
+from dask.core import toposort
+from dask.highlevelgraph import HighLevelGraph, MaterializedLayer
+
+try:
+    from dask._task_spec import Alias, convert_legacy_graph
+except ImportError as err:
+    raise ImportError("Merging equivalent dask tasks requires a version of dask providing "
+                      "the 'dask._task_spec' module, please update dask.") from err
+
+
+def merge_equivalent_tasks(data_arrays):
+    """Replace the dask arrays of ``data_arrays`` by arrays sharing their equivalent tasks.
+
+    Args:
+        data_arrays (list): DataArrays to process together. Arrays not
+            backed by dask are returned unchanged.
+
+    Returns:
+        The list of new DataArrays, with the same coordinates and attributes.
+
+    """
+    dask_arrays = [data_arr.data for data_arr in data_arrays if isinstance(data_arr.data, da.Array)]
+    if not dask_arrays:
+        return list(data_arrays)
+    graph = HighLevelGraph.merge(*(arr.__dask_graph__() for arr in dask_arrays))
+    dsk = convert_legacy_graph(dict(graph))
+    new_graph = _rebuild_graph(graph, dsk, _merge_equivalent_tasks(dsk))
+    return [data_arr.copy(data=_rebuild_array(data_arr.data, new_graph))
+            if isinstance(data_arr.data, da.Array) else data_arr
+            for data_arr in data_arrays]
+
+def _merge_equivalent_tasks(dsk):
+    """Get a graph where every task is computed once and duplicates are aliases to it."""
+    canonical_keys = {}
+    first_keys = {}
+    new_dsk = {}
+    for key in toposort(dsk):
+        node = dsk[key]
+        if isinstance(node, Alias):
+            canonical_keys[key] = canonical_keys.get(node.target, node.target)
+            continue
+        subs = {dep: canonical_keys[dep] for dep in node.dependencies
+                if canonical_keys.get(dep, dep) != dep}
+        if subs:
+            node = node.substitute(subs)
+        canonical_key = first_keys.setdefault(tokenize(node), key)
+        canonical_keys[key] = canonical_key
+        if canonical_key == key:
+            new_dsk[key] = node
+    for key, canonical_key in canonical_keys.items():
+        if canonical_key != key:
+            # keep the duplicate keys valid for the arrays using them
+            new_dsk[key] = Alias(key, canonical_key)
+    return new_dsk
+
+
+def _rebuild_graph(graph, dsk, new_dsk):
+    """Split the merged tasks into the layers of the original graph.
+
+    Layers whose tasks are all unchanged are kept as they are, the others are
+    replaced by materialized layers with the same annotations.
+
+    """
+    layer_names = {key: name for name, layer in graph.layers.items() for key in layer}
+    layers = {}
+    dependencies = {}
+    for name, layer in graph.layers.items():
+        if all(new_dsk.get(key) is dsk[key] for key in layer):
+            layers[name] = layer
+            dependencies[name] = set(graph.dependencies.get(name, ()))
+            continue
+        tasks = {key: new_dsk[key] for key in layer}
+        layers[name] = MaterializedLayer(tasks, annotations=layer.annotations,
+                                         collection_annotations=layer.collection_annotations)
+        dependencies[name] = {layer_names[dep] for task in tasks.values() for dep in task.dependencies} - {name}
+    return HighLevelGraph(layers, dependencies)
+
+
+def _rebuild_array(arr, graph):
+    names = set()
+    stack = [arr.name]
+    while stack:
+        name = stack.pop()
+        if name not in names:
+            names.add(name)
+            stack.extend(graph.dependencies[name])
+    return da.Array(HighLevelGraph({name: graph.layers[name] for name in names},
+                                   {name: graph.dependencies[name] for name in names}),
+                    arr.name, arr.chunks, meta=arr._meta)
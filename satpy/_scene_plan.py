@@ -0,0 +1,267 @@
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Helper functions for estimating the resources needed to process a Scene.
+
+The estimates are made from the lazy dask graphs of the datasets, nothing is
+computed. The size of every chunk is known from the shape, chunks and data
+type of the dask arrays. Tasks which don't produce a chunk of a known array
+are assumed to be as large as their largest input. Executing the tasks one at
+a time in the order chosen by :func:`dask.order.order`, and releasing every
+result as soon as all the tasks depending on it are done, gives the estimated
+peak memory of the computation.
+
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+from collections import defaultdict
+
+import dask
+import numpy as np
+from dask.core import flatten, get_deps
+from dask.highlevelgraph import HighLevelGraph
+from dask.order import order
+from dask.utils import format_bytes
+
+from satpy.node import ReaderNode
+from satpy.utils import get_dask_chunk_size_in_bytes
+
+if typing.TYPE_CHECKING:
+    from satpy.scene import Scene
+
+
+class ScenePlan:
+    """Estimated resources needed to compute the datasets of a Scene.
+
+    Attributes:
+        datasets (dict): Shape, data type, chunk shape and size in bytes of
+            every planned product, by DataID.
+        task_count (int): Number of dask tasks in the merged graph of all
+            products.
+        bytes_per_file (dict): Estimated number of bytes read from each
+            input file, the in-memory size of the datasets loaded from the
+            file.
+        peak_memory (int): Estimated peak memory, in bytes, when computing
+            all products with one thread.
+        largest_chunk (int): Size in bytes of the largest chunk of the
+            computation.
+        suggested_chunk_size (int or None): Suggested value, in bytes, of the
+            ``array.chunk-size`` dask setting to stay within the memory limit
+            passed to :meth:`~satpy.scene.Scene.plan`, or None if no limit
+            was given.
+
+    """
+
+    def __init__(self, datasets, task_count, bytes_per_file, peak_memory, largest_chunk,
+                 suggested_chunk_size=None):
+        """Store the estimates."""
+        self.datasets = datasets
+        self.task_count = task_count
+        self.bytes_per_file = bytes_per_file
+        self.peak_memory = peak_memory
+        self.largest_chunk = largest_chunk
+        self.suggested_chunk_size = suggested_chunk_size
+
+    @property
+    def bytes_read(self) -> int:
+        """Get the estimated total number of bytes read from all files."""
+        return sum(self.bytes_per_file.values())
+
+    def __repr__(self):
+        """Get a short representation of the plan."""
+        return (f"<ScenePlan: {len(self.datasets)} datasets, {self.task_count} tasks, "
+                f"peak memory {format_bytes(self.peak_memory)}>")
+
+    def __str__(self):
+        """Format the plan as a report."""
+        lines = ["Products"]
+        for data_id, info in self.datasets.items():
+            lines.append(f"  {data_id['name']}: shape {info['shape']}, {info['dtype']}, "
+                         f"chunks {info['chunksize']}, {format_bytes(info['nbytes'])}")
+        lines.append(f"Tasks: {self.task_count}")
+        lines.append(f"Bytes read: {format_bytes(self.bytes_read)} from {len(self.bytes_per_file)} files")
+        lines.append(f"Largest chunk: {format_bytes(self.largest_chunk)}")
+        lines.append(f"Estimated peak memory: {format_bytes(self.peak_memory)}")
+        if self.suggested_chunk_size is not None:
+            lines.append(f"Suggested array.chunk-size: {format_bytes(self.suggested_chunk_size)}")
+        return "\n".join(lines)
+
+
+def plan_scene(scn: Scene, wishlist=None, area=None, writer=None, memory_limit=None,
+               load_kwargs=None, resample_kwargs=None, writer_kwargs=None) -> ScenePlan:
+    """Estimate the resources needed to load, resample and save datasets of a Scene.
+
+    See :meth:`satpy.scene.Scene.plan` for a description of the arguments.
+
+    """
+    new_scn = _copy_scene_with_readers(scn)
+    if wishlist is not None:
+        # keep the dependencies of the composites to know which files are read
+        new_scn.load(wishlist, unload=False, **(load_kwargs or {}))
+        products = [new_scn[data_id] for data_id in new_scn.wishlist if data_id in new_scn]
+    else:
+        products = list(new_scn.values())
+    if not products:
+        raise KeyError("None of the requested datasets could be loaded.")
+    bytes_per_file = _get_bytes_per_file(new_scn, new_scn.keys())
+    if area is not None:
+        product_ids = [product.attrs["_satpy_id"] for product in products]
+        new_scn = new_scn.resample(area, datasets=product_ids, **(resample_kwargs or {}))
+        products = [new_scn[data_id] for data_id in product_ids if data_id in new_scn]
+    arrays, outputs_kept = _get_arrays_to_compute(products, writer, writer_kwargs)
+
+    graph = HighLevelGraph.merge(*(arr.__dask_graph__() for arr in arrays))
+    output_keys = {key for arr in arrays for key in flatten(arr.__dask_keys__())}
+    peak_memory, largest_chunk = _estimate_peak_memory(graph, output_keys, outputs_kept)
+    datasets = {product.attrs["_satpy_id"]: _get_array_info(product.data) for product in products}
+    suggested_chunk_size = None
+    if memory_limit is not None:
+        largest_array = max(info["nbytes"] for info in datasets.values())
+        suggested_chunk_size = _suggest_chunk_size(memory_limit, peak_memory, largest_array)
+    return ScenePlan(datasets, len(graph), bytes_per_file, peak_memory, largest_chunk,
+                     suggested_chunk_size)
+
+
+def _copy_scene_with_readers(scn):
+    # the readers are shared, loading datasets doesn't change their state
+    new_scn = scn.copy()
+    new_scn._readers = scn._readers
+    new_scn._dependency_tree.readers = scn._readers
+    return new_scn
+
+
+def _get_arrays_to_compute(products, writer, writer_kwargs):
+    """Get the dask arrays that would be computed and whether they are kept in memory."""
+    if writer is None:
+        return [_as_dask_array(product.data) for product in products], True
+    from satpy.enhancements.enhancer import get_enhanced_image
+    from satpy.writers.core.config import load_writer
+    from satpy.writers.core.image import ImageWriter
+
+    writer, _ = load_writer(writer, **(writer_kwargs or {}))
+    if isinstance(writer, ImageWriter):
+        arrays = [get_enhanced_image(product.squeeze(), enhance=writer.enhancer).data.data
+                  for product in products]
+    else:
+        arrays = [product.data for product in products]
+    return [_as_dask_array(arr) for arr in arrays], False
+
+
+def _as_dask_array(arr):
+    import dask.array as da
+
+    if isinstance(arr, da.Array):
+        return arr
+    return da.from_array(np.asarray(arr), chunks=-1)
+
+
+def _get_array_info(arr):
+    return {
+        "shape": arr.shape,
+        "dtype": arr.dtype,
+        "chunksize": getattr(arr, "chunksize", arr.shape),
+        "nbytes": int(arr.nbytes),
+    }
+
+
+def _get_bytes_per_file(scn, data_ids):
+    """Distribute the size of the datasets loaded by the readers over the files they are read from."""
+    bytes_per_file = defaultdict(int)
+    for node in scn._dependency_tree.leaves(limit_nodes_to=[did for did in data_ids
+                                                           if did in scn._dependency_tree]):
+        if not isinstance(node, ReaderNode) or node.name not in scn:
+            continue
+        filenames = _get_filenames(scn._readers[node.reader_name], node.name)
+        if not filenames:
+            continue
+        nbytes = scn[node.name].nbytes
+        for filename in filenames:
+            bytes_per_file[filename] += nbytes // len(filenames)
+    return dict(bytes_per_file)
+
+
+def _get_filenames(reader, data_id):
+    try:
+        file_handlers = reader._get_file_handlers(data_id)
+    except (AttributeError, KeyError):
+        return []
+    return [fh.filename for fh in file_handlers or []]
+
+
+def _estimate_peak_memory(graph, output_keys, outputs_kept=True):
+    """Simulate the sequential execution of the graph and get the peak and largest chunk sizes."""
+    dsk = dict(graph)
+    dependencies, dependents = get_deps(dsk)
+    chunk_sizes = _get_layer_chunk_sizes(graph)
+    sizes = {}
+    remaining = {key: len(deps) for key, deps in dependents.items()}
+    memory = peak = 0
+    priorities = order(dsk, dependencies=dependencies)
+    for key in sorted(dsk, key=priorities.__getitem__):
+        size = _get_task_size(key, chunk_sizes, dependencies[key], sizes)
+        sizes[key] = size
+        memory += size
+        peak = max(peak, memory)
+        if key in output_keys and not outputs_kept:
+            memory -= size
+        for dep in dependencies[key]:
+            remaining[dep] -= 1
+            if not remaining[dep] and (dep not in output_keys or not outputs_kept):
+                memory -= sizes[dep]
+    return peak, max(sizes.values(), default=0)
+
+
+def _get_layer_chunk_sizes(graph):
+    """Get the chunks and item size of the arrays produced by every layer."""
+    chunk_sizes = {}
+    for name, layer in graph.layers.items():
+        annotations = layer.collection_annotations or {}
+        if "chunks" not in annotations:
+            continue
+        try:
+            itemsize = np.dtype(annotations.get("dtype")).itemsize
+        except TypeError:
+            itemsize = np.dtype(float).itemsize
+        chunk_sizes[name] = (annotations["chunks"], itemsize)
+    return chunk_sizes
+
+
+def _get_task_size(key, chunk_sizes, dependencies, sizes):
+    if isinstance(key, tuple) and key[0] in chunk_sizes:
+        chunks, itemsize = chunk_sizes[key[0]]
+        index = key[1:]
+        if len(index) == len(chunks):
+            try:
+                return math.prod(dim_chunks[i] for dim_chunks, i in zip(chunks, index)) * itemsize
+            except (IndexError, TypeError):
+                pass
+    return max((sizes[dep] for dep in dependencies), default=0)
+
+
+def _suggest_chunk_size(memory_limit, peak_memory, largest_array):
+    """Scale the configured chunk size so that the peak memory fits in the limit."""
+    memory_limit = dask.utils.parse_bytes(memory_limit) if isinstance(memory_limit, str) else memory_limit
+    chunk_size = get_dask_chunk_size_in_bytes()
+    if not peak_memory:
+        return chunk_size
+    suggested = int(chunk_size * memory_limit / peak_memory)
+    # chunks larger than the arrays don't change anything
+    suggested = min(suggested, max(chunk_size, largest_array))
+    # round down to whole MiB when possible
+    mib = 2 ** 20
+    return max(suggested // mib * mib, min(suggested, mib))
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Record the time spent importing modules and loading configuration files.
+
+Setting the ``SATPY_PROFILE_STARTUP`` environment variable to ``1`` before
+importing satpy installs an import hook timing the execution of every module
+imported from then on, and makes satpy time the loading of every YAML
+configuration file. The report is printed to standard error when the process
+exits, and can be printed at any time with :func:`satpy.utils.startup_report`::
+
+    SATPY_PROFILE_STARTUP=1 python -c "import satpy; satpy.Scene(reader='abi_l1b', filenames=[...])"
+
+This module must only depend on the standard library, as it is imported before
+anything else by :mod:`satpy`.
+
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import threading
+import time
+from importlib.abc import MetaPathFinder
+
+ENV_VAR = "SATPY_PROFILE_STARTUP"
+
+# module name -> [cumulative seconds, self seconds]
+_IMPORT_TIMES: dict[str, list[float]] = {}
+# configuration file -> [total seconds, number of loads]
+_CONFIG_TIMES: dict[str, list[float]] = {}
+_STATE = threading.local()
+_finder: _ImportTimer | None = None
+_start_time: float | None = None
+_package_import_time: float | None = None
+
+
+class _ImportTimer(MetaPathFinder):
+    """Meta path finder wrapping the loaders found by the other finders with a timer."""
+
+    def find_spec(self, fullname, path, target=None):
+        """Find the spec with the other finders and time the execution of its module."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        _wrap_loader(spec.loader)
+        return spec
+
+
+def _wrap_loader(loader):
+    # loaders that are classes (builtin and frozen modules) are shared, leave them alone
+    if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+        return
+    exec_module = loader.exec_module
+    if getattr(exec_module, "_satpy_timed", False):
+        return
+
+    def timed_exec_module(module):
+        stack = _get_stack()
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            _IMPORT_TIMES[module.__name__] = [elapsed, elapsed - children]
+
+    timed_exec_module._satpy_timed = True  # type: ignore[attr-defined]
+    try:
+        loader.exec_module = timed_exec_module
+    except AttributeError:
+        pass
+
+
+def _get_stack():
+    try:
+        return _STATE.stack
+    except AttributeError:
+        _STATE.stack = []
+        return _STATE.stack
+
+
+def enabled_in_environment() -> bool:
+    """Check if profiling is requested with the ``SATPY_PROFILE_STARTUP`` environment variable."""
+    return os.environ.get(ENV_VAR, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+
+def is_enabled() -> bool:
+    """Check if the imports and configuration files are being timed."""
+    return _finder is not None
+
+
+def enable(report_at_exit: bool = False):
+    """Start timing imports and the loading of configuration files.
+
+    Only the modules imported after this call are timed.
+
+    """
+    global _finder, _start_time
+    if _finder is not None:
+        return
+    _start_time = time.perf_counter()
+    _finder = _ImportTimer()
+    sys.meta_path.insert(0, _finder)
+    if report_at_exit:
+        atexit.register(_print_report)
+
+
+def disable():
+    """Stop timing imports and the loading of configuration files, the recorded times are kept."""
+    global _finder
+    if _finder is None:
+        return
+    try:
+        sys.meta_path.remove(_finder)
+    except ValueError:
+        pass
+    _finder = None
+
+
+def clear():
+    """Forget all recorded times."""
+    global _package_import_time
+    _IMPORT_TIMES.clear()
+    _CONFIG_TIMES.clear()
+    _package_import_time = None
+
+
+def record_package_import():
+    """Record the time since profiling was enabled as the time needed to import satpy."""
+    global _package_import_time
+    if _start_time is not None and _finder is not None:
+        _package_import_time = time.perf_counter() - _start_time
+
+
+def record_config_time(config_file, seconds: float):
+    """Record the time spent loading a configuration file, if profiling is enabled."""
+    if _finder is None:
+        return
+    entry = _CONFIG_TIMES.setdefault(os.fspath(config_file), [0.0, 0])
+    entry[0] += seconds
+    entry[1] += 1
+
+
+def get_import_times() -> dict[str, tuple[float, float]]:
+    """Get the cumulative and self time, in seconds, spent executing each imported module."""
+    return {name: (cumulative, own) for name, (cumulative, own) in _IMPORT_TIMES.items()}
+
+
+def get_config_times() -> dict[str, tuple[float, int]]:
+    """Get the total time, in seconds, spent loading each configuration file and the number of loads."""
+    return {name: (total, int(count)) for name, (total, count) in _CONFIG_TIMES.items()}
+
+
+def format_report(limit: int | None = 20) -> str:
+    """Format the recorded times as text, showing the *limit* slowest entries of each kind."""
+    if _finder is None and not _IMPORT_TIMES and not _CONFIG_TIMES:
+        return (f"Startup profiling is not enabled, set the {ENV_VAR} environment variable "
+                "to 1 before importing satpy.")
+    lines = ["Startup profile", "==============="]
+    if _package_import_time is not None:
+        lines.append(f"import satpy: {_package_import_time:.3f} s")
+    import_total = sum(own for _, own in _IMPORT_TIMES.values())
+    lines.append(f"{len(_IMPORT_TIMES)} modules imported in {import_total:.3f} s")
+    lines.append("")
+    lines.append("Slowest imports (cumulative s, self s, module)")
+    by_time = sorted(_IMPORT_TIMES.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (cumulative, own) in by_time[:limit]:
+        lines.append(f"{cumulative:9.4f} {own:9.4f}  {name}")
+    lines.append("")
+    config_total = sum(total for total, _ in _CONFIG_TIMES.values())
+    lines.append(f"{len(_CONFIG_TIMES)} configuration files loaded in {config_total:.3f} s")
+    lines.append("Slowest configuration files (total s, loads, file)")
+    by_time = sorted(_CONFIG_TIMES.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (total, count) in by_time[:limit]:
+        lines.append(f"{total:9.4f} {int(count):5d}  {name}")
+    return "\n".join(lines)
+
+
+def _print_report():
+    print(format_report(), file=sys.stderr)  # noqa: T201
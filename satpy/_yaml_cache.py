@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Cache of parsed YAML configuration files.
+
+Reader, composite, enhancement and writer configurations are YAML files that
+are parsed again by every new process. With the ``cache_yaml_configs``
+setting enabled (see :doc:`config`), the parsed content of every file is
+stored in ``<cache_dir>/yaml_configs`` as a pickle, which is much faster to
+load than the YAML itself, and kept in memory for the rest of the process.
+Entries are reused as long as the path, modification time and size of the
+YAML file and the YAML loader are unchanged.
+
+The configurations merged from several files, like the reader, composite and
+enhancement configurations found in ``config_path``, and the enhancement
+decision trees built from them are cached the same way. Their entries are
+identified by the ordered list of the signatures of their files, so adding,
+removing or changing one of the files found in ``config_path`` is taken into
+account immediately. Only the last :data:`MEMORY_CACHE_SIZE` entries used are
+kept in memory.
+
+The cached values are stored with :mod:`pickle`, so the cache directory must
+only be writable by trusted users.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle  # nosec B403
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+import yaml
+from yaml import UnsafeLoader
+
+import satpy
+from satpy import _startup_profile
+from satpy.utils import recursive_dict_update
+
+LOG = logging.getLogger(__name__)
+
+CACHE_CONFIG_KEY = "cache_yaml_configs"
+CACHE_SUBDIR = "yaml_configs"
+# increase when the layout of the stored entries changes
+CACHE_FORMAT_VERSION = 1
+# number of parsed files and merged configurations kept in memory
+MEMORY_CACHE_SIZE = 256
+
+# pickled content of the files and merged configurations last used by this process
+_MEMORY_CACHE: OrderedDict[str, bytes] = OrderedDict()
+
+
+def load_yaml_file(config_file, loader=UnsafeLoader) -> Any:
+    """Load a YAML configuration file, from the cache if it is enabled.
+
+    Every call returns a new object, so the result can be modified freely.
+
+    Args:
+        config_file: Path of the YAML file.
+        loader: YAML loader class to parse the file with.
+
+    """
+    start = time.perf_counter()
+    try:
+        return _load_yaml_file(config_file, loader)
+    finally:
+        _startup_profile.record_config_time(config_file, time.perf_counter() - start)
+
+
+def _load_yaml_file(config_file, loader):
+    cache_id = _get_cache_id(config_file, loader) if is_yaml_cache_enabled() else None
+    if cache_id is None:
+        return _parse_yaml_file(config_file, loader)
+    return get_cached(cache_id, lambda: _parse_yaml_file(config_file, loader))
+
+
+def load_merged_yaml_files(config_files, loader=UnsafeLoader, section=None) -> dict:
+    """Load YAML configuration files and merge them in order, from the cache if it is enabled.
+
+    Every call returns a new object, so the result can be modified freely.
+
+    Args:
+        config_files: Paths of the YAML files, later files updating the
+            content of the previous ones.
+        loader: YAML loader class to parse the files with.
+        section: Only merge this top level section of the files, if given.
+            Files without this section are skipped.
+
+    """
+    def _merge():
+        merged: dict = {}
+        for config_file in config_files:
+            content = load_yaml_file(config_file, loader=loader)
+            if section is not None:
+                content = (content or {}).get(section)
+                if not content:
+                    LOG.debug("Config '%s' has no '%s' section or it is empty", config_file, section)
+                    continue
+            recursive_dict_update(merged, content)
+        return merged
+
+    cache_id = get_files_cache_id(config_files, loader, "merged", section) if is_yaml_cache_enabled() else None
+    if cache_id is None:
+        return _merge()
+    return get_cached(cache_id, _merge)
+
+
+def is_yaml_cache_enabled():
+    return satpy.config.get(CACHE_CONFIG_KEY, False)
+
+
+def get_cached(cache_id: str, create: Callable[[], Any]) -> Any:
+    """Get a copy of the cached object for *cache_id*, creating and caching it if needed.
+
+    Args:
+        cache_id: Identifier of the cache entry.
+        create: Function creating the object if it isn't cached.
+
+    """
+    cached = _load_cached(cache_id)
+    if cached is not None:
+        return cached[0]
+
+    content = create()
+    try:
+        pickled = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as err:
+        LOG.debug("Could not cache YAML config entry %s: %s", cache_id, err)
+        return content
+    _remember(cache_id, pickled)
+    _write_cache_file(_get_cache_path(cache_id), pickled)
+    return content
+
+
+def get_files_cache_id(config_files, loader, *extra) -> str | None:
+    """Get the identifier of a cache entry built from YAML files, or None if it can't be cached.
+
+    Args:
+        config_files: Paths of the YAML files, in the order they are used.
+        loader: YAML loader class the files are parsed with.
+        extra: Other hashable values the cached entry depends on.
+
+    """
+    file_ids = []
+    for config_file in config_files:
+        file_id = _get_cache_id(config_file, loader)
+        if file_id is None:
+            return None
+        file_ids.append(file_id)
+    cache_id = (CACHE_FORMAT_VERSION, satpy.__version__, file_ids, extra)
+    return hashlib.sha1(repr(cache_id).encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _parse_yaml_file(config_file, loader):
+    with open(config_file, "r", encoding="utf-8") as fd:
+        return yaml.load(fd, Loader=loader)  # nosec B506
+
+
+def _get_cache_id(config_file, loader):
+    try:
+        path = os.path.abspath(os.fspath(config_file))
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    loader_name = f"{loader.__module__}.{loader.__qualname__}"
+    cache_id = (CACHE_FORMAT_VERSION, satpy.__version__, loader_name, path, stat.st_mtime_ns, stat.st_size)
+    return hashlib.sha1(repr(cache_id).encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _get_cache_path(cache_id):
+    return os.path.join(get_cache_dir(), cache_id[:2], cache_id + ".pkl")
+
+
+def _load_cached(cache_id):
+    """Get the cached content wrapped in a tuple, or None if it isn't cached."""
+    pickled = _MEMORY_CACHE.get(cache_id)
+    if pickled is None:
+        cache_path = _get_cache_path(cache_id)
+        try:
+            with open(cache_path, "rb") as cache_file:
+                pickled = cache_file.read()
+        except OSError:
+            return None
+    try:
+        content = pickle.loads(pickled)  # nosec B301
+    except Exception as err:
+        LOG.debug("Ignoring unreadable YAML config cache entry %s: %s", cache_id, err)
+        return None
+    _remember(cache_id, pickled)
+    return (content,)
+
+
+def _remember(cache_id, pickled):
+    _MEMORY_CACHE[cache_id] = pickled
+    _MEMORY_CACHE.move_to_end(cache_id)
+    while len(_MEMORY_CACHE) > MEMORY_CACHE_SIZE:
+        _MEMORY_CACHE.popitem(last=False)
+
+
+def _write_cache_file(cache_path, pickled):
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first so concurrent readers never see partial files
+        with tempfile.NamedTemporaryFile("wb", dir=cache_dir, suffix=".tmp", delete=False) as tmp_file:
+            tmp_file.write(pickled)
+        os.replace(tmp_file.name, cache_path)
+    except OSError as err:
+        LOG.debug("Could not cache YAML config to %s: %s", cache_path, err)
+        try:
+            os.remove(tmp_file.name)
+        except (OSError, NameError):
+            pass
+
+
+def get_cache_dir() -> str:
+    """Get the directory where parsed YAML configuration files are cached."""
+    return os.path.join(satpy.config.get("cache_dir"), CACHE_SUBDIR)
+
+
+def clear_cache():
+    """Remove all cached YAML configuration files, on disk and in memory."""
+    _MEMORY_CACHE.clear()
+    shutil.rmtree(get_cache_dir(), ignore_errors=True)
@@ -24,14 +24,13 @@ import warnings
 from functools import lru_cache, update_wrapper
 from typing import Callable, Iterable
 
-import yaml
 from yaml import UnsafeLoader
 
 import satpy
 from satpy import DataID, DataQuery
 from satpy._config import config_search_paths, get_entry_points_config_dirs, glob_config
+from satpy._yaml_cache import load_merged_yaml_files
 from satpy.dataset.dataid import minimal_default_keys_config
-from satpy.utils import recursive_dict_update
 
 logger = logging.getLogger(__name__)
 
@@ -177,10 +176,7 @@ def _load_config(composite_configs):
     if not isinstance(composite_configs, (list, tuple)):
         composite_configs = [composite_configs]
 
-    conf = {}
-    for composite_config in composite_configs:
-        with open(composite_config, "r", encoding="utf-8") as conf_file:
-            recursive_dict_update(conf, yaml.load(conf_file, Loader=UnsafeLoader))
+    conf = load_merged_yaml_files(composite_configs, loader=UnsafeLoader)
     try:
         sensor_name = conf["sensor_name"]
     except KeyError:
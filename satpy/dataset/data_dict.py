@@ -17,9 +17,13 @@
 # satpy.  If not, see <http://www.gnu.org/licenses/>.
 """Classes and functions related to a dictionary with DataID keys."""
 
+from bisect import bisect_right
+from collections import defaultdict
+from numbers import Number
+
 import numpy as np
 
-from .dataid import DataID, create_filtered_query, minimal_default_keys_config
+from .dataid import DataID, WavelengthRange, create_filtered_query, minimal_default_keys_config
 
 
 class TooManyResults(KeyError):
@@ -66,8 +70,11 @@ def get_key(key, key_container, num_results=1, best=True, query=None,  # noqa: D
                          searching. Any parameter that is `None`
                          is considered a wild card and any match is
                          accepted.
-        key_container (dict or set): Container of DataID objects that
-                                     uses hashing to quickly access items.
+        key_container (dict, set or DataIDIndex): Container of DataID
+                                     objects that uses hashing to quickly
+                                     access items. A `DataIDIndex` avoids
+                                     checking every DataID against the
+                                     query.
         num_results (int): Number of results to return. Use `0` for all
                            matching results. If `1` then the single matching
                            key is returned instead of a list of length 1.
@@ -102,7 +109,10 @@ def get_key(key, key_container, num_results=1, best=True, query=None,  # noqa: D
     """
     key = create_filtered_query(key, query)
 
-    res = key.filter_dataids(key_container)
+    if isinstance(key_container, DataIDIndex):
+        res = key_container.filter_dataids(key)
+    else:
+        res = key.filter_dataids(key_container)
     if not res:
         raise KeyError("No dataset matching '{}' found".format(str(key)))
 
@@ -121,7 +131,203 @@ def get_key(key, key_container, num_results=1, best=True, query=None,  # noqa: D
     return res[:num_results]
 
 
-class DatasetDict(dict):
+class DataIDIndex:
+    """Secondary index of DataIDs by name, wavelength, resolution and calibration.
+
+    Filtering a large number of DataIDs with a `DataQuery` means checking
+    every single one of them against the query. This index finds the DataIDs
+    that may match the query with hash lookups of the ``name``,
+    ``resolution`` and ``calibration`` values and with an interval lookup of
+    the wavelength ranges, and only checks those against the query. The
+    results are the same as `DataQuery.filter_dataids` on all DataIDs, in
+    the same (sorted) order.
+
+    """
+
+    hashed_keys = ("name", "resolution", "calibration")
+
+    def __init__(self, dataids=()):
+        """Index the provided DataIDs."""
+        self._ids = set()
+        self._by_value = {key: defaultdict(set) for key in self.hashed_keys}
+        self._without_value = {key: set() for key in self.hashed_keys}
+        self._wavelength_mins = []
+        self._wavelength_ids = []
+        self._without_wavelength = set()
+        # keys that aren't DataIDs are always checked against the query
+        self._others = set()
+        for dataid in dataids:
+            self.add(dataid)
+
+    def __len__(self):
+        """Get the number of indexed DataIDs."""
+        return len(self._ids) + len(self._others)
+
+    def __iter__(self):
+        """Iterate over the indexed DataIDs in sorted order."""
+        return iter(sorted(self._ids | self._others))
+
+    def __contains__(self, dataid):
+        """Check if the exact DataID is indexed."""
+        return dataid in self._ids or dataid in self._others
+
+    def add(self, dataid):
+        """Add a DataID to the index."""
+        if dataid in self:
+            return
+        if not isinstance(dataid, DataID):
+            self._others.add(dataid)
+            return
+        self._ids.add(dataid)
+        for key in self.hashed_keys:
+            if key in dataid:
+                self._by_value[key][dataid[key]].add(dataid)
+            else:
+                self._without_value[key].add(dataid)
+        wavelength = dataid.get("wavelength")
+        if isinstance(wavelength, WavelengthRange):
+            idx = bisect_right(self._wavelength_mins, wavelength.min)
+            self._wavelength_mins.insert(idx, wavelength.min)
+            self._wavelength_ids.insert(idx, dataid)
+        else:
+            self._without_wavelength.add(dataid)
+
+    def discard(self, dataid):
+        """Remove a DataID from the index if it is present."""
+        if dataid in self._others:
+            self._others.discard(dataid)
+            return
+        if dataid not in self._ids:
+            return
+        self._ids.discard(dataid)
+        for key in self.hashed_keys:
+            if key in dataid:
+                self._by_value[key][dataid[key]].discard(dataid)
+            else:
+                self._without_value[key].discard(dataid)
+        if dataid in self._without_wavelength:
+            self._without_wavelength.discard(dataid)
+        else:
+            idx = self._wavelength_ids.index(dataid)
+            del self._wavelength_mins[idx]
+            del self._wavelength_ids[idx]
+
+    def clear(self):
+        """Remove all DataIDs from the index."""
+        self.__init__()
+
+    def filter_dataids(self, query):
+        """Get the DataIDs matching the `DataQuery`, like `DataQuery.filter_dataids`."""
+        candidates = self._get_candidates(query)
+        return query.filter_dataids(sorted(candidates | self._others))
+
+    def _get_candidates(self, query):
+        """Get a superset of the indexed DataIDs matching the query.
+
+        A DataID matches a query value if it has the same value or if it
+        doesn't have a value for that key at all (unchecked keys).
+        """
+        candidates = self._ids
+        for key in self.hashed_keys:
+            val = query.get(key, "*")
+            if val == "*" or val is None:
+                continue
+            vals = val if isinstance(val, list) else [val]
+            try:
+                key_candidates = set(self._without_value[key])
+                for single_val in vals:
+                    key_candidates.update(self._by_value[key].get(single_val, ()))
+            except TypeError:
+                # unhashable query value, let the query sort it out
+                continue
+            candidates = candidates & key_candidates
+        wavelength = query.get("wavelength", "*")
+        if isinstance(wavelength, Number) and not isinstance(wavelength, bool):
+            candidates = candidates & self._get_wavelength_candidates(wavelength)
+        return candidates
+
+    def _get_wavelength_candidates(self, wavelength):
+        stop = bisect_right(self._wavelength_mins, wavelength)
+        in_range = {dataid for dataid in self._wavelength_ids[:stop]
+                    if dataid["wavelength"].max >= wavelength}
+        return in_range | self._without_wavelength
+
+
+class _IndexedDataIDDict(dict):
+    """Dictionary keeping a `DataIDIndex` of its keys up to date."""
+
+    @property
+    def _dataid_index(self):
+        # created lazily as unpickling and copying don't call __init__
+        try:
+            return self.__dict__["_index"]
+        except KeyError:
+            index = self.__dict__["_index"] = DataIDIndex(super().keys())
+            return index
+
+    def __getstate__(self):
+        """Leave the index out of the pickled state."""
+        state = self.__dict__.copy()
+        state.pop("_index", None)
+        return state
+
+    # the index is fetched before changing the dictionary so that a lazily
+    # created index doesn't already contain the changed key
+
+    def __setitem__(self, key, value):
+        """Set the item and index its key."""
+        index = self._dataid_index
+        super().__setitem__(key, value)
+        index.add(key)
+
+    def __delitem__(self, key):
+        """Delete the item and remove its key from the index."""
+        index = self._dataid_index
+        super().__delitem__(key)
+        index.discard(key)
+
+    def pop(self, key, *args):
+        """Remove the item and return its value."""
+        index = self._dataid_index
+        res = super().pop(key, *args)
+        index.discard(key)
+        return res
+
+    def popitem(self):
+        """Remove and return the last item."""
+        index = self._dataid_index
+        key, value = super().popitem()
+        index.discard(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        """Get the value of key, setting it to default first if needed."""
+        index = self._dataid_index
+        res = super().setdefault(key, default)
+        index.add(key)
+        return res
+
+    def update(self, *args, **kwargs):
+        """Update the dictionary and index the new keys."""
+        index = self._dataid_index
+        new_items = dict(*args, **kwargs)
+        super().update(new_items)
+        for key in new_items:
+            index.add(key)
+
+    def __ior__(self, other):
+        """Update the dictionary with the ``|=`` operator."""
+        self.update(other)
+        return self
+
+    def clear(self):
+        """Remove all items."""
+        index = self._dataid_index
+        super().clear()
+        index.clear()
+
+
+class DatasetDict(_IndexedDataIDDict):
     """Special dictionary object that can handle dict operations based on dataset name, wavelength, or DataID.
 
     Note: Internal dictionary keys are `DataID` objects.
@@ -155,7 +361,7 @@ class DatasetDict(dict):
             **dfilter (dict): See `get_key` function for more information.
 
         """
-        return get_key(match_key, self.keys(), num_results=num_results,
+        return get_key(match_key, self._dataid_index, num_results=num_results,
                        best=best, **dfilter)
 
     def getitem(self, item):
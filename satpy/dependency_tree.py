@@ -25,7 +25,7 @@ import numpy as np
 
 from satpy import DataID, DatasetDict
 from satpy.dataset import ModifierTuple, create_filtered_query
-from satpy.dataset.data_dict import TooManyResults, get_key
+from satpy.dataset.data_dict import TooManyResults, _IndexedDataIDDict, get_key
 from satpy.node import EMPTY_LEAF_NAME, CompositorNode, MissingDependencies, Node, ReaderNode
 from satpy.utils import get_logger
 
@@ -585,7 +585,7 @@ class DependencyTree(Tree):
         return prereq_nodes, unknown_datasets
 
 
-class _DataIDContainer(dict):
+class _DataIDContainer(_IndexedDataIDDict):
     """Special dictionary object that can handle dict operations based on dataset name, wavelength, or DataID.
 
     Note: Internal dictionary keys are `DataID` objects.
@@ -607,7 +607,7 @@ class _DataIDContainer(dict):
                                 wavelength.
 
         """
-        return get_key(match_key, self.keys())
+        return get_key(match_key, self._dataid_index)
 
     def __getitem__(self, item):
         """Get item from container."""
@@ -23,6 +23,7 @@ import yaml
 from yaml import UnsafeLoader
 
 from satpy._config import config_search_paths, get_entry_points_config_dirs
+from satpy._yaml_cache import get_cached, get_files_cache_id, is_yaml_cache_enabled, load_yaml_file
 from satpy.decision_tree import DecisionTree
 from satpy.utils import get_logger, recursive_dict_update
 
@@ -44,16 +45,33 @@ class EnhancementDecisionTree(DecisionTree):
                                  ))
         self.prefix = kwargs.pop("config_section", "enhancements")
         multival_keys = kwargs.pop("multival_keys", ["sensor"])
+        # identifies the files the tree was built from, None if it can't be cached
+        self._cache_id: str | None = repr((match_keys, multival_keys, self.prefix))
         super(EnhancementDecisionTree, self).__init__(
             decision_dicts, match_keys, multival_keys)
 
     def add_config_to_tree(self, *decision_dict: str | Path | dict) -> None:
-        """Add configuration to tree."""
+        """Add configuration to tree.
+
+        With the ``cache_yaml_configs`` setting enabled, trees built only from
+        configuration files are cached like the files themselves.
+        """
+        if self._cache_id is not None and is_yaml_cache_enabled():
+            self._cache_id = get_files_cache_id(decision_dict, UnsafeLoader, "enhancement_tree", self._cache_id)
+        else:
+            self._cache_id = None
+        if self._cache_id is None:
+            self._add_config_to_tree(decision_dict)
+            return
+        self._tree = get_cached(self._cache_id, lambda: self._add_config_to_tree(decision_dict))
+
+    def _add_config_to_tree(self, decision_dicts):
         conf: dict = {}
-        for config_file in decision_dict:
+        for config_file in decision_dicts:
             config_dict = self._get_config_dict_from_user(config_file)
             recursive_dict_update(conf, config_dict)
         self._build_tree(conf)
+        return self._tree
 
     def _get_config_dict_from_user(self, config_file: str | Path | dict) -> dict:
         if isinstance(config_file, (str, Path)) and os.path.isfile(config_file):
@@ -71,16 +89,15 @@ class EnhancementDecisionTree(DecisionTree):
         return config_dict
 
     def _get_yaml_enhancement_dict(self, config_file: str | Path) -> dict:
-        with open(config_file) as fd:
-            enhancement_config = yaml.load(fd, Loader=UnsafeLoader)
-            if enhancement_config is None:
-                # empty file
-                return {}
-            enhancement_section = enhancement_config.get(self.prefix, {})
-            if not enhancement_section:
-                LOG.debug("Config '{}' has no '{}' section or it is empty".format(config_file, self.prefix))
-                return {}
-            LOG.debug(f"Adding enhancement configuration from file: {config_file}")
+        enhancement_config = load_yaml_file(config_file, loader=UnsafeLoader)
+        if enhancement_config is None:
+            # empty file
+            return {}
+        enhancement_section = enhancement_config.get(self.prefix, {})
+        if not enhancement_section:
+            LOG.debug("Config '{}' has no '{}' section or it is empty".format(config_file, self.prefix))
+            return {}
+        LOG.debug(f"Adding enhancement configuration from file: {config_file}")
         return enhancement_section
 
     def find_match(self, **query_dict):
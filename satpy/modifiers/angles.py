@@ -20,9 +20,17 @@ from __future__ import annotations
 
 import datetime as dt
 import hashlib
+import logging
 import os
+import re
 import shutil
+import tempfile
+import threading
+import time
 import warnings
+import weakref
+from collections import OrderedDict, namedtuple
+from contextlib import suppress
 from functools import update_wrapper
 from glob import glob
 from typing import Any, Callable, Optional, Union
@@ -39,6 +47,8 @@ from pyresample.geometry import AreaDefinition, StackedAreaDefinition, SwathDefi
 import satpy
 from satpy.utils import PerformanceWarning, get_satpos, ignore_invalid_float_warnings
 
+LOG = logging.getLogger(__name__)
+
 PRGeometry = Union[SwathDefinition, AreaDefinition, StackedAreaDefinition]
 
 # Arbitrary time used when computing sensor angles that is passed to
@@ -48,6 +58,16 @@ PRGeometry = Union[SwathDefinition, AreaDefinition, StackedAreaDefinition]
 STATIC_EARTH_INERTIAL_DATETIME = dt.datetime(2000, 1, 1, 12, 0, 0)
 DEFAULT_UNCACHE_TYPES = (SwathDefinition, xr.DataArray, da.Array)
 HASHABLE_GEOMETRIES = (AreaDefinition, StackedAreaDefinition)
+# <function name>_v<cache version>_<result index>_<argument hash>.zarr
+_ZARR_CACHE_RE = re.compile(r"^(?P<func>.+)_v(?P<version>[^_]+)_(?P<idx>\d+)_(?P<hash>[0-9a-f]+)\.zarr$")
+
+ZarrCacheInfo = namedtuple("ZarrCacheInfo", ["hits", "misses", "evictions", "bytes_written", "currsize"])
+GeometryMemoInfo = namedtuple("GeometryMemoInfo", ["hits", "misses", "maxsize", "currsize"])
+_GEOMETRY_MEMOS: list[GeometryMemoHelper] = []
+# number of opened zarr arrays still referenced by dask arrays of this process,
+# by first result path of the zarr cache entries
+_ZARR_ENTRIES_IN_USE: dict[str, int] = {}
+_ZARR_ENTRIES_LOCK = threading.Lock()
 
 
 class ZarrCacheHelper:
@@ -56,8 +76,11 @@ class ZarrCacheHelper:
     It is recommended to use this class through the :func:`cache_to_zarr_if`
     decorator rather than using it directly.
 
-    Currently the cache does not perform any limiting or removal of cache
-    content. That is left up to the user to manage. Caching is based on
+    By default the cache does not perform any limiting or removal of cache
+    content. Setting ``zarr_cache_max_size`` (in bytes) and/or
+    ``zarr_cache_max_age`` (in seconds) in ``satpy.config`` makes the
+    least recently used cache entries in ``cache_dir`` be removed whenever
+    new content is cached. Caching is based on
     arguments passed to the decorated function but will only be performed
     if the arguments are of a certain type (see ``uncacheable_arg_types``).
     The cache value to use is purely based on the hash value of all of the
@@ -70,6 +93,11 @@ class ZarrCacheHelper:
     arguments, and then rechunk the results before returning them to the user.
     This rechunking is only done if caching is enabled.
 
+    Cache entries are first written to a temporary directory and then moved
+    in place, so that multiple processes can safely share the same
+    ``cache_dir``. Statistics about the use of the cache are available with
+    :meth:`cache_info`.
+
     Args:
         func: Function that will be called to generate the value to cache.
         cache_config_key: Name of the boolean ``satpy.config`` parameter to
@@ -120,6 +148,24 @@ class ZarrCacheHelper:
         self._uncacheable_arg_types = uncacheable_arg_types
         self._sanitize_args_func = sanitize_args_func
         self._cache_version = cache_version
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bytes_written = 0
+
+    def cache_info(self, cache_dir: Optional[str] = None) -> ZarrCacheInfo:
+        """Get statistics about the use of the cache by this function in this process.
+
+        Intended to mimic the :func:`functools.lru_cache` ``cache_info`` behavior.
+        The returned named tuple holds the number of cache ``hits``, ``misses``
+        and ``evictions`` (of entries of any cached function), the number of
+        ``bytes_written`` to the cache and the current size in bytes on disk of
+        the cache entries of this function (``currsize``).
+        """
+        cache_dir = self._get_cache_dir_from_config(cache_dir)
+        currsize = sum(size for (func_name, version, _), (_, size, _) in _get_zarr_cache_entries(cache_dir).items()
+                       if func_name == self._func.__name__ and version == str(self._cache_version))
+        return ZarrCacheInfo(self._hits, self._misses, self._evictions, self._bytes_written, currsize)
 
     def cache_clear(self, cache_dir: Optional[str] = None):
         """Remove all on-disk files associated with this function.
@@ -152,13 +198,24 @@ class ZarrCacheHelper:
         sanitized_args = self._sanitize_args_func(*args) if self._sanitize_args_func is not None else args
 
         zarr_file_pattern = self._get_zarr_file_pattern(sanitized_args, cache_dir)
-        zarr_paths = glob(zarr_file_pattern.format("*"))
+        # the first result is moved in place last, so if it exists all results exist
+        first_zarr_path = zarr_file_pattern.format(0)
 
-        if not zarr_paths:
+        if not os.path.isdir(first_zarr_path):
+            self._misses += 1
+            LOG.debug("Cache miss for %s", first_zarr_path)
             # use sanitized arguments
             self._warn_if_irregular_input_chunks(args, sanitized_args)
             res_to_cache = self._func(*(sanitized_args))
             self._cache_results(res_to_cache, zarr_file_pattern)
+            self._evictions += _evict_zarr_caches(os.path.dirname(zarr_file_pattern),
+                                                  keep=os.path.basename(first_zarr_path))
+        else:
+            self._hits += 1
+            LOG.debug("Cache hit for %s", first_zarr_path)
+            # the modification time is used to find the least recently used entries
+            with suppress(OSError):
+                os.utime(first_zarr_path)
 
         # if we did any caching, let's load from the zarr files, so that future calls have the same name
         # re-calculate the cached paths
@@ -167,8 +224,8 @@ class ZarrCacheHelper:
             raise RuntimeError("Data was cached to disk but no files were found")
 
         new_chunks = _get_output_chunks_from_func_arguments(args)
-        res = tuple(da.from_zarr(zarr_path, chunks=new_chunks) for zarr_path in zarr_paths)
-        return res
+        entry_path = os.path.abspath(first_zarr_path)
+        return tuple(_open_zarr_entry_result(zarr_path, entry_path, new_chunks) for zarr_path in zarr_paths)
 
     def _get_zarr_file_pattern(self, sanitized_args, cache_dir):
         arg_hash = _hash_args(*sanitized_args, unhashable_types=self._uncacheable_arg_types)
@@ -198,7 +255,26 @@ class ZarrCacheHelper:
             )
 
     def _cache_results(self, res, zarr_file_pattern):
-        os.makedirs(os.path.dirname(zarr_file_pattern), exist_ok=True)
+        cache_dir = os.path.dirname(zarr_file_pattern)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=cache_dir)
+        try:
+            tmp_file_pattern = os.path.join(tmp_dir, os.path.basename(zarr_file_pattern))
+            self._write_results(res, tmp_file_pattern)
+            # move the first result last so readers only see complete entries
+            for idx in reversed(range(len(res))):
+                tmp_zarr_path = tmp_file_pattern.format(idx)
+                self._bytes_written += _get_dir_size(tmp_zarr_path)
+                try:
+                    os.rename(tmp_zarr_path, zarr_file_pattern.format(idx))
+                except OSError:
+                    # another process cached the same result in the meantime
+                    LOG.debug("Cache entry %s already exists", zarr_file_pattern.format(idx))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _write_results(res, zarr_file_pattern):
         new_res = []
         for idx, sub_res in enumerate(res):
             if not isinstance(sub_res, da.Array):
@@ -213,6 +289,117 @@ class ZarrCacheHelper:
         da.compute(new_res)
 
 
+def _open_zarr_entry_result(zarr_path, entry_path, chunks):
+    """Open a result of a zarr cache entry as a dask array.
+
+    The lazy array reads the entry when computed, so the entry is marked in
+    use until the opened zarr array, referenced by the graphs of the dask
+    arrays built from the result, is garbage collected.
+
+    """
+    import zarr
+
+    zarr_arr = zarr.open_array(zarr_path, mode="r")
+    with _ZARR_ENTRIES_LOCK:
+        _ZARR_ENTRIES_IN_USE[entry_path] = _ZARR_ENTRIES_IN_USE.get(entry_path, 0) + 1
+    weakref.finalize(zarr_arr, _release_zarr_entry, entry_path)
+    return da.from_zarr(zarr_arr, chunks=chunks)
+
+
+def _release_zarr_entry(entry_path):
+    with _ZARR_ENTRIES_LOCK:
+        users = _ZARR_ENTRIES_IN_USE.pop(entry_path, 0) - 1
+        if users > 0:
+            _ZARR_ENTRIES_IN_USE[entry_path] = users
+
+
+def _get_dir_size(path):
+    return sum(os.path.getsize(os.path.join(root, fname))
+               for root, _, fnames in os.walk(path) for fname in fnames)
+
+
+def _get_zarr_cache_entries(cache_dir):
+    """Get the zarr cache entries in *cache_dir*.
+
+    Returns:
+        Dictionary mapping ``(function name, cache version, argument hash)``
+        to the last access time, the size in bytes and the paths of the
+        entry, the path of the first result first.
+
+    """
+    entries = {}
+    try:
+        dir_entries = list(os.scandir(cache_dir))
+    except FileNotFoundError:
+        return entries
+    for dir_entry in dir_entries:
+        match = _ZARR_CACHE_RE.match(dir_entry.name)
+        if match is None or not dir_entry.is_dir():
+            continue
+        key = (match["func"], match["version"], match["hash"])
+        try:
+            mtime = dir_entry.stat().st_mtime
+            size = _get_dir_size(dir_entry.path)
+        except FileNotFoundError:
+            continue
+        last_mtime, total_size, paths = entries.get(key, (0, 0, []))
+        paths.append((int(match["idx"]), dir_entry.path))
+        entries[key] = (max(last_mtime, mtime), total_size + size, paths)
+    return {key: (mtime, size, [path for _, path in sorted(paths)])
+            for key, (mtime, size, paths) in entries.items()}
+
+
+def _evict_zarr_caches(cache_dir: str, keep: Optional[str] = None) -> int:
+    """Remove the least recently used zarr cache entries exceeding the configured limits.
+
+    Lazy arrays returned for an entry read it only when computed, and reading
+    a removed entry silently gives the fill value of the array. Entries
+    still referenced by dask arrays of this process are therefore never
+    removed, and entries used less than ``zarr_cache_min_age`` seconds ago
+    are kept too, as they may be in use by another process. The cache may thus temporarily exceed
+    ``zarr_cache_max_size``.
+
+    Args:
+        cache_dir: Directory to remove cache entries from.
+        keep: Name of the first result of an entry that should never be
+            removed, usually the entry that was just written.
+
+    Returns:
+        Number of removed entries.
+
+    """
+    max_size = satpy.config.get("zarr_cache_max_size", None)
+    max_age = satpy.config.get("zarr_cache_max_age", None)
+    if max_size is None and max_age is None:
+        return 0
+    entries = sorted(_get_zarr_cache_entries(cache_dir).values(), key=lambda entry: entry[0])
+    total_size = sum(size for _, size, _ in entries)
+    now = time.time()
+    oldest_allowed = now - max_age if max_age is not None else None
+    newest_removable = now - satpy.config.get("zarr_cache_min_age", 600)
+    num_evicted = 0
+    for mtime, size, paths in entries:
+        too_old = oldest_allowed is not None and mtime < oldest_allowed
+        too_large = max_size is not None and total_size > max_size
+        if not (too_old or too_large):
+            break
+        if not _is_removable(paths[0], mtime, newest_removable, keep):
+            continue
+        LOG.debug("Removing cache entry %s", paths[0])
+        # remove the first result first so the entry is not used anymore
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+        total_size -= size
+        num_evicted += 1
+    return num_evicted
+
+
+def _is_removable(first_path, mtime, newest_removable, keep):
+    if keep is not None and os.path.basename(first_path) == keep:
+        return False
+    return mtime <= newest_removable and os.path.abspath(first_path) not in _ZARR_ENTRIES_IN_USE
+
+
 def _get_output_chunks_from_func_arguments(args):
     """Determine what the desired output chunks are.
 
@@ -240,7 +427,8 @@ def cache_to_zarr_if(
     key is ``True`` as well as some other conditions. See
     :class:`ZarrCacheHelper` for more information. Most importantly, this
     decorator does not limit how many items can be cached and does not clear
-    out old entries. It is up to the user to manage the size of the cache.
+    out old entries unless ``zarr_cache_max_size`` or ``zarr_cache_max_age``
+    are configured.
 
     """
 
@@ -249,12 +437,128 @@ def cache_to_zarr_if(
                                       cache_config_key,
                                       uncacheable_arg_types,
                                       sanitize_args_func)
-        wrapper = update_wrapper(zarr_cacher, func)
+        # don't copy the state of a wrapped helper (e.g. from memoize_geometry)
+        wrapper = update_wrapper(zarr_cacher, func, updated=())
         return wrapper
 
     return _decorator
 
 
+class GeometryMemoHelper:
+    """Helper for memoizing the dask arrays returned by geometry functions in memory.
+
+    It is recommended to use this class through the :func:`memoize_geometry`
+    decorator rather than using it directly.
+
+    Lon/lat and angle arrays are only described by a dask graph until they
+    are computed. Returning the very same dask arrays for the same arguments
+    means that all modifiers of a Scene asking for the same geometry (for
+    example ``sunz_corrected`` and ``rayleigh_corrected``) share the same
+    graph keys, so dask computes this geometry only once when the Scene is
+    saved or computed.
+
+    The memo is shared by the whole process and bound to the last
+    ``geometry_memo_max_entries`` (see ``satpy.config``) results of each
+    decorated function, the least recently used results being dropped first.
+    Setting this to ``0`` disables the memoization. Datetime arguments are
+    truncated to ``geometry_memo_time_bucket`` seconds when building the key,
+    so that observations a few seconds apart can share their sun angles. By
+    default (``0``) the exact time is used. Arguments that can't be hashed,
+    like swath definitions, disable the memoization for that call.
+
+    """
+
+    def __init__(self, func: Callable, sanitize_args_func: Optional[Callable] = None):
+        """Hold on to provided arguments for future use."""
+        self._func = func
+        self._sanitize_args_func = sanitize_args_func
+        self._memo: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        _GEOMETRY_MEMOS.append(self)
+
+    def cache_info(self) -> GeometryMemoInfo:
+        """Get statistics about the memo of this function.
+
+        Intended to mimic the :func:`functools.lru_cache` ``cache_info`` behavior.
+        """
+        maxsize = satpy.config.get("geometry_memo_max_entries", 32)
+        return GeometryMemoInfo(self._hits, self._misses, maxsize, len(self._memo))
+
+    def cache_clear(self):
+        """Forget all memoized results and statistics of this function.
+
+        Intended to mimic the :func:`functools.lru_cache` behavior.
+        """
+        with self._lock:
+            self._memo.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __call__(self, *args) -> Any:
+        """Call the decorated function or get its memoized result."""
+        maxsize = satpy.config.get("geometry_memo_max_entries", 32)
+        if not maxsize:
+            return self._func(*args)
+        try:
+            key = self._get_key(args)
+        except TypeError:
+            return self._func(*args)
+
+        with self._lock:
+            if key in self._memo:
+                self._hits += 1
+                self._memo.move_to_end(key)
+                return self._memo[key]
+
+        res = self._func(*args)
+        with self._lock:
+            self._misses += 1
+            self._memo[key] = res
+            while len(self._memo) > maxsize:
+                self._memo.popitem(last=False)
+        return res
+
+    def _get_key(self, args) -> str:
+        sanitized_args = self._sanitize_args_func(*args) if self._sanitize_args_func is not None else args
+        bucket = satpy.config.get("geometry_memo_time_bucket", 0)
+        key_args = []
+        for arg in sanitized_args:
+            if isinstance(arg, dt.datetime) and bucket:
+                epoch = dt.datetime(1970, 1, 1, tzinfo=arg.tzinfo)
+                arg = int((arg - epoch).total_seconds() // bucket)
+            elif isinstance(arg, np.floating):
+                arg = float(arg)
+            elif isinstance(arg, np.dtype):
+                arg = arg.name
+            key_args.append(arg)
+        return _hash_args(*key_args)
+
+
+def memoize_geometry(sanitize_args_func: Optional[Callable] = None) -> Callable:
+    """Decorate a function and memoize the returned dask arrays in memory.
+
+    See :class:`GeometryMemoHelper` for more information. When combined with
+    :func:`cache_to_zarr_if`, this decorator should be the inner one so that
+    the on-disk cache keeps being checked first.
+
+    """
+
+    def _decorator(func: Callable) -> Callable:
+        memo = GeometryMemoHelper(func, sanitize_args_func)
+        wrapper = update_wrapper(memo, func, updated=())
+        return wrapper
+
+    return _decorator
+
+
+def clear_geometry_memos():
+    """Forget the memoized results of all geometry functions."""
+    for memo in _GEOMETRY_MEMOS:
+        memo.cache_clear()
+
+
 def _hash_args(*args, unhashable_types=DEFAULT_UNCACHE_TYPES):
     import json
     hashable_args = []
@@ -423,15 +727,13 @@ def get_cos_sza(data_arr: xr.DataArray) -> xr.DataArray:
 
     """
     chunks = _geo_chunks_from_data_arr(data_arr)
-    lons, lats = _get_valid_lonlats(data_arr.attrs["area"], chunks)
-    if lons.dtype != data_arr.dtype and np.issubdtype(data_arr.dtype, np.floating):
-        lons = lons.astype(data_arr.dtype)
-        lats = lats.astype(data_arr.dtype)
-    cos_sza = _get_cos_sza(data_arr.attrs["start_time"], lons, lats)
+    dtype = data_arr.dtype if np.issubdtype(data_arr.dtype, np.floating) else None
+    cos_sza = _get_cos_sza_from_area(data_arr.attrs["start_time"], data_arr.attrs["area"], chunks, dtype)
     return _geo_dask_to_data_array(cos_sza)
 
 
 @cache_to_zarr_if("cache_lonlats", sanitize_args_func=_sanitize_args_with_chunks)
+@memoize_geometry()
 def _get_valid_lonlats(area: PRGeometry, chunks: Union[int, str, tuple] = "auto") -> tuple[da.Array, da.Array]:
     with ignore_invalid_float_warnings():
         # NOTE: This defaults to 64-bit floats due to needed precision for X/Y coordinates
@@ -443,18 +745,32 @@ def _get_valid_lonlats(area: PRGeometry, chunks: Union[int, str, tuple] = "auto"
 
 def _get_sun_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
     chunks = _geo_chunks_from_data_arr(data_arr)
-    lons, lats = _get_valid_lonlats(data_arr.attrs["area"], chunks)
-    suna = da.map_blocks(_get_sun_azimuth_ndarray, lons, lats,
-                         data_arr.attrs["start_time"],
-                         dtype=lons.dtype, meta=np.array((), dtype=lons.dtype),
-                         chunks=lons.chunks)
-    cos_sza = _get_cos_sza(data_arr.attrs["start_time"], lons, lats)
+    suna = _get_sun_azimuth_from_area(data_arr.attrs["start_time"], data_arr.attrs["area"], chunks)
+    cos_sza = _get_cos_sza_from_area(data_arr.attrs["start_time"], data_arr.attrs["area"], chunks, None)
     sunz = np.rad2deg(np.arccos(cos_sza))
     suna = _geo_dask_to_data_array(suna)
     sunz = _geo_dask_to_data_array(sunz)
     return suna, sunz
 
 
+@memoize_geometry()
+def _get_sun_azimuth_from_area(start_time: dt.datetime, area: PRGeometry, chunks: tuple) -> da.Array:
+    lons, lats = _get_valid_lonlats(area, chunks)
+    return da.map_blocks(_get_sun_azimuth_ndarray, lons, lats, start_time,
+                         dtype=lons.dtype, meta=np.array((), dtype=lons.dtype),
+                         chunks=lons.chunks)
+
+
+@memoize_geometry()
+def _get_cos_sza_from_area(start_time: dt.datetime, area: PRGeometry, chunks: tuple,
+                           dtype: Optional[np.dtype]) -> da.Array:
+    lons, lats = _get_valid_lonlats(area, chunks)
+    if dtype is not None and lons.dtype != dtype:
+        lons = lons.astype(dtype)
+        lats = lats.astype(dtype)
+    return _get_cos_sza(start_time, lons, lats)
+
+
 def _get_cos_sza(utc_time, lons, lats):
     cos_sza = da.map_blocks(_cos_zen_ndarray,
                             lons, lats, utc_time,
@@ -511,6 +827,7 @@ def _dim_index_with_default(dims: tuple, dim_name: str, default: int) -> int:
 
 
 @cache_to_zarr_if("cache_sensor_angles", sanitize_args_func=_sanitize_observer_look_args)
+@memoize_geometry()
 def _get_sensor_angles_from_sat_pos(sat_lon, sat_lat, sat_alt, start_time, area_def, chunks):
     lons, lats = _get_valid_lonlats(area_def, chunks)
     res = da.map_blocks(_get_sensor_angles_ndarray, lons, lats, start_time, sat_lon, sat_lat, sat_alt,
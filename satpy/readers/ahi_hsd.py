@@ -71,6 +71,7 @@ import xarray as xr
 from satpy._compat import cached_property
 from satpy.readers.core._geos_area import get_area_definition, get_area_extent
 from satpy.readers.core.file_handlers import BaseFileHandler
+from satpy.readers.core.header_cache import cached_file_header
 from satpy.readers.core.utils import (
     apply_rad_correction,
     get_earth_radius,
@@ -375,19 +376,9 @@ class AHIHSDFileHandler(BaseFileHandler):
         self.segment_number = filename_info["segment"]
         self.total_segments = filename_info["total_segments"]
 
-        with open(self.filename) as fd:
-            self.basic_info = np.fromfile(fd,
-                                          dtype=_BASIC_INFO_TYPE,
-                                          count=1)
-            self.data_info = np.fromfile(fd,
-                                         dtype=_DATA_INFO_TYPE,
-                                         count=1)
-            self.proj_info = np.fromfile(fd,
-                                         dtype=_PROJ_INFO_TYPE,
-                                         count=1)[0]
-            self.nav_info = np.fromfile(fd,
-                                        dtype=_NAV_INFO_TYPE,
-                                        count=1)[0]
+        (self.basic_info, self.data_info,
+         self.proj_info, self.nav_info) = cached_file_header(self.filename, "ahi_hsd.basic_info",
+                                                             _read_basic_info, self.filename)
         self.platform_name = np2str(self.basic_info["satellite"])
         self.observation_area = np2str(self.basic_info["observation_area"])
         self.sensor = "ahi"
@@ -481,16 +472,20 @@ class AHIHSDFileHandler(BaseFileHandler):
 
         return get_area_definition(pdict, aex)
 
-    def _check_fpos(self, fp_, fpos, offset, block):
-        """Check file position matches blocksize."""
+    def _check_fpos(self, fp_, fpos, offset, block, mismatched_blocks=None):
+        """Check file position matches blocksize.
+
+        A mismatch is warned about right away, or added to
+        ``mismatched_blocks`` if given.
+        """
         if fp_.tell() + offset != fpos:
-            warnings.warn(
-                f"Actual {block} header size does not match expected",
-                stacklevel=3
-            )
+            if mismatched_blocks is None:
+                _warn_header_size_mismatch(block, stacklevel=4)
+            else:
+                mismatched_blocks.append(block)
         return
 
-    def _read_header(self, fp_):
+    def _read_header(self, fp_, mismatched_blocks=None):
         """Read header."""
         header = {}
 
@@ -498,19 +493,19 @@ class AHIHSDFileHandler(BaseFileHandler):
         header["block1"] = np.fromfile(
             fp_, dtype=_BASIC_INFO_TYPE, count=1)
         fpos = fpos + int(header["block1"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 0, "block1")
+        self._check_fpos(fp_, fpos, 0, "block1", mismatched_blocks)
         fp_.seek(fpos, 0)
         header["block2"] = np.fromfile(fp_, dtype=_DATA_INFO_TYPE, count=1)
         fpos = fpos + int(header["block2"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 0, "block2")
+        self._check_fpos(fp_, fpos, 0, "block2", mismatched_blocks)
         fp_.seek(fpos, 0)
         header["block3"] = np.fromfile(fp_, dtype=_PROJ_INFO_TYPE, count=1)
         fpos = fpos + int(header["block3"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 0, "block3")
+        self._check_fpos(fp_, fpos, 0, "block3", mismatched_blocks)
         fp_.seek(fpos, 0)
         header["block4"] = np.fromfile(fp_, dtype=_NAV_INFO_TYPE, count=1)
         fpos = fpos + int(header["block4"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 0, "block4")
+        self._check_fpos(fp_, fpos, 0, "block4", mismatched_blocks)
         fp_.seek(fpos, 0)
         header["block5"] = np.fromfile(fp_, dtype=_CAL_INFO_TYPE, count=1)
         logger.debug("Band number = " +
@@ -523,7 +518,7 @@ class AHIHSDFileHandler(BaseFileHandler):
         else:
             cal = np.fromfile(fp_, dtype=_IRCAL_INFO_TYPE, count=1)
         fpos = fpos + int(header["block5"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 0, "block5")
+        self._check_fpos(fp_, fpos, 0, "block5", mismatched_blocks)
         fp_.seek(fpos, 0)
 
         header["calibration"] = cal
@@ -531,12 +526,12 @@ class AHIHSDFileHandler(BaseFileHandler):
         header["block6"] = np.fromfile(
             fp_, dtype=_INTER_CALIBRATION_INFO_TYPE, count=1)
         fpos = fpos + int(header["block6"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 0, "block6")
+        self._check_fpos(fp_, fpos, 0, "block6", mismatched_blocks)
         fp_.seek(fpos, 0)
         header["block7"] = np.fromfile(
             fp_, dtype=_SEGMENT_INFO_TYPE, count=1)
         fpos = fpos + int(header["block7"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 0, "block7")
+        self._check_fpos(fp_, fpos, 0, "block7", mismatched_blocks)
         fp_.seek(fpos, 0)
         header["block8"] = np.fromfile(
             fp_, dtype=_NAVIGATION_CORRECTION_INFO_TYPE, count=1)
@@ -546,7 +541,7 @@ class AHIHSDFileHandler(BaseFileHandler):
         for _i in range(ncorrs):
             corrections.append(np.fromfile(fp_, dtype=_NAVIGATION_CORRECTION_SUBINFO_TYPE, count=1))
         fpos = fpos + int(header["block8"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 40, "block8")
+        self._check_fpos(fp_, fpos, 40, "block8", mismatched_blocks)
         fp_.seek(fpos, 0)
         header["navigation_corrections"] = corrections
         header["block9"] = np.fromfile(fp_,
@@ -561,7 +556,7 @@ class AHIHSDFileHandler(BaseFileHandler):
                                                count=1))
         header["observation_time_information"] = lines_and_times
         fpos = fpos + int(header["block9"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 40, "block9")
+        self._check_fpos(fp_, fpos, 40, "block9", mismatched_blocks)
         fp_.seek(fpos, 0)
 
         header["block10"] = np.fromfile(fp_,
@@ -574,16 +569,28 @@ class AHIHSDFileHandler(BaseFileHandler):
             err_info_data.append(np.fromfile(fp_, dtype=_ERROR_LINE_INFO_TYPE, count=1))
         header["error_information_data"] = err_info_data
         fpos = fpos + int(header["block10"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 40, "block10")
+        self._check_fpos(fp_, fpos, 40, "block10", mismatched_blocks)
         fp_.seek(fpos, 0)
 
         header["block11"] = np.fromfile(fp_, dtype=_SPARE_TYPE, count=1)
         fpos = fpos + int(header["block11"]["blocklength"].item())
-        self._check_fpos(fp_, fpos, 0, "block11")
+        self._check_fpos(fp_, fpos, 0, "block11", mismatched_blocks)
         fp_.seek(fpos, 0)
 
         return header
 
+    def _read_header_and_data_offset(self):
+        """Read header and get the position where the data starts.
+
+        The blocks whose size does not match the expected one are returned
+        too, so that they are warned about also when the header comes from
+        the cache.
+        """
+        mismatched_blocks = []
+        with open(self.filename, "rb") as fp_:
+            header = self._read_header(fp_, mismatched_blocks)
+            return header, fp_.tell(), mismatched_blocks
+
     def _read_data(self, fp_, header, resolution):
         """Read data block."""
         nlines = int(header["block2"]["number_of_lines"].item())
@@ -612,8 +619,12 @@ class AHIHSDFileHandler(BaseFileHandler):
 
     def read_band(self, key, ds_info):
         """Read the data."""
+        self._header, data_offset, mismatched_blocks = cached_file_header(self.filename, "ahi_hsd.header",
+                                                                          self._read_header_and_data_offset)
+        for block in mismatched_blocks:
+            _warn_header_size_mismatch(block, stacklevel=3)
         with open(self.filename, "rb") as fp_:
-            self._header = self._read_header(fp_)
+            fp_.seek(data_offset, 0)
             res = self._read_data(fp_, self._header, key["resolution"])
         res = self._mask_invalid(data=res, header=self._header)
         res = self.calibrate(res, key["calibration"])
@@ -746,6 +757,28 @@ class AHIHSDFileHandler(BaseFileHandler):
         return (c0_ + c1_ * Te_ + c2_ * Te_ ** 2).clip(0)
 
 
+def _warn_header_size_mismatch(block, stacklevel):
+    warnings.warn(f"Actual {block} header size does not match expected", stacklevel=stacklevel)
+
+
+def _read_basic_info(filename):
+    """Read the basic, data, projection and navigation information blocks."""
+    with open(filename) as fd:
+        basic_info = np.fromfile(fd,
+                                 dtype=_BASIC_INFO_TYPE,
+                                 count=1)
+        data_info = np.fromfile(fd,
+                                dtype=_DATA_INFO_TYPE,
+                                count=1)
+        proj_info = np.fromfile(fd,
+                                dtype=_PROJ_INFO_TYPE,
+                                count=1)[0]
+        nav_info = np.fromfile(fd,
+                               dtype=_NAV_INFO_TYPE,
+                               count=1)[0]
+    return basic_info, data_info, proj_info, nav_info
+
+
 class _NominalTimeCalculator:
     """Get time when a scan was nominally to be recorded."""
 
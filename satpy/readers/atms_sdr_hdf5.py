@@ -39,6 +39,7 @@ import dask.array as da
 import h5py
 import xarray as xr
 
+from satpy.readers.core.hdf5 import _PooledH5Dataset
 from satpy.readers.core.viirs_atms_sdr import DATASET_KEYS, JPSS_SDR_FileHandler
 from satpy.utils import get_legacy_chunk_size
 
@@ -60,12 +61,12 @@ class ATMS_SDR_FileHandler(JPSS_SDR_FileHandler):
     def __getitem__(self, key):
         """Get item for given key."""
         val = self.file_content[key]
-        if isinstance(val, h5py.Dataset):
-            dset = h5py.File(self.filename, "r")[key]
-            if dset.ndim == 3:
-                dset_data = da.from_array(dset, chunks=CHUNK_SIZE)
-                attrs = self._attrs_cache.get(key, dset.attrs)
-                return xr.DataArray(dset_data, dims=["y", "x", "z"], attrs=attrs)
+        if isinstance(val, h5py.Dataset) and len(self.file_content[key + "/shape"]) == 3:
+            dset = _PooledH5Dataset(self.filename, key, self.file_content[key + "/shape"],
+                                    self.file_content[key + "/dtype"])
+            dset_data = da.from_array(dset, chunks=CHUNK_SIZE)
+            attrs = self._attrs_cache.get(key, {})
+            return xr.DataArray(dset_data, dims=["y", "x", "z"], attrs=attrs)
 
         return super().__getitem__(key)
 
@@ -35,6 +35,9 @@ logger = logging.getLogger(__name__)
 class HDF4BandReader(BaseFileHandler):
     """CALIOP v3 HDF4 reader."""
 
+    # the HDF4 library is not thread-safe
+    thread_safe_init = False
+
     def __init__(self, filename, filename_info, filetype_info):
         """Initialze file handler."""
         super(HDF4BandReader, self).__init__(filename,
@@ -100,6 +100,10 @@ def available_readers(
         a list of dictionaries including additionally reader information is returned.
 
     """
+    if yaml_loader is BaseLoader and not as_dict:
+        # nothing is imported with the BaseLoader, the registry has the same names without parsing the YAML
+        from .registry import get_reader_registry
+        return sorted(get_reader_registry().readers)
     readers = []
     for reader_configs in configs_for_reader():
         try:
@@ -47,6 +47,11 @@ def open_dataset(filename, *args, **kwargs):  # noqa: D417
 class BaseFileHandler:
     """Base file handler."""
 
+    #: Whether file handlers of this class can be created at the same time in
+    #: different threads, see the ``parallel_init`` option of
+    #: :class:`~satpy.readers.core.yaml_reader.FileYAMLReader`.
+    thread_safe_init = True
+
     def __init__(self, filename, filename_info, filetype_info):
         """Initialize file handler."""
         self.filename = filename
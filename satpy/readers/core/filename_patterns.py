@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Match and parse many filenames with the same filename pattern at once.
+
+Parsing filenames one at a time with :func:`trollsift.parser.parse` converts
+every field of every filename, even when the same value appears in thousands
+of filenames (e.g. the start time of all the segments of a full disk scan).
+:class:`FilenamePattern` compiles a pattern once and parses the requested
+fields of a batch of filenames into columns, converting every distinct value
+only once::
+
+    >>> pattern = get_filename_pattern("{platform}_{start_time:%Y%m%d%H%M}_{segment:02d}.dat")
+    >>> filenames, columns = pattern.parse_columns(["H09_202401010000_01.dat", "H09_202401010000_02.dat"],
+    ...                                            ["start_time", "segment"])
+    >>> columns["start_time"].values
+    [datetime.datetime(2024, 1, 1, 0, 0)]
+    >>> columns["start_time"].codes
+    array([0, 0])
+
+The matching rules are the same as for
+:meth:`~satpy.readers.core.yaml_reader.FileYAMLReader.filename_items_for_filetype`:
+the end of the path matching the pattern must match the globified pattern
+and be parsable with it. Only the requested fields are converted though, so
+a filename whose other fields match the pattern but can't be converted (e.g.
+an invalid date) is not rejected.
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+import re
+from fnmatch import translate
+from typing import NamedTuple
+
+import numpy as np
+from trollsift.parser import get_convert_dict, globify, parse, regex_format
+
+from satpy._compat import cache
+
+# value of fields that can't be converted
+_INVALID = object()
+
+
+class FieldColumn(NamedTuple):
+    """Values of one field for a batch of filenames.
+
+    The value for the i-th filename is ``values[codes[i]]``.
+    """
+
+    values: list
+    codes: np.ndarray
+
+
+class FilenamePattern:
+    """Filename pattern compiled to match and parse batches of filenames."""
+
+    def __init__(self, pattern: str):
+        """Compile the glob and regular expressions of *pattern*."""
+        self.pattern = pattern
+        #: number of path components matched by the pattern
+        self.depth = len(pattern.split(os.path.sep))
+        self._glob_match = re.compile(translate(os.path.normcase(globify(pattern)))).match
+        self._match = re.compile("^" + regex_format(pattern) + "$").match
+        self._format_specs = get_convert_dict(pattern)
+
+    @property
+    def fields(self) -> list[str]:
+        """Names of the fields of the pattern."""
+        return list(self._format_specs)
+
+    def match(self, filenames, filebases=None) -> tuple[list, list[str], list[dict[str, str]]]:
+        """Find the filenames matching the pattern.
+
+        Args:
+            filenames: Filenames to match.
+            filebases: Optional mapping of the filenames to the end of their
+                paths with :attr:`depth` components, as given by
+                :func:`get_filebases`, to reuse them between patterns.
+
+        Returns:
+            The matching filenames, the parts of their paths matching the
+            pattern, and the unconverted strings of their fields.
+
+        """
+        if filebases is None:
+            filebases = get_filebases(filenames, self.depth)
+        matching = []
+        matching_filebases = []
+        fields = []
+        for filename in filenames:
+            filebase = filebases[filename]
+            if not self._glob_match(os.path.normcase(filebase)):
+                continue
+            match = self._match(filebase)
+            if match is None:
+                continue
+            matching.append(filename)
+            matching_filebases.append(filebase)
+            fields.append(match.groupdict())
+        return matching, matching_filebases, fields
+
+    def parse_columns(self, filenames, keys=None, filebases=None) -> tuple[list, dict[str, FieldColumn]]:
+        """Parse the *keys* fields of the filenames matching the pattern.
+
+        Args:
+            filenames: Filenames to parse.
+            keys: Fields to parse, all the fields of the pattern by default.
+                Fields missing from the pattern are None for all filenames.
+            filebases: Optional precomputed ends of the paths, see :meth:`match`.
+
+        Returns:
+            The matching filenames and a dictionary of the columns of the
+            requested fields. Filenames whose fields can't be converted are
+            left out.
+
+        """
+        if keys is None:
+            keys = self.fields
+        matching, filebases, fields = self.match(filenames, filebases)
+        valid = np.ones(len(matching), dtype=bool)
+        columns = {}
+        for key in keys:
+            if key not in self._format_specs:
+                columns[key] = FieldColumn([None], np.zeros(len(matching), dtype=np.intp))
+                continue
+            raw_values = np.array([field[key] for field in fields], dtype=str)
+            uniques, first_indices, codes = np.unique(raw_values, return_index=True, return_inverse=True)
+            codes = codes.reshape(-1)
+            values = [self._convert(key, raw, filebases[index])
+                      for raw, index in zip(uniques.tolist(), first_indices.tolist())]
+            invalid = np.array([value is _INVALID for value in values], dtype=bool)
+            if invalid.any():
+                valid &= ~invalid[codes]
+            columns[key] = FieldColumn(values, codes)
+        if not valid.all():
+            matching = [filename for filename, is_valid in zip(matching, valid.tolist()) if is_valid]
+            columns = {key: FieldColumn(column.values, column.codes[valid]) for key, column in columns.items()}
+        return matching, columns
+
+    def _convert(self, key, raw, filebase):
+        format_spec = self._format_specs[key]
+        try:
+            if "%" in format_spec:
+                # same conversion as trollsift, without parsing the value again
+                return dt.datetime.strptime(raw, format_spec)
+            return parse("{" + key + ":" + format_spec + "}", raw)[key]
+        except ValueError:
+            pass
+        try:
+            # the field can't be parsed on its own, parse a whole filename with this value
+            return parse(self.pattern, filebase)[key]
+        except ValueError:
+            return _INVALID
+
+
+def get_filebases(filenames, depth: int) -> dict:
+    """Get the end of the paths of *filenames* with *depth* components, like ``_get_filebase`` does."""
+    filebases = {}
+    for filename in filenames:
+        path = os.path.normpath(filename)
+        filebases[filename] = os.path.join(*str(path).split(os.path.sep)[-depth:])
+    return filebases
+
+
+@cache
+def get_filename_pattern(pattern: str) -> FilenamePattern:
+    """Get the compiled version of *pattern*, compiled patterns are shared."""
+    return FilenamePattern(pattern)
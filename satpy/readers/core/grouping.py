@@ -19,12 +19,18 @@
 
 import datetime as dt
 import logging
+import time
 import warnings
+from collections.abc import Mapping
 
+import numpy as np
 import yaml
 
 from .config import configs_for_reader
-from .loading import load_reader
+from .filename_patterns import FieldColumn, get_filebases, get_filename_pattern
+from .loading import _reader_may_match, load_reader
+from .registry import get_reader_registry
+from .yaml_reader import FileYAMLReader
 
 LOG = logging.getLogger(__name__)
 
@@ -83,16 +89,18 @@ def group_files(files_to_sort, reader=None, time_threshold=10,
 
     reader_kwargs = reader_kwargs or {}
 
+    parsed_files = {}
     reader_files = _assign_files_to_readers(
-            files_to_sort, reader, reader_kwargs)
+            files_to_sort, reader, reader_kwargs, parsed_files)
 
     if reader is None:
         reader = reader_files.keys()
 
-    file_keys = _get_file_keys_for_reader_files(
-            reader_files, group_keys=group_keys)
-
-    file_groups = _get_sorted_file_groups(file_keys, time_threshold)
+    file_groups = _group_files_by_columns(reader_files, parsed_files, group_keys, time_threshold)
+    if file_groups is None:
+        file_keys = _get_file_keys_for_reader_files(
+                reader_files, group_keys=group_keys)
+        file_groups = _get_sorted_file_groups(file_keys, time_threshold)
 
     groups = [{rn: file_groups[group_key].get(rn, []) for rn in reader} for group_key in file_groups]
 
@@ -100,7 +108,7 @@ def group_files(files_to_sort, reader=None, time_threshold=10,
 
 
 def _assign_files_to_readers(files_to_sort, reader_names,  # noqa: D417
-                             reader_kwargs):
+                             reader_kwargs, parsed_files=None):
     """Assign files to readers.
 
     Given a list of file names (paths), match those to reader instances.
@@ -111,6 +119,9 @@ def _assign_files_to_readers(files_to_sort, reader_names,  # noqa: D417
         files_to_sort (Collection[str]): Files to assign to readers.
         reader_names (Collection[str]): Readers to consider
         reader_kwargs (Mapping):
+        parsed_files (dict): If given, the fields of the files of the readers
+            parsing their filenames in the default way are parsed in batches
+            and stored here, see _parse_files_in_batches.
 
     Returns:
         Mapping[str, Tuple[reader, Set[str]]]
@@ -119,7 +130,11 @@ def _assign_files_to_readers(files_to_sort, reader_names,  # noqa: D417
     """
     files_to_sort = set(files_to_sort)
     reader_dict = {}
+    # without reader names, only create the readers whose patterns match some files
+    registry = get_reader_registry() if reader_names is None else None
     for reader_configs in configs_for_reader(reader_names):
+        if registry is not None and not _reader_may_match(registry, reader_configs, files_to_sort):
+            continue
         try:
             reader = load_reader(reader_configs, **reader_kwargs)
         except yaml.constructor.ConstructorError:
@@ -131,7 +146,7 @@ def _assign_files_to_readers(files_to_sort, reader_names,  # noqa: D417
                     "will improve if you pass readers explicitly).")
             continue
         reader_name = reader.info["name"]
-        files_matching = set(reader.filter_selected_filenames(files_to_sort))
+        files_matching = _filter_selected_filenames(reader, files_to_sort, parsed_files)
         files_to_sort -= files_matching
         if files_matching or reader_names is not None:
             reader_dict[reader_name] = (reader, files_matching)
@@ -141,6 +156,54 @@ def _assign_files_to_readers(files_to_sort, reader_names,  # noqa: D417
     return reader_dict
 
 
+def _filter_selected_filenames(reader, files_to_sort, parsed_files=None):
+    """Get the files selected by *reader*, parsing them in batches when possible."""
+    if parsed_files is None or not _can_parse_in_batches(reader):
+        return set(reader.filter_selected_filenames(files_to_sort))
+    tables = parsed_files[reader.info["name"]] = _parse_files_in_batches(reader, files_to_sort)
+    return {filename for filenames, _ in tables for filename in filenames}
+
+
+def _can_parse_in_batches(reader):
+    """Check that *reader* selects and parses its files like FileYAMLReader, without filtering them."""
+    if not isinstance(reader, FileYAMLReader) or reader.filter_parameters:
+        return False
+    reader_type = type(reader)
+    return all(getattr(reader_type, method) is getattr(FileYAMLReader, method)
+               for method in ("filter_selected_filenames", "filename_items_for_filetype",
+                              "filter_filenames_by_info", "metadata_matches"))
+
+
+def _parse_files_in_batches(reader, files_to_sort):
+    """Parse the fields of the files matching the filename patterns of *reader*, one pattern at a time.
+
+    Files are assigned to the first matching filename pattern, with file
+    types sorted like in filter_selected_filenames, and only the files
+    whose fields can all be converted are kept.
+
+    Returns:
+        List of (filenames, columns) tuples, one per filename pattern
+        matching some files, where columns is a dictionary of the
+        :class:`~satpy.readers.core.filename_patterns.FieldColumn` of every
+        field of the pattern.
+    """
+    remaining = set(files_to_sort)
+    filebases = {}
+    tables = []
+    for _, filetype_info in reader.sorted_filetype_items():
+        for pattern in filetype_info["file_patterns"]:
+            if not remaining:
+                return tables
+            pattern = get_filename_pattern(pattern)
+            if pattern.depth not in filebases:
+                filebases[pattern.depth] = get_filebases(remaining, pattern.depth)
+            filenames, columns = pattern.parse_columns(remaining, filebases=filebases[pattern.depth])
+            if filenames:
+                remaining.difference_update(filenames)
+                tables.append((filenames, columns))
+    return tables
+
+
 def _get_file_keys_for_reader_files(reader_files, group_keys=None):
     """From a mapping from _assign_files_to_readers, get file keys.
 
@@ -246,6 +309,185 @@ def _update_existing_group(file_groups, rn, prev_key, f):
         file_groups[prev_key][rn].append(f)
 
 
+def _group_files_by_columns(reader_files, parsed_files, group_keys, time_threshold):
+    """Group the files like _get_sorted_file_groups, from the fields parsed in batches.
+
+    The files are sorted and split into groups with array operations on the
+    columns of the group keys from _parse_files_in_batches.
+
+    Internal helper for group_files.
+
+    Returns:
+        Same as _get_sorted_file_groups, or None if the files of a reader
+        were not parsed in batches.
+    """
+    if not reader_files:
+        return {}
+    if not all(reader_name in parsed_files for reader_name in reader_files):
+        return None
+    group_keys, tables = _get_file_key_columns(reader_files, parsed_files, group_keys)
+    file_groups = _get_sorted_file_groups_from_columns(tables, len(group_keys), time_threshold)
+    if file_groups is None:
+        # some keys can't be compared as arrays, sort the files one by one
+        file_groups = _get_sorted_file_groups(_get_file_keys_from_columns(tables), time_threshold)
+    return file_groups
+
+
+def _get_file_key_columns(reader_files, parsed_files, group_keys=None):
+    """Get the columns of the group keys of the files of every reader.
+
+    Returns:
+        Tuple of the group keys used and a list of (reader name, filenames,
+        columns) tuples, one per filename pattern, where columns is a list
+        of :class:`~satpy.readers.core.filename_patterns.FieldColumn` in
+        the order of the group keys.
+    """
+    tables = []
+    for reader_name, (reader_instance, _) in reader_files.items():
+        if group_keys is None:
+            group_keys = reader_instance.info.get("group_keys", ("start_time",))
+        for filenames, columns in parsed_files[reader_name]:
+            columns = [columns.get(key) or FieldColumn([None], np.zeros(len(filenames), dtype=np.intp))
+                       for key in group_keys]
+            _warn_files_without_group_keys(reader_name, filenames, columns, group_keys)
+            tables.append((reader_name, filenames, columns))
+    return group_keys, tables
+
+
+def _warn_files_without_group_keys(reader_name, filenames, columns, group_keys):
+    no_keys = np.ones(len(filenames), dtype=bool)
+    for column in columns:
+        is_none = np.array([value is None for value in column.values], dtype=bool)
+        no_keys &= is_none[column.codes]
+    for index in np.flatnonzero(no_keys):
+        warnings.warn(
+            f"Found matching file {filenames[index]:s} for reader "
+            f"{reader_name:s}, but none of group keys found. "
+            "Group keys requested: " + ", ".join(group_keys),
+            UserWarning,
+            stacklevel=5
+        )
+
+
+def _get_file_keys_from_columns(tables):
+    """Convert the columns from _get_file_key_columns to the output of _get_file_keys_for_reader_files."""
+    file_keys = {}
+    for reader_name, filenames, columns in tables:
+        reader_keys = file_keys.setdefault(reader_name, [])
+        for index, filename in enumerate(filenames):
+            group_key = tuple(column.values[column.codes[index]] for column in columns)
+            reader_keys.append((group_key, filename))
+    return file_keys
+
+
+def _get_sorted_file_groups_from_columns(tables, num_keys, time_threshold):
+    """Get sorted file groups from the columns of group keys.
+
+    Gives the same groups as _get_sorted_file_groups, but sorts the files and
+    finds where the groups start with array operations. The loop over the
+    files only happens when filling the groups.
+
+    Internal helper for group_files.
+
+    Returns:
+        Same as _get_sorted_file_groups, or None if the values of a group
+        key can't be compared as arrays, e.g. because they are missing for
+        some files only.
+    """
+    filenames = [filename for _, table_files, _ in tables for filename in table_files]
+    if not filenames:
+        return {}
+    reader_names = np.array([reader_name for reader_name, table_files, _ in tables
+                             for _ in range(len(table_files))])
+    sorted_keys = []
+    for key_index in range(num_keys):
+        sorted_key = _get_sorted_key_values(tables, key_index)
+        if sorted_key is None:
+            return None
+        sorted_keys.append(sorted_key)
+    filename_ranks = _get_ranks(filenames)
+    if filename_ranks is None:
+        return None
+
+    reader_codes = np.unique(reader_names, return_inverse=True)[1].reshape(-1)
+    order = np.lexsort([filename_ranks, reader_codes] + [codes for _, codes in reversed(sorted_keys)])
+    first_values, first_codes = sorted_keys[0]
+    primary = first_codes[order]
+    is_time = isinstance(first_values[0], dt.datetime)
+    if is_time:
+        times = np.array(first_values, dtype="datetime64[us]").astype(np.int64)
+        primary = times[primary]
+        threshold = dt.timedelta(seconds=time_threshold) // dt.timedelta(microseconds=1)
+    # keys that are None for all files never split groups
+    others = [codes[order] for values, codes in sorted_keys[1:] if values != [None]]
+
+    file_groups = {}
+    start = 0
+    while start < len(order):
+        end = np.searchsorted(primary, primary[start] + threshold if is_time else primary[start], side="right")
+        end = _get_end_of_equal_keys(others, start, end)
+        first = order[start]
+        group_key = tuple(values[codes[first]] for values, codes in sorted_keys)
+        group = file_groups[group_key] = {}
+        for index in order[start:end]:
+            group.setdefault(reader_names[index].item(), []).append(filenames[index])
+        start = end
+    return file_groups
+
+
+def _get_sorted_key_values(tables, key_index):
+    """Get the sorted distinct values of a group key and the index of the value of each file in them."""
+    distinct_values = set()
+    for _, _, columns in tables:
+        distinct_values.update(columns[key_index].values)
+    if None in distinct_values and len(distinct_values) > 1:
+        return None
+    try:
+        sorted_values = sorted(distinct_values)
+    except TypeError:
+        return None
+    if not _are_comparable_as_arrays(sorted_values, key_index):
+        return None
+    ranks = {value: rank for rank, value in enumerate(sorted_values)}
+    codes = np.concatenate([np.array([ranks[value] for value in columns[key_index].values],
+                                     dtype=np.intp)[columns[key_index].codes]
+                            for _, _, columns in tables])
+    return sorted_values, codes
+
+
+def _are_comparable_as_arrays(sorted_values, key_index):
+    if key_index != 0:
+        return True
+    # the first key is compared with the time threshold if it is a datetime
+    num_datetimes = sum(isinstance(value, dt.datetime) for value in sorted_values)
+    if num_datetimes == 0:
+        return True
+    return num_datetimes == len(sorted_values) and all(value.tzinfo is None for value in sorted_values)
+
+
+def _get_ranks(items):
+    try:
+        order = sorted(range(len(items)), key=items.__getitem__)
+    except TypeError:
+        return None
+    ranks = np.empty(len(items), dtype=np.intp)
+    ranks[order] = np.arange(len(items))
+    return ranks
+
+
+def _get_end_of_equal_keys(others, start, end):
+    """Get where the files from *start* stop having the same secondary keys as the file at *start*."""
+    if not others or end - start < 2:
+        return end
+    differ = np.zeros(end - start - 1, dtype=bool)
+    for codes in others:
+        differ |= codes[start + 1:end] != codes[start]
+    differ = np.flatnonzero(differ)
+    if differ.size:
+        return start + 1 + differ[0]
+    return end
+
+
 def _filter_groups(groups, missing="pass"):
     """Filter multi-reader group-files behavior.
 
@@ -306,6 +548,225 @@ def _get_keys_with_empty_values(grp):
     return empty
 
 
+class FileGrouper:
+    """Group files incrementally, as they arrive.
+
+    This is the streaming counterpart of :func:`group_files` for real-time
+    processing: files are added one at a time with :meth:`add`, and a group
+    is returned as soon as it is complete, without parsing the previously
+    added files again. A group is complete when every file type listed in
+    ``required_filetypes`` has all its expected segments. The expected number
+    of segments of a file type is its ``expected_segments`` YAML metadata or
+    the ``total_segments`` field of its filenames, like for the segmented
+    geostationary readers, and is 1 otherwise.
+
+    Groups that are not complete ``timeout`` seconds after their first file
+    was added are returned as they are by :meth:`add` and :meth:`expire`,
+    and :meth:`flush` returns all the groups still waiting::
+
+        >>> grouper = FileGrouper("ahi_hsd", required_filetypes=["hsd_b01", "hsd_b03"], timeout=600)
+        >>> for filename in incoming_files():
+        ...     for group in grouper.add(filename):
+        ...         scn = Scene(filenames=group)
+
+    Files are grouped like in :func:`group_files`, except that a file joins
+    a waiting group when its first group key is within ``time_threshold``
+    of the key of the first file of the group, whichever file arrived first.
+    Files arriving after their group was returned start a new group, and
+    files no reader can read are logged and ignored.
+
+    """
+
+    def __init__(self, reader, required_filetypes=None, timeout=None, time_threshold=10,
+                 group_keys=None, reader_kwargs=None):
+        """Load the readers.
+
+        Args:
+            reader (str or Collection[str]): Reader or readers whose file
+                patterns should be used to sort files.
+            required_filetypes (Collection[str] or Mapping[str, Collection[str]]):
+                File types that must be present in a group for it to be
+                complete, for every reader if a mapping. A collection can
+                only be given with a single reader. Without required file
+                types, groups are only returned when they time out or are
+                flushed.
+            timeout (float): Number of seconds after the first file of a
+                group was added after which the group is returned even if it
+                is not complete. By default groups wait until they are
+                complete or flushed.
+            time_threshold (int): Same as for :func:`group_files`.
+            group_keys (list or tuple): Same as for :func:`group_files`.
+            reader_kwargs (dict): Additional keyword arguments to pass to
+                reader creation.
+
+        """
+        if not isinstance(reader, (list, tuple)):
+            reader = [reader]
+        self._readers = {}
+        for reader_configs in configs_for_reader(reader):
+            reader_instance = load_reader(reader_configs, **(reader_kwargs or {}))
+            self._readers[reader_instance.info["name"]] = reader_instance
+        self.required_filetypes = _get_required_filetypes(required_filetypes, list(self._readers))
+        self.timeout = timeout
+        self.time_threshold = dt.timedelta(seconds=time_threshold)
+        self.group_keys = group_keys
+        self._groups = []
+        self._filenames = set()
+
+    @property
+    def waiting_groups(self):
+        """Get the groups that have not been returned yet."""
+        return [group.get_files(self._readers) for group in self._groups]
+
+    def add(self, filename, now=None):
+        """Add a file.
+
+        The file is ignored if it is already in a waiting group, or if it
+        matches none of the readers.
+
+        Args:
+            filename (str): File to add.
+            now (float): Time of the arrival of the file, in seconds from
+                :func:`time.monotonic` by default.
+
+        Returns:
+            List of the groups that are complete or timed out, as
+            dictionaries mapping reader names to lists of filenames, sorted
+            by group key. An empty list if the file matches none of the
+            readers.
+
+        """
+        if now is None:
+            now = time.monotonic()
+        if filename not in self._filenames:
+            parsed = self._parse(filename)
+            if parsed is None:
+                LOG.warning("Ignoring file not matching any reader: %s", filename)
+                return []
+            self._add_file(filename, parsed, now)
+        ready = [group for group in self._groups if group.is_complete(self.required_filetypes)]
+        return self._pop_groups(ready) + self.expire(now)
+
+    def _add_file(self, filename, parsed, now):
+        reader_name, filetype, filename_info = parsed
+        group_keys = self.group_keys or self._readers[reader_name].info.get("group_keys", ("start_time",))
+        group_key = tuple(filename_info.get(key) for key in group_keys)
+        for group in self._groups:
+            if _is_same_group(group_key, group.key, self.time_threshold):
+                break
+        else:
+            group = _FileGroup(group_key, now)
+            self._groups.append(group)
+        group.add(reader_name, filetype, filename, filename_info)
+        self._filenames.add(filename)
+
+    def _parse(self, filename):
+        for reader_name, reader_instance in self._readers.items():
+            for filetype, filetype_info in reader_instance.sorted_filetype_items():
+                filename_items = reader_instance.filename_items_for_filetype({filename}, filetype_info)
+                if reader_instance.filter_filenames:
+                    filename_items = reader_instance.filter_filenames_by_info(filename_items)
+                for _, filename_info in filename_items:
+                    return reader_name, filetype, _add_segment_info(filename_info, filetype_info)
+        return None
+
+    def expire(self, now=None):
+        """Get the groups that timed out.
+
+        Args:
+            now (float): Current time, in seconds from :func:`time.monotonic`
+                by default.
+
+        Returns:
+            List of the groups waiting for ``timeout`` seconds or more, like
+            for :meth:`add`.
+
+        """
+        if self.timeout is None:
+            return []
+        if now is None:
+            now = time.monotonic()
+        return self._pop_groups([group for group in self._groups if now - group.created >= self.timeout])
+
+    def flush(self):
+        """Get all the groups still waiting, complete or not."""
+        return self._pop_groups(list(self._groups))
+
+    def _pop_groups(self, groups):
+        for group in groups:
+            self._groups.remove(group)
+            self._filenames.difference_update(group.filenames)
+        return [group.get_files(self._readers) for group in _sort_groups(groups)]
+
+
+def _get_required_filetypes(required_filetypes, reader_names):
+    if required_filetypes is None:
+        return {}
+    if isinstance(required_filetypes, Mapping):
+        return {reader_name: list(filetypes) for reader_name, filetypes in required_filetypes.items()}
+    if len(reader_names) != 1:
+        raise ValueError("Required file types must be given for every reader when using several readers.")
+    return {reader_names[0]: list(required_filetypes)}
+
+
+def _add_segment_info(filename_info, filetype_info):
+    """Get the segment number and the number of expected segments of a file, like GEOSegmentYAMLReader does."""
+    filename_info = dict(filename_info)
+    filename_info.setdefault("segment", filename_info.get("count_in_repeat_cycle", 1))
+    filename_info["expected_segments"] = filetype_info.get("expected_segments",
+                                                           filename_info.get("total_segments", 1))
+    return filename_info
+
+
+def _is_same_group(group_key, other_key, threshold):
+    if isinstance(group_key[0], dt.datetime) and isinstance(other_key[0], dt.datetime):
+        first_matches = abs(group_key[0] - other_key[0]) <= threshold
+    else:
+        first_matches = group_key[0] == other_key[0]
+    return first_matches and all(value == other for value, other in zip(group_key[1:], other_key[1:])
+                                 if value is not None and other is not None)
+
+
+def _sort_groups(groups):
+    try:
+        return sorted(groups, key=lambda group: group.key)
+    except TypeError:
+        return groups
+
+
+class _FileGroup:
+    """Files of a group waiting to be complete."""
+
+    def __init__(self, key, created):
+        self.key = key
+        self.created = created
+        self.files = {}
+        self.segments = {}
+        self.expected_segments = {}
+
+    @property
+    def filenames(self):
+        return [filename for filenames in self.files.values() for filename in filenames]
+
+    def add(self, reader_name, filetype, filename, filename_info):
+        self.files.setdefault(reader_name, []).append(filename)
+        self.segments.setdefault((reader_name, filetype), set()).add(int(filename_info["segment"]))
+        self.expected_segments[(reader_name, filetype)] = int(filename_info["expected_segments"])
+
+    def is_complete(self, required_filetypes):
+        if not required_filetypes:
+            return False
+        for reader_name, filetypes in required_filetypes.items():
+            for filetype in filetypes:
+                segments = self.segments.get((reader_name, filetype), set())
+                if not segments.issuperset(range(1, self.expected_segments.get((reader_name, filetype), 1) + 1)):
+                    return False
+        return True
+
+    def get_files(self, reader_names):
+        return {reader_name: sorted(self.files.get(reader_name, [])) for reader_name in reader_names}
+
+
 def find_files_and_readers(start_time=None, end_time=None, base_dir=None,
                            reader=None, sensor=None,
                            filter_parameters=None, reader_kwargs=None,
@@ -68,6 +68,9 @@ def from_sds(var, src_path, **kwargs):
 class HDF4FileHandler(BaseFileHandler):
     """Base class for common HDF4 operations."""
 
+    # the HDF4 library is not thread-safe
+    thread_safe_init = False
+
     def __init__(self, filename, filename_info, filetype_info):
         """Open file and collect information."""
         super(HDF4FileHandler, self).__init__(filename, filename_info, filetype_info)
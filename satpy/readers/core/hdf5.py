@@ -19,6 +19,10 @@
 
 import logging
 import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, NamedTuple
 
 import dask.array as da
 import dask.config as dc
@@ -28,6 +32,7 @@ import xarray as xr
 from dask.array.core import normalize_chunks
 from dask.base import tokenize
 
+import satpy
 from satpy.readers.core.file_handlers import BaseFileHandler
 from satpy.readers.core.remote import open_file_or_filename
 from satpy.readers.core.utils import np2str
@@ -35,6 +40,147 @@ from satpy.readers.core.utils import np2str
 LOG = logging.getLogger(__name__)
 
 
+class _H5FilePool:
+    """Bounded pool of open read-only :class:`h5py.File` objects shared by all file handlers.
+
+    Files are kept open after use and closed in least-recently-used order
+    once more than ``max_open_files`` are open. The maximum defaults to the
+    ``readers.hdf5_max_open_files`` satpy configuration option.
+
+    All access to the pooled files must happen inside :meth:`open`. A single
+    lock is held for the duration of the access so that a file can not be
+    closed by another thread while it is being read. HDF5 serializes all
+    library calls anyway so this lock does not reduce read concurrency.
+
+    """
+
+    def __init__(self, max_open_files=None):
+        """Initialize an empty pool."""
+        self._max_open_files = max_open_files
+        self._files = OrderedDict()
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+    @property
+    def max_open_files(self):
+        """Get the maximum number of files that are kept open."""
+        if self._max_open_files is not None:
+            return self._max_open_files
+        return satpy.config.get("readers.hdf5_max_open_files", 128)
+
+    def __len__(self):
+        """Get the number of currently open files."""
+        return len(self._files)
+
+    def __contains__(self, filename):
+        """Check if the file is currently open in the pool."""
+        return filename in self._files
+
+    @contextmanager
+    def open(self, filename):  # noqa: A003
+        """Get an open file from the pool, opening it if needed.
+
+        A file is opened again if it was changed or replaced on disk since it
+        was put in the pool.
+
+        """
+        with self._lock:
+            self._reset_after_fork()
+            signature = _get_file_signature(filename)
+            entry = self._files.get(filename)
+            if entry is None or not entry.file_handle.id.valid or entry.signature != signature:
+                if entry is not None:
+                    LOG.debug("Reopening changed HDF5 file %s", filename)
+                    entry.close()
+                entry = _open_pooled_file(filename, signature)
+                self._files[filename] = entry
+            self._files.move_to_end(filename)
+            try:
+                yield entry.file_handle
+            finally:
+                self._evict()
+
+    def _reset_after_fork(self):
+        # HDF5 file handles can not be shared with forked child processes
+        if self._pid != os.getpid():
+            self._files = OrderedDict()
+            self._pid = os.getpid()
+
+    def _evict(self):
+        while len(self._files) > max(self.max_open_files, 1):
+            filename, entry = self._files.popitem(last=False)
+            LOG.debug("Closing pooled HDF5 file %s", filename)
+            entry.close()
+
+    def close(self, filename=None):
+        """Close one file or, if no filename is given, all files in the pool."""
+        with self._lock:
+            filenames = list(self._files) if filename is None else [filename]
+            for fname in filenames:
+                entry = self._files.pop(fname, None)
+                if entry is not None:
+                    entry.close()
+
+
+class _PooledFile(NamedTuple):
+    """Open HDF5 file in the pool."""
+
+    signature: tuple | None
+    file_handle: h5py.File
+    # file object the HDF5 file was opened from, h5py does not close these itself
+    file_obj: Any = None
+
+    def close(self):
+        self.file_handle.close()
+        if self.file_obj is not None:
+            self.file_obj.close()
+
+
+def _open_pooled_file(filename, signature):
+    f_obj = open_file_or_filename(filename)
+    file_handle = h5py.File(f_obj, "r")
+    owned_obj = f_obj if hasattr(f_obj, "close") else None
+    return _PooledFile(signature, file_handle, owned_obj)
+
+
+def _get_file_signature(filename):
+    """Get what identifies the current version of a local file, or None for other files."""
+    if not isinstance(filename, (str, os.PathLike)):
+        return None
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+FILE_POOL = _H5FilePool()
+
+
+class _PooledH5Dataset:
+    """Lazy array-like view of a HDF5 dataset read through the shared file pool.
+
+    Only the filename and the dataset name are stored so that the object can
+    be pickled and sent to other processes.
+
+    """
+
+    def __init__(self, filename, name, shape, dtype, chunks=None):
+        self.filename = filename
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+        self.chunks = chunks
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __getitem__(self, key):
+        with FILE_POOL.open(self.filename) as file_handle:
+            return file_handle[self.name][key]
+
+
 class HDF5FileHandler(BaseFileHandler):
     """Small class for inspecting a HDF5 file and retrieve its metadata/header data."""
 
@@ -46,17 +192,14 @@ class HDF5FileHandler(BaseFileHandler):
         self._attrs_cache = {}
 
         try:
-            f_obj = open_file_or_filename(self.filename)
-            file_handle = h5py.File(f_obj, "r")
+            with FILE_POOL.open(self.filename) as file_handle:
+                file_handle.visititems(self.collect_metadata)
+                self._collect_attrs("", file_handle.attrs)
         except IOError:
             LOG.exception(
                 "Failed reading file %s. Possibly corrupted file", self.filename)
             raise
 
-        file_handle.visititems(self.collect_metadata)
-        self._collect_attrs("", file_handle.attrs)
-        file_handle.close()
-
     def _collect_attrs(self, name, attrs):
         attrs_cache = self._attrs_cache.setdefault(name, {})
         for key, value in attrs.items():
@@ -77,8 +220,7 @@ class HDF5FileHandler(BaseFileHandler):
 
     def get_reference(self, name, key):
         """Get reference."""
-        f_obj = open_file_or_filename(self.filename)
-        with h5py.File(f_obj, "r") as hf:
+        with FILE_POOL.open(self.filename) as hf:
             return self._get_reference(hf, hf[name].attrs[key])
 
     def _get_reference(self, hf, ref):
@@ -101,12 +243,16 @@ class HDF5FileHandler(BaseFileHandler):
         """Get item for given key."""
         val = self.file_content[key]
         if isinstance(val, h5py.Dataset):
-            # these datasets are closed and inaccessible when the file is closed, need to reopen
-            f_obj = open_file_or_filename(self.filename)
-            dset = h5py.File(f_obj, "r")[key]
-            dset_data = from_h5_array(dset)
-            attrs = self._attrs_cache.get(key, dset.attrs)
-            if dset.ndim == 2:
+            # these datasets are closed and inaccessible when the file is closed,
+            # read them through the shared pool of open files instead
+            with FILE_POOL.open(self.filename) as file_handle:
+                dset = file_handle[key]
+                pooled_dset = _PooledH5Dataset(self.filename, dset.name, dset.shape, dset.dtype, dset.chunks)
+                attrs = self._attrs_cache.get(key)
+                if attrs is None:
+                    attrs = dict(dset.attrs)
+            dset_data = _from_pooled_h5_array(pooled_dset)
+            if pooled_dset.ndim == 2:
                 return xr.DataArray(dset_data, dims=["y", "x"], attrs=attrs)
             return xr.DataArray(dset_data, attrs=attrs)
 
@@ -126,10 +272,18 @@ class HDF5FileHandler(BaseFileHandler):
 
 def from_h5_array(h5dset):
     """Create a dask array from an h5py dataset, ensuring uniqueness of the dask array name."""
+    return _dask_array_from_dataset(h5dset, os.fspath(h5dset.file.filename))
+
+
+def _from_pooled_h5_array(pooled_dset):
+    return _dask_array_from_dataset(pooled_dset, os.fspath(pooled_dset.filename))
+
+
+def _dask_array_from_dataset(dset, filename):
     chunk_size = dc.get("array.chunk-size")
 
-    chunks = normalize_chunks(chunk_size, dtype=h5dset.dtype, previous_chunks=h5dset.chunks, shape=h5dset.shape)
-    name = h5dset.name + "-" + tokenize(os.fspath(h5dset.file.filename), h5dset.name, chunks)
+    chunks = normalize_chunks(chunk_size, dtype=dset.dtype, previous_chunks=dset.chunks, shape=dset.shape)
+    name = dset.name + "-" + tokenize(filename, dset.name, chunks)
 
-    dset_data = da.from_array(h5dset, chunks=chunks, name=name)
+    dset_data = da.from_array(dset, chunks=chunks, name=name)
     return dset_data
@@ -101,6 +101,9 @@ def _modis_date(date):
 class HDFEOSBaseFileReader(BaseFileHandler):
     """Base file handler for HDF EOS data for both L1b and L2 products."""
 
+    # the HDF4 library is not thread-safe
+    thread_safe_init = False
+
     def __init__(self, filename, filename_info, filetype_info, **kwargs):
         """Initialize the base reader."""
         BaseFileHandler.__init__(self, filename, filename_info, filetype_info)
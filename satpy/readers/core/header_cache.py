@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""On-disk cache of parsed file headers.
+
+Many file handlers parse a binary header when they are created or when a
+dataset is loaded. When the same files are processed several times, for
+example to produce different products from the same archive, this parsing is
+repeated every time. With the ``cache_file_headers`` setting enabled (see
+:doc:`../../config`), the parsed headers are stored in
+``<cache_dir>/file_headers`` and reused as long as the path, modification
+time and size of the file are unchanged. When the cached headers take more
+than ``file_header_cache_max_size`` bytes, the least recently used ones are
+removed. The cache is only checked after about a tenth of this maximum size
+was written to it, so it can temporarily be somewhat larger.
+
+File handlers use this through :func:`cached_file_header`::
+
+    self.header = cached_file_header(self.filename, "my_reader.header", read_header, self.filename)
+
+The cached values are stored with :mod:`pickle`, so the cache directory must
+only be writable by trusted users.
+
+"""
+
+import hashlib
+import logging
+import os
+import pickle  # nosec B403
+import shutil
+import tempfile
+from typing import Any, Callable
+
+import satpy
+
+LOG = logging.getLogger(__name__)
+
+CACHE_CONFIG_KEY = "cache_file_headers"
+CACHE_SUBDIR = "file_headers"
+# increase when the layout of the stored entries, or of the values cached by a reader, changes
+CACHE_FORMAT_VERSION = 2
+
+# bytes written to the cache by this process since the last eviction
+_bytes_written = 0
+
+
+def cached_file_header(filename, key: str, read_func: Callable, *args, **kwargs) -> Any:
+    """Get the header of a file from the cache or by calling ``read_func``.
+
+    Args:
+        filename: File the header belongs to. Files that can not be checked
+            with :func:`os.stat` (for example remote files) are never cached.
+        key: Name identifying what is cached, for example
+            ``"seviri_l1b_native.header"``. Different readers or different
+            parts of the same file must use different keys.
+        read_func: Function reading the header from the file. It is called
+            with ``args`` and ``kwargs`` and its result must be picklable.
+        args: Positional arguments for ``read_func``.
+        kwargs: Keyword arguments for ``read_func``.
+
+    Returns:
+        The result of ``read_func``, possibly loaded from the cache.
+
+    """
+    if not satpy.config.get(CACHE_CONFIG_KEY, False):
+        return read_func(*args, **kwargs)
+    cache_path = _get_cache_path(filename, key)
+    if cache_path is None:
+        return read_func(*args, **kwargs)
+
+    try:
+        with open(cache_path, "rb") as cache_file:
+            header = pickle.load(cache_file)  # nosec B301
+    except FileNotFoundError:
+        pass
+    except Exception as err:
+        LOG.debug("Ignoring unreadable header cache file %s: %s", cache_path, err)
+    else:
+        _touch(cache_path)
+        return header
+
+    header = read_func(*args, **kwargs)
+    _write_cache_file(cache_path, header)
+    return header
+
+
+def _touch(cache_path):
+    # the modification time of the cache files is used for the LRU eviction
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+
+
+def _get_cache_path(filename, key):
+    try:
+        path = os.path.abspath(os.fspath(filename))
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    cache_id = (CACHE_FORMAT_VERSION, satpy.__version__, key, path, stat.st_mtime_ns, stat.st_size)
+    file_hash = hashlib.sha1(repr(cache_id).encode("utf-8"), usedforsecurity=False).hexdigest()
+    return os.path.join(get_cache_dir(), file_hash[:2], file_hash + ".pkl")
+
+
+def _write_cache_file(cache_path, header):
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first so concurrent readers never see partial files
+        with tempfile.NamedTemporaryFile("wb", dir=cache_dir, suffix=".tmp", delete=False) as tmp_file:
+            pickle.dump(header, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            num_bytes = tmp_file.tell()
+        os.replace(tmp_file.name, cache_path)
+    except (OSError, pickle.PicklingError, AttributeError, TypeError) as err:
+        LOG.debug("Could not cache file header to %s: %s", cache_path, err)
+        try:
+            os.remove(tmp_file.name)
+        except (OSError, NameError):
+            pass
+        return
+    _evict_if_needed(num_bytes, cache_path)
+
+
+def _evict_if_needed(num_bytes, cache_path):
+    """Evict old entries once a tenth of the maximum size was written, instead of scanning the cache every time."""
+    global _bytes_written
+    max_size = satpy.config.get("file_header_cache_max_size", None)
+    if max_size is None:
+        return
+    _bytes_written += num_bytes
+    if _bytes_written >= max_size // 10:
+        _bytes_written = 0
+        evict(keep=cache_path)
+
+
+def _get_cache_entries():
+    """Get the paths, modification times and sizes of the cache files, least recently used first."""
+    entries = []
+    try:
+        sub_dirs = list(os.scandir(get_cache_dir()))
+    except FileNotFoundError:
+        return entries
+    for sub_dir in sub_dirs:
+        try:
+            files = list(os.scandir(sub_dir.path))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for cache_file in files:
+            if not cache_file.name.endswith(".pkl"):
+                continue
+            try:
+                stat = cache_file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((cache_file.path, stat.st_mtime, stat.st_size))
+    return sorted(entries, key=lambda entry: entry[1])
+
+
+def evict(keep=None) -> int:
+    """Remove the least recently used cached headers until the cache fits into ``file_header_cache_max_size``.
+
+    Args:
+        keep: Path of a cache file that must not be removed, usually the one
+            that was just written.
+
+    Returns:
+        Number of removed cache files.
+
+    """
+    max_size = satpy.config.get("file_header_cache_max_size", None)
+    if max_size is None:
+        return 0
+    entries = _get_cache_entries()
+    total_size = sum(size for _, _, size in entries)
+    num_evicted = 0
+    for path, _, size in entries:
+        if total_size <= max_size:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+        num_evicted += 1
+    return num_evicted
+
+
+def get_cache_dir() -> str:
+    """Get the directory where file headers are cached."""
+    return os.path.join(satpy.config.get("cache_dir"), CACHE_SUBDIR)
+
+
+def clear_cache():
+    """Remove all cached file headers."""
+    shutil.rmtree(get_cache_dir(), ignore_errors=True)
@@ -28,6 +28,8 @@ compressed hrit files are encountered (files finishing with `.C_`).
 import datetime as dt
 import logging
 import os
+from contextlib import contextmanager
+from io import BytesIO
 
 import dask
 import dask.array as da
@@ -38,6 +40,7 @@ from pyresample import geometry
 import satpy.readers.core.utils as utils
 from satpy.readers.core.eum import time_cds_short
 from satpy.readers.core.file_handlers import BaseFileHandler
+from satpy.readers.core.header_cache import cached_file_header
 from satpy.readers.core.seviri import dec10216
 
 logger = logging.getLogger("hrit_base")
@@ -130,6 +133,24 @@ class HRITFileHandler(BaseFileHandler):
 
     def _get_hd(self, hdr_info, verbose=False):
         """Open the file, read and get the basic file header info and set the mda dictionary."""
+        cache_key = f"{type(self).__module__}.{type(self).__name__}.header"
+        if verbose:
+            self.mda.update(self._read_hd(hdr_info, verbose=True))
+        else:
+            self.mda.update(cached_file_header(self.filename, cache_key, self._read_hd, hdr_info))
+
+        self.mda.setdefault("number_of_bits_per_pixel", 10)
+
+        self.mda["projection_parameters"] = {"a": 6378169.00,
+                                             "b": 6356583.80,
+                                             "h": 35785831.00,
+                                             # FIXME: find a reasonable SSP
+                                             "SSP_longitude": 0.0}
+        self.mda["orbital_parameters"] = {}
+
+    def _read_hd(self, hdr_info, verbose=False):
+        """Read the raw header records of the file into a new dictionary."""
+        mda = {}
         hdr_map, variable_length_headers, text_headers = hdr_info
         with utils.generic_open(self.filename, mode="rb") as fp:
             total_header_length = 16
@@ -146,12 +167,12 @@ class HRITFileHandler(BaseFileHandler):
                     if verbose:
                         print(f"np.zeros(({field_length}, ), dtype={the_type}),")  # noqa: T201
                     key = variable_length_headers[the_type]
-                    if key in self.mda:
-                        if not isinstance(self.mda[key], list):
-                            self.mda[key] = [self.mda[key]]
-                        self.mda[key].append(current_hdr)
+                    if key in mda:
+                        if not isinstance(mda[key], list):
+                            mda[key] = [mda[key]]
+                        mda[key].append(current_hdr)
                     else:
-                        self.mda[key] = current_hdr
+                        mda[key] = current_hdr
                 elif the_type in text_headers:
                     field_length = int((hdr_id["record_length"] - 3) /
                                        the_type.itemsize)
@@ -160,24 +181,16 @@ class HRITFileHandler(BaseFileHandler):
                     current_hdr = get_header_content(fp, new_type)[0]
                     if verbose:
                         print(f'np.array({current_hdr}, dtype="{new_type}"),')  # noqa: T201
-                    self.mda[text_headers[the_type]] = current_hdr
+                    mda[text_headers[the_type]] = current_hdr
                 else:
                     current_hdr = get_header_content(fp, the_type)[0]
                     if verbose:
                         print(f"np.void({current_hdr}, dtype={the_type}),")  # noqa: T201
-                    self.mda.update(
+                    mda.update(
                         dict(zip(current_hdr.dtype.names, current_hdr)))
 
-                total_header_length = self.mda["total_header_length"]
-
-        self.mda.setdefault("number_of_bits_per_pixel", 10)
-
-        self.mda["projection_parameters"] = {"a": 6378169.00,
-                                             "b": 6356583.80,
-                                             "h": 35785831.00,
-                                             # FIXME: find a reasonable SSP
-                                             "SSP_longitude": 0.0}
-        self.mda["orbital_parameters"] = {}
+                total_header_length = mda["total_header_length"]
+        return mda
 
     @property
     def observation_start_time(self):
@@ -303,6 +316,10 @@ def _read_data(filename, mda):
 class HRITSegment:
     """An HRIT segment with data."""
 
+    #: Number of pixels unpacked at once, must be a multiple of 8 to keep
+    #: the chunks aligned on byte and 10-bit word boundaries.
+    chunk_pixels = 2 ** 20
+
     def __init__(self, filename, mda):
         """Set up the segment."""
         self.filename = filename
@@ -315,55 +332,59 @@ class HRITSegment:
         self.zipped = os.fspath(filename).endswith(".bz2")
 
     def read_data(self):
-        """Read the data."""
-        data = self._read_data_from_file()
-        if self.bpp == 10:
-            data = dec10216(data)
-        data = data.reshape((self.lines, self.cols))
-        return data
+        """Read the data.
 
-    def _read_data_from_file(self):
+        The data is read and unpacked in chunks of :attr:`chunk_pixels` pixels
+        which are written directly into the preallocated output array, so
+        that no full size intermediate copies of the raw data are needed.
+        """
+        output = np.empty(int(self.lines) * int(self.cols), dtype=self._get_output_dtype())
+        with self._open_data() as fp:
+            fp.seek(int(self.offset))
+            self._unpack_into(fp, output)
+        return output.reshape((self.lines, self.cols))
+
+    def _get_output_dtype(self):
+        return np.uint8 if self.bpp == 8 else np.uint16
+
+    @contextmanager
+    def _open_data(self):
+        """Open the segment, decompressing it if needed, and yield a file object.
+
+        Wavelet compressed segments are decompressed in full before being
+        unpacked, as pyPublicDecompWT can only decompress whole buffers.
+        Segments are read in separate dask tasks, so they are still
+        decompressed in parallel by the dask scheduler.
+        """
         if self._is_file_like():
-            return self._read_file_like()
-        return self._read_data_from_disk()
+            with utils.generic_open(self.filename, mode="rb") as fp:
+                if self.compressed:
+                    yield BytesIO(decompress_buffer(fp.read()))
+                else:
+                    yield fp
+            return
+        # For reading the image data, unzip_context is faster than generic_open
+        with utils.unzip_context(self.filename) as fn:
+            if self.compressed:
+                yield BytesIO(decompress_file(fn))
+            else:
+                with open(fn, mode="rb") as fp:
+                    yield fp
 
     def _is_file_like(self):
         return not isinstance(self.filename, str)
 
-    def _read_data_from_disk(self):
-        # For reading the image data, unzip_context is faster than generic_open
-        dtype, shape = self._get_input_info()
-        with utils.unzip_context(self.filename) as fn:
-
-            if self.compressed:
-                return np.frombuffer(
-                    decompress_file(fn),
-                    offset=self.offset,
-                    dtype=dtype,
-                    count=np.prod(shape)
-                )
+    def _unpack_into(self, fp, output):
+        """Read the packed pixels from *fp* chunk by chunk and unpack them into *output*."""
+        input_dtype, _ = self._get_input_info()
+        for start in range(0, output.size, self.chunk_pixels):
+            stop = min(start + self.chunk_pixels, output.size)
+            nbytes = -(-(stop - start) * int(self.bpp) // 8)
+            raw = np.frombuffer(fp.read(nbytes), dtype=input_dtype)
+            if self.bpp == 10:
+                dec10216(raw, out=output[start:stop])
             else:
-                return np.fromfile(
-                    fn,
-                    offset=self.offset,
-                    dtype=dtype,
-                    count=np.prod(shape)
-                )
-
-    def _read_file_like(self):
-        # filename is likely to be a file-like object, already in memory
-        dtype, shape = self._get_input_info()
-        with utils.generic_open(self.filename, mode="rb") as fp:
-            decompressed_buffer = fp.read()
-            if self.compressed:
-                decompressed_buffer = decompress_buffer(decompressed_buffer)
-            no_elements = np.prod(shape)
-            return np.frombuffer(
-                decompressed_buffer,
-                dtype=np.dtype(dtype),
-                count=no_elements.item(),
-                offset=self.offset
-            ).reshape(shape)
+                output[start:stop] = raw
 
     def _get_input_info(self):
         total_bits = int(self.lines) * int(self.cols) * int(self.bpp)
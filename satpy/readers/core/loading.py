@@ -22,9 +22,13 @@ import yaml
 from satpy.readers.core.yaml_reader import AbstractYAMLReader
 
 from .config import configs_for_reader
+from .registry import get_reader_registry
 
 LOG = logging.getLogger(__name__)
 
+# reader keyword arguments that are not passed on to the file handlers
+READER_ONLY_KWARGS = ("filter_parameters", "parallel_init")
+
 
 def load_readers(filenames=None, reader=None, reader_kwargs=None):
     """Create specified readers and assign files to them.
@@ -53,8 +57,12 @@ def load_readers(filenames=None, reader=None, reader_kwargs=None):
     if reader_kwargs is None:
         reader_kwargs = {}
 
+    # without a reader name, only create the readers whose patterns match some files
+    registry = get_reader_registry() if reader is None else None
     for idx, reader_configs in enumerate(configs_for_reader(reader)):
         readers_files = _get_readers_files(filenames, reader, idx, remaining_filenames)
+        if registry is not None and not _reader_may_match(registry, reader_configs, readers_files):
+            continue
         reader_instance = _get_reader_instance(reader, reader_configs, idx, reader_kwargs)
         if reader_instance is None or not readers_files:
             # Reader initiliasation failed or no files were given
@@ -82,6 +90,14 @@ def _get_readers_files(filenames, reader, idx, remaining_filenames):
     return remaining_filenames
 
 
+def _reader_may_match(registry, reader_configs, filenames):
+    reader_name = registry.reader_for_config_files(reader_configs)
+    if reader_name is None:
+        # not in the registry, let the reader itself decide
+        return True
+    return bool(registry.files_for_reader(reader_name, filenames, check_parse=False))
+
+
 def _get_reader_instance(reader, reader_configs, idx, reader_kwargs):
     reader_instance = None
     try:
@@ -170,6 +186,7 @@ def _get_reader_kwargs(reader, reader_kwargs):
     reader_kwargs_without_filter = {}
     for (k, v) in reader_kwargs.items():
         reader_kwargs_without_filter[k] = v.copy()
-        reader_kwargs_without_filter[k].pop("filter_parameters", None)
+        for reader_only_kwarg in READER_ONLY_KWARGS:
+            reader_kwargs_without_filter[k].pop(reader_only_kwarg, None)
 
     return (reader_kwargs, reader_kwargs_without_filter)
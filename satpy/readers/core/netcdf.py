@@ -25,6 +25,7 @@ import numpy as np
 import xarray as xr
 
 from satpy.readers.core.file_handlers import BaseFileHandler
+from satpy.readers.core.header_cache import cached_file_header
 from satpy.readers.core.remote import open_file_or_filename
 from satpy.readers.core.utils import np2str
 from satpy.utils import get_legacy_chunk_size
@@ -88,6 +89,9 @@ class NetCDF4FileHandler(BaseFileHandler):
 
     """
 
+    # the netCDF-C library is not thread-safe
+    thread_safe_init = False
+
     file_handle = None
 
     def __init__(self, filename, filename_info, filetype_info,
@@ -109,12 +113,7 @@ class NetCDF4FileHandler(BaseFileHandler):
         self._set_file_handle_auto_maskandscale(file_handle, auto_maskandscale)
         self._set_xarray_kwargs(xarray_kwargs, auto_maskandscale)
 
-        listed_variables = filetype_info.get("required_netcdf_variables")
-        if listed_variables:
-            self._collect_listed_variables(file_handle, listed_variables)
-        else:
-            self.collect_metadata("", file_handle)
-            self.collect_dimensions("", file_handle)
+        self._collect_file_content(file_handle)
         self.collect_cache_vars(cache_var_size)
 
         if cache_handle:
@@ -125,6 +124,33 @@ class NetCDF4FileHandler(BaseFileHandler):
     def _get_file_handle(self):
         return netCDF4.Dataset(self.filename, "r")
 
+    def _collect_file_content(self, file_handle):
+        """Collect the file content, using the file header cache if enabled.
+
+        Only the attributes, dimensions, shapes and data types are cached.
+        The variable and group objects are always taken from the open file.
+        """
+        listed_variables = self.filetype_info.get("required_netcdf_variables")
+        cache_key = "netcdf4.file_content.{!r}.{!r}".format(
+            listed_variables, self.filetype_info.get("variable_name_replacements"))
+        content = cached_file_header(self.filename, cache_key, self._read_file_content,
+                                     file_handle, listed_variables)
+        if self.file_content:
+            # the content was just read from the file
+            return
+        for key, value in content:
+            self.file_content[key] = file_handle[key] if isinstance(value, _FileObject) else value
+
+    def _read_file_content(self, file_handle, listed_variables):
+        """Collect the file content and return it in a form that can be cached."""
+        if listed_variables:
+            self._collect_listed_variables(file_handle, listed_variables)
+        else:
+            self.collect_metadata("", file_handle)
+            self.collect_dimensions("", file_handle)
+        return [(key, _FileObject() if isinstance(value, (netCDF4.Variable, netCDF4.Group)) else value)
+                for key, value in self.file_content.items()]
+
     @staticmethod
     def _set_file_handle_auto_maskandscale(file_handle, auto_maskandscale):
         if hasattr(file_handle, "set_auto_maskandscale"):
@@ -378,6 +404,10 @@ class NetCDF4FileHandler(BaseFileHandler):
         return self.cached_file_content[var_name]
 
 
+class _FileObject:
+    """Placeholder for a variable or group object in the cached file content."""
+
+
 def _compose_replacement_names(variable_name_replacements, var, variable_names):
     for key in variable_name_replacements:
         vals = variable_name_replacements[key]
@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Lightweight registry of the filename patterns of all readers.
+
+Finding out which reader can read a file used to mean creating a reader
+object, and thus importing the file handler modules, for every reader
+configured. The :class:`ReaderRegistry` only holds the name, sensors and
+filename patterns of every reader, read from the reader YAML files without
+constructing any Python object, and the compiled matchers for these
+patterns::
+
+    >>> from satpy.readers.core.registry import get_reader_registry
+    >>> get_reader_registry().match_files(["OR_ABI-L1b-RadF-M6C01_G16_s20192000000_e20192000010_c20192000020.nc"])
+    {'abi_l1b': {'OR_ABI-L1b-RadF-M6C01_G16_s20192000000_e20192000010_c20192000020.nc'}}
+
+The registry is built once per process and configuration (``config_path``
+and plugin readers), and stored as JSON in ``<cache_dir>/reader_registry`` so
+that other processes can load it without reading the YAML files. It is
+rebuilt automatically when any of the reader YAML files changes.
+
+:func:`~satpy.readers.core.loading.load_readers` and
+:func:`~satpy.readers.core.grouping.group_files` use it to only create the
+readers whose patterns match some of the files when no reader is specified.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from fnmatch import translate
+
+import yaml
+from trollsift.parser import globify, parse
+from yaml.loader import BaseLoader
+
+import satpy
+from satpy import _startup_profile
+from satpy.utils import recursive_dict_update
+
+from .config import configs_for_reader
+from .yaml_reader import _get_filebase
+
+LOG = logging.getLogger(__name__)
+
+CACHE_SUBDIR = "reader_registry"
+# increase when the layout of the stored registry changes
+CACHE_FORMAT_VERSION = 1
+
+_REGISTRIES: dict[str, ReaderRegistry] = {}
+
+
+class ReaderRegistry:
+    """Filename patterns and sensors of readers.
+
+    Args:
+        readers: Dictionary of reader names to dictionaries with the
+            ``config_files``, ``sensors`` and ``file_patterns`` of the reader.
+
+    """
+
+    def __init__(self, readers: dict[str, dict]):
+        """Hold on to the reader information, matchers are compiled when needed."""
+        self.readers = readers
+        self._matchers: dict[str, list] = {}
+        self._names_by_config_files = {tuple(reader_info["config_files"]): reader_name
+                                       for reader_name, reader_info in readers.items()}
+
+    @classmethod
+    def from_reader_configs(cls, all_reader_configs) -> ReaderRegistry:
+        """Build the registry from lists of reader configuration files."""
+        readers = {}
+        for reader_configs in all_reader_configs:
+            try:
+                reader_info = _read_reader_patterns(reader_configs)
+            except (KeyError, IOError, yaml.YAMLError):
+                LOG.debug("Could not read reader config from: %s", reader_configs, exc_info=True)
+                continue
+            readers[reader_info.pop("name")] = reader_info
+        return cls(readers)
+
+    def _get_matchers(self, reader_name):
+        try:
+            return self._matchers[reader_name]
+        except KeyError:
+            matchers = [(pattern, re.compile(translate(os.path.normcase(globify(pattern)))).match)
+                        for pattern in self.readers[reader_name]["file_patterns"]]
+            self._matchers[reader_name] = matchers
+            return matchers
+
+    def reader_for_config_files(self, config_files) -> str | None:
+        """Get the name of the reader configured by *config_files*."""
+        return self._names_by_config_files.get(tuple(config_files))
+
+    def files_for_reader(self, reader_name: str, filenames, check_parse: bool = True) -> set:
+        """Get the files in *filenames* matching one of the filename patterns of the reader.
+
+        Args:
+            reader_name: Name of the reader.
+            filenames: Paths of the files to check.
+            check_parse: Also check that the filename can be parsed with the
+                matching pattern, like the readers do. Without it, the result
+                may contain some files the reader would not accept.
+
+        """
+        matching = set()
+        filenames = set(filenames)
+        for pattern, match in self._get_matchers(reader_name):
+            for filename in filenames:
+                filebase = _get_filebase(filename, pattern)
+                if not match(os.path.normcase(filebase)):
+                    continue
+                if check_parse:
+                    try:
+                        parse(pattern, filebase)
+                    except ValueError:
+                        continue
+                matching.add(filename)
+            filenames -= matching
+        return matching
+
+    def match_files(self, filenames, readers=None, sensor=None) -> dict[str, set]:
+        """Assign files to the readers that can read them.
+
+        Each file is assigned to the first reader, in alphabetical order or in
+        the order of *readers*, whose filename patterns match it.
+
+        Args:
+            filenames: Paths of the files to assign.
+            readers: Names of the readers to consider, all readers if not
+                provided.
+            sensor: Only consider readers for this sensor or these sensors.
+
+        Returns:
+            Dictionary of reader names and the files matching these readers,
+            readers without matching files are not included. Files matching
+            no reader are not included either.
+
+        """
+        remaining = set(filenames)
+        reader_files = {}
+        for reader_name in readers if readers is not None else sorted(self.readers):
+            if not remaining:
+                break
+            if reader_name not in self.readers or not self._supports_sensor(reader_name, sensor):
+                continue
+            matching = self.files_for_reader(reader_name, remaining)
+            if matching:
+                reader_files[reader_name] = matching
+                remaining -= matching
+        return reader_files
+
+    def _supports_sensor(self, reader_name, sensor):
+        if sensor is None:
+            return True
+        sensors = {sensor} if isinstance(sensor, str) else set(sensor)
+        return bool(sensors & set(self.readers[reader_name]["sensors"]))
+
+    def to_json(self) -> str:
+        """Serialize the registry to JSON."""
+        return json.dumps({"version": CACHE_FORMAT_VERSION, "readers": self.readers})
+
+    @classmethod
+    def from_json(cls, json_str: str) -> ReaderRegistry:
+        """Load a registry serialized with :meth:`to_json`."""
+        content = json.loads(json_str)
+        if content.get("version") != CACHE_FORMAT_VERSION:
+            raise ValueError("Unsupported reader registry version")
+        return cls(content["readers"])
+
+
+def _read_reader_patterns(reader_configs):
+    """Read the reader name, sensors and filename patterns without constructing Python objects."""
+    config: dict = {}
+    for config_file in reader_configs:
+        start = time.perf_counter()
+        with open(config_file, "r", encoding="utf-8") as fd:
+            recursive_dict_update(config, yaml.load(fd, Loader=BaseLoader))  # nosec B506
+        _startup_profile.record_config_time(config_file, time.perf_counter() - start)
+    reader_info = config["reader"]
+    file_patterns = []
+    for filetype_info in (config.get("file_types") or {}).values():
+        file_patterns.extend(os.path.join(*pattern.split("/"))
+                             for pattern in filetype_info.get("file_patterns", []))
+    sensors = reader_info.get("sensors") or []
+    return {
+        "name": reader_info["name"],
+        "config_files": list(reader_configs),
+        "sensors": [sensors] if isinstance(sensors, str) else list(sensors),
+        "file_patterns": file_patterns,
+    }
+
+
+def get_reader_registry() -> ReaderRegistry:
+    """Get the registry of all readers available with the current configuration.
+
+    The registry is kept in memory and on disk, and is rebuilt when the
+    reader configuration files change.
+
+    """
+    all_reader_configs = list(configs_for_reader())
+    registry_id = _get_registry_id(all_reader_configs)
+    try:
+        return _REGISTRIES[registry_id]
+    except KeyError:
+        pass
+
+    cache_path = os.path.join(get_cache_dir(), registry_id + ".json")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            registry = ReaderRegistry.from_json(cache_file.read())
+    except (OSError, ValueError, KeyError):
+        registry = ReaderRegistry.from_reader_configs(all_reader_configs)
+        _write_registry(cache_path, registry)
+    _REGISTRIES[registry_id] = registry
+    return registry
+
+
+def _get_registry_id(all_reader_configs):
+    file_ids = []
+    for reader_configs in sorted(all_reader_configs):
+        for config_file in reader_configs:
+            try:
+                stat = os.stat(config_file)
+            except OSError:
+                file_ids.append((config_file, None, None))
+                continue
+            file_ids.append((config_file, stat.st_mtime_ns, stat.st_size))
+    registry_id = (CACHE_FORMAT_VERSION, satpy.__version__, file_ids)
+    return hashlib.sha1(repr(registry_id).encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _write_registry(cache_path, registry):
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first so concurrent readers never see partial files
+        with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp", delete=False,
+                                         encoding="utf-8") as tmp_file:
+            tmp_file.write(registry.to_json())
+        os.replace(tmp_file.name, cache_path)
+    except OSError as err:
+        LOG.debug("Could not store the reader registry in %s: %s", cache_path, err)
+        try:
+            os.remove(tmp_file.name)
+        except (OSError, NameError):
+            pass
+
+
+def clear_registries():
+    """Forget the registries kept in memory, the ones stored on disk are kept."""
+    _REGISTRIES.clear()
+
+
+def get_cache_dir() -> str:
+    """Get the directory where reader registries are stored."""
+    return os.path.join(satpy.config.get("cache_dir"), CACHE_SUBDIR)
@@ -456,7 +456,7 @@ def add_scanline_acq_time(dataset, acq_time):
         "long_name"] = "Mean scanline acquisition time"
 
 
-def dec10216(inbuf):
+def dec10216(inbuf, out=None, lines=None):
     """Decode 10 bits data into 16 bits words.
 
     ::
@@ -475,26 +475,82 @@ def dec10216(inbuf):
         op[2] = (ip[2] & 0x0F)*64 + ip[3]/4;
         op[3] = (ip[3] & 0x03)*256 +ip[4];
 
+    Args:
+        inbuf: Packed data as uint8 numpy or dask array. Either a 1D buffer,
+            or a 2D array with one packed image line per row, in which case
+            the number of bytes per line must be a multiple of 5 and the
+            result is 2D as well.
+        out: Optional numpy array of dtype uint16 to unpack into, with 4
+            words for every 5 bytes of (the selected lines of) ``inbuf``.
+            Not supported for dask arrays.
+        lines: Optional slice of the lines (rows) of a 2D ``inbuf`` to
+            unpack, for example to only read a region of interest.
+
+    Returns:
+        The unpacked data, ``out`` if it was given.
+
     """
-    arr10 = inbuf.astype(np.uint16)
-    arr16_len = int(len(arr10) * 4 / 5)
-    arr10_len = int((arr16_len * 5) / 4)
-    arr10 = arr10[:arr10_len]  # adjust size
-
-    # dask is slow with indexing
-    arr10_0 = arr10[::5]
-    arr10_1 = arr10[1::5]
-    arr10_2 = arr10[2::5]
-    arr10_3 = arr10[3::5]
-    arr10_4 = arr10[4::5]
-
-    arr16_0 = (arr10_0 << 2) + (arr10_1 >> 6)
-    arr16_1 = ((arr10_1 & 63) << 4) + (arr10_2 >> 4)
-    arr16_2 = ((arr10_2 & 15) << 6) + (arr10_3 >> 2)
-    arr16_3 = ((arr10_3 & 3) << 8) + arr10_4
-    arr16 = np.stack([arr16_0, arr16_1, arr16_2, arr16_3], axis=-1).ravel()
-
-    return arr16
+    if lines is not None:
+        inbuf = inbuf[lines]
+    if isinstance(inbuf, da.Array):
+        if out is not None:
+            raise ValueError("Unpacking into an output array is not supported for dask arrays.")
+        return _dec10216_dask(inbuf)
+    inbuf = np.asarray(inbuf)
+    out_shape = _get_dec10216_shape(inbuf.shape)
+    if out is None:
+        out = np.empty(out_shape, dtype=np.uint16)
+    elif out.shape != out_shape or out.dtype != np.uint16:
+        raise ValueError(f"Output array must be uint16 with shape {out_shape}, "
+                         f"got {out.dtype} with shape {out.shape}.")
+    _unpack_10bit_groups(inbuf, out)
+    return out
+
+
+# number of 5 byte groups unpacked at once, keeps the temporaries cache sized
+_DEC10216_BLOCK_GROUPS = 16384
+
+
+def _get_dec10216_shape(in_shape):
+    if len(in_shape) == 1:
+        return (in_shape[0] // 5 * 4,)
+    if in_shape[-1] % 5:
+        raise ValueError(f"Number of bytes per line must be a multiple of 5, got {in_shape[-1]}.")
+    return in_shape[:-1] + (in_shape[-1] // 5 * 4,)
+
+
+def _unpack_10bit_groups(inbuf, out):
+    """Unpack the 5 byte groups of *inbuf* into *out* block by block."""
+    groups = inbuf.reshape(-1)[:out.size // 4 * 5].reshape(-1, 5)
+    if not out.flags.c_contiguous:
+        raise ValueError("Output array must be C-contiguous.")
+    words = out.reshape(-1, 4)
+    for start in range(0, len(groups), _DEC10216_BLOCK_GROUPS):
+        in5 = groups[start:start + _DEC10216_BLOCK_GROUPS]
+        out4 = words[start:start + _DEC10216_BLOCK_GROUPS]
+        np.left_shift(in5[:, 0], 2, out=out4[:, 0], dtype=np.uint16)
+        out4[:, 0] |= in5[:, 1] >> 6
+        np.bitwise_and(in5[:, 1], 63, out=out4[:, 1], dtype=np.uint16)
+        out4[:, 1] <<= 4
+        out4[:, 1] |= in5[:, 2] >> 4
+        np.bitwise_and(in5[:, 2], 15, out=out4[:, 2], dtype=np.uint16)
+        out4[:, 2] <<= 6
+        out4[:, 2] |= in5[:, 3] >> 2
+        np.bitwise_and(in5[:, 3], 3, out=out4[:, 3], dtype=np.uint16)
+        out4[:, 3] <<= 8
+        out4[:, 3] |= in5[:, 4]
+
+
+def _dec10216_dask(inbuf):
+    """Unpack a dask array block-wise, with blocks aligned on 5 byte groups."""
+    if inbuf.ndim == 1:
+        inbuf = inbuf[:len(inbuf) // 5 * 5]
+        inbuf = inbuf.rechunk(max(inbuf.chunksize[0] // 5, 1) * 5)
+        chunks = (tuple(size // 5 * 4 for size in inbuf.chunks[0]),)
+    else:
+        inbuf = inbuf.rechunk({-1: -1})
+        chunks = inbuf.chunks[:-1] + ((_get_dec10216_shape(inbuf.shape)[-1],),)
+    return da.map_blocks(dec10216, inbuf, chunks=chunks, dtype=np.uint16, meta=np.array((), dtype=np.uint16))
 
 
 class MpefProductHeader(object):
@@ -21,16 +21,17 @@ import glob
 import itertools
 import logging
 import os
+import threading
 import warnings
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from fnmatch import fnmatch
 from weakref import WeakValueDictionary
 
 import numpy as np
 import xarray as xr
-import yaml
 from pyresample.boundary import AreaDefBoundary, Boundary
 from pyresample.geometry import AreaDefinition, StackedAreaDefinition, SwathDefinition
 from trollsift.parser import globify, parse
@@ -42,12 +43,12 @@ except ImportError:
 
 from satpy import DatasetDict
 from satpy._compat import cache
+from satpy._yaml_cache import load_merged_yaml_files
 from satpy.area import get_area_def
 from satpy.aux_download import DataDownloadMixin
 from satpy.coords import add_crs_xy_coords
 from satpy.dataset import DataID, DataQuery, get_key
 from satpy.dataset.dataid import default_co_keys_config, default_id_keys_config, get_keys_from_config
-from satpy.utils import recursive_dict_update
 
 logger = logging.getLogger(__name__)
 
@@ -113,11 +114,8 @@ def load_yaml_configs(*config_files, loader=Loader):
         YAML pathnames that were merged).
 
     """
-    config = {}
     logger.debug("Reading %s", str(config_files))
-    for config_file in config_files:
-        with open(config_file, "r", encoding="utf-8") as fd:
-            recursive_dict_update(config, yaml.load(fd, Loader=loader))
+    config = load_merged_yaml_files(config_files, loader=loader)
     _verify_reader_info_assign_config_files(config, config_files)
     return config
 
@@ -456,6 +454,17 @@ class GenericYAMLReader(AbstractYAMLReader):
         return True
 
 
+_SERIAL_INIT_LOCK = threading.Lock()
+
+
+def _serialized(func):
+    """Make calls to *func* from different threads run one at a time."""
+    def _locked(*args, **kwargs):
+        with _SERIAL_INIT_LOCK:
+            return func(*args, **kwargs)
+    return _locked
+
+
 class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
     """Primary reader base class that is configured by a YAML file.
 
@@ -466,6 +475,17 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
     its base class and can be used as a reader by itself and requires no
     subclassing.
 
+    File handlers are created one file at a time by default. Passing
+    ``parallel_init=N`` (for example with
+    ``Scene(..., reader_kwargs={"parallel_init": 8})``) creates the file
+    handlers of each file type in a pool of ``N`` threads instead. This
+    mostly helps readers whose file handlers parse large headers or walk the
+    file structure when they are created. The resulting file handlers and
+    their order are the same as when they are created sequentially. File
+    handler classes with a false ``thread_safe_init`` attribute, like the
+    ones based on the netCDF4 and HDF4 libraries, are still created one at
+    a time.
+
     """
 
     # WeakValueDictionary objects must be created at the class level or else
@@ -476,12 +496,15 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
                  config_dict,
                  filter_parameters=None,
                  filter_filenames=True,
+                 parallel_init=None,
                  **kwargs):
         """Set up initial internal storage for loading file data."""
         super().__init__(config_dict, filter_parameters, filter_filenames)
 
+        self.parallel_init = parallel_init
         self.file_handlers = {}
         self.available_ids = {}
+        self._fh_kwargs = None
         self.register_data_files()
 
     @property
@@ -575,6 +598,26 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
         if fh_kwargs is None:
             fh_kwargs = {}
 
+        def _create_filehandler(fh_args):
+            filename, filename_info, req_fh = fh_args
+            return filetype_cls(filename, filename_info, filetype_info, *req_fh, **fh_kwargs)
+
+        fh_args_iter = self._filehandler_args_with_requirements(requirements, filename_items)
+        if not self.parallel_init or self.parallel_init <= 1:
+            yield from map(_create_filehandler, fh_args_iter)
+            return
+
+        if not getattr(filetype_cls, "thread_safe_init", True):
+            # the file handlers use a library that is not thread-safe
+            _create_filehandler = _serialized(_create_filehandler)
+        fh_args = list(fh_args_iter)
+        with ThreadPoolExecutor(max_workers=min(self.parallel_init, max(len(fh_args), 1))) as executor:
+            yield from executor.map(_create_filehandler, fh_args)
+
+    def _filehandler_args_with_requirements(self, requirements, filename_items):
+        # Both the sequential and the parallel path consume this generator
+        # directly in _new_filehandler_instances, so the warnings point to
+        # the same caller in both cases.
         for filename, filename_info in filename_items:
             try:
                 req_fh = self.find_required_filehandlers(requirements,
@@ -582,13 +625,12 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
             except KeyError as req:
                 msg = "No handler for reading requirement {} for {}".format(
                     req, filename)
-                warnings.warn(msg, stacklevel=4)
+                warnings.warn(msg, stacklevel=5)
                 continue
             except RuntimeError as err:
-                warnings.warn(str(err) + " for {}".format(filename), stacklevel=4)
+                warnings.warn(str(err) + " for {}".format(filename), stacklevel=5)
                 continue
-
-            yield filetype_cls(filename, filename_info, filetype_info, *req_fh, **fh_kwargs)
+            yield filename, filename_info, req_fh
 
     def filter_fh_by_metadata(self, filehandlers):
         """Filter out filehandlers using provide filter parameters."""
@@ -621,6 +663,7 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
         """Organize the filenames into file types and create file handlers."""
         filenames = list(OrderedDict.fromkeys(filenames))
         logger.debug("Assigning to %s: %s", self.info["name"], filenames)
+        self._fh_kwargs = fh_kwargs
 
         self.info.setdefault("filenames", []).extend(filenames)
         filename_set = set(filenames)
@@ -643,6 +686,24 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
         self.update_ds_ids_from_file_handlers()
         return created_fhs
 
+    def add_files(self, filenames):
+        """Create the file handlers of files arriving after the first ones.
+
+        The files this reader can't handle and the ones it already has are
+        ignored. The file handlers are created with the same keyword
+        arguments as the previous ones.
+
+        Returns:
+            Dictionary mapping the file types to the new file handlers.
+
+        """
+        known_filenames = set(self.info.get("filenames", []))
+        new_filenames = [filename for filename in self.select_files_from_pathnames(filenames)
+                         if filename not in known_filenames]
+        if not new_filenames:
+            return {}
+        return self.create_filehandlers(new_filenames, fh_kwargs=self._fh_kwargs)
+
     def _file_handlers_available_datasets(self):
         """Generate a series of available dataset information.
 
@@ -1196,6 +1257,22 @@ class GEOSegmentYAMLReader(GEOFlippableFileYAMLReader):
         self._sort_segment_filehandler_by_segment_number()
         return created_fhs
 
+    def get_available_segments(self):
+        """Get the numbers of the segments available for every file type.
+
+        With files added as they arrive with :meth:`add_files`, this tells
+        which parts of the disk can be loaded already, the other segments
+        being padded.
+
+        Returns:
+            Dictionary mapping the file types to tuples of the sorted
+            available segment numbers and the number of expected segments.
+
+        """
+        return {filetype: (sorted(int(fh.filename_info["segment"]) for fh in fhs),
+                           fhs[0].filetype_info["expected_segments"])
+                for filetype, fhs in self.file_handlers.items() if fhs}
+
     def _sort_segment_filehandler_by_segment_number(self):
         if hasattr(self, "file_handlers"):
             for file_type in self.file_handlers.keys():
@@ -1416,6 +1493,12 @@ class GEOVariableSegmentYAMLReader(GEOSegmentYAMLReader):
         self.segment_heights = cache(self._segment_heights)
         self.segment_infos = dict()
 
+    def create_filehandlers(self, filenames, fh_kwargs=None):
+        """Create file handler objects, forgetting the padded segment heights computed with the previous ones."""
+        created_fhs = super().create_filehandlers(filenames, fh_kwargs=fh_kwargs)
+        self.segment_heights.cache_clear()
+        return created_fhs
+
     def _extract_segment_location_dicts(self, filetype):
         self._initialise_segment_infos(filetype)
         self._collect_segment_position_infos(filetype)
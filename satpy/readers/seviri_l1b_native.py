@@ -88,6 +88,21 @@ Output:
         ancillary_variables:      []
 
 
+Reading a region
+----------------
+The image data is only read from disk when it is computed, in blocks of
+lines. When the loaded data is cropped, for example with
+:meth:`~satpy.scene.Scene.crop`, only the blocks of lines covering the
+cropped region are read, unpacked and calibrated::
+
+  scn = Scene(filenames=filenames, reader="seviri_l1b_native")
+  scn.load(["IR_108"])
+  regional_scn = scn.crop(ll_bbox=(5.0, 45.0, 15.0, 55.0))
+
+Smaller dask chunk sizes (``array.chunk-size`` in the dask configuration)
+make the blocks of lines smaller, so less data outside of the region is read.
+
+
 References:
     - `EUMETSAT Product Navigator`_
     - `MSG Level 1.5 Native Format File Definition`_
@@ -100,7 +115,9 @@ References:
 
 import datetime as dt
 import logging
+import os
 import warnings
+from pathlib import Path
 
 import dask.array as da
 import numpy as np
@@ -111,6 +128,7 @@ from satpy._compat import cached_property
 from satpy.readers.core._geos_area import get_area_definition, get_geos_area_naming
 from satpy.readers.core.eum import get_service_mode, recarray2dict, time_cds_short
 from satpy.readers.core.file_handlers import BaseFileHandler
+from satpy.readers.core.header_cache import cached_file_header
 from satpy.readers.core.seviri import (
     CHANNEL_NAMES,
     HRV_NUM_COLUMNS,
@@ -196,7 +214,8 @@ class NativeMSGFileHandler(BaseFileHandler):
 
         # Read header, prepare dask-array, read trailer and initialize image boundaries
         # Available channels are known only after the header has been read
-        self.header_type = get_native_header(has_archive_header(self.filename))
+        self.header_type = get_native_header(cached_file_header(self.filename, "seviri_l1b_native.archive_header",
+                                                                has_archive_header, self.filename))
         self._read_header()
         self._make_dask_array_with_map_blocks()
         self._read_trailer()
@@ -302,7 +321,7 @@ class NativeMSGFileHandler(BaseFileHandler):
 
     def _read_header(self):
         """Read the header info."""
-        self.header.update(read_header(self.filename))
+        self.header.update(cached_file_header(self.filename, "seviri_l1b_native.header", read_header, self.filename))
 
         if "15_SECONDARY_PRODUCT_HEADER" not in self.header:
             # No archive header, that means we have a complete file
@@ -401,9 +420,8 @@ class NativeMSGFileHandler(BaseFileHandler):
         data_size = (self._get_data_dtype().itemsize *
                      self.mda["number_of_lines"])
 
-        data = fromfile(self.filename, dtype=native_trailer, count=1, offset=hdr_size + data_size)
-
-        self.trailer.update(recarray2dict(data))
+        self.trailer.update(cached_file_header(self.filename, "seviri_l1b_native.trailer",
+                                               read_trailer, self.filename, hdr_size + data_size))
 
     def get_area_def(self, dataset_id):
         """Get the area definition of the band.
@@ -603,7 +621,7 @@ class NativeMSGFileHandler(BaseFileHandler):
         else:
             i = self.mda["channel_list"].index(dataset_id["name"])
             raw = self._dask_array["visir"]["line_data"][:, i, :]
-        data = dec10216(raw.flatten())
+        data = dec10216(raw)
         data = data.reshape(shape)
         return data
 
@@ -614,7 +632,7 @@ class NativeMSGFileHandler(BaseFileHandler):
         data_list = []
         for i in range(3):
             raw = self._dask_array["hrv"]["line_data"][:, i, :]
-            data = dec10216(raw.flatten())
+            data = dec10216(raw)
             data = data.reshape(shape_layer)
             data_list.append(data)
 
@@ -685,21 +703,43 @@ class NativeMSGFileHandler(BaseFileHandler):
 
     def _get_acq_time_hrv(self):
         """Get raw acquisition time for HRV channel."""
-        tline = self._dask_array["hrv"]["acq_time"]
-        tline0 = tline[:, 0]
-        tline1 = tline[:, 1]
-        tline2 = tline[:, 2]
-        return da.stack((tline0, tline1, tline2), axis=1).reshape(
-            self.mda["hrv_number_of_lines"]).compute()
+        tline = self._get_line_records_field("hrv", "acq_time")
+        return tline.reshape(self.mda["hrv_number_of_lines"])
 
     def _get_acq_time_visir(self, dataset_id):
         """Get raw acquisition time for VIS/IR channels."""
+        tline = self._get_line_records_field("visir", "acq_time")
         # Check if there is only 1 channel in the list as a change
         # is needed in the array assignment, i.e. channel id is not present
         if len(self.mda["channel_list"]) == 1:
-            return self._dask_array["visir"]["acq_time"].compute()
+            return tline
         i = self.mda["channel_list"].index(dataset_id["name"])
-        return self._dask_array["visir"]["acq_time"][:, i].compute()
+        return tline[:, i]
+
+    def _get_line_records_field(self, group, field):
+        """Get one field of the line records of all lines.
+
+        For local files only the requested field is read through a memory map,
+        so that getting e.g. the acquisition times does not read the image
+        data of all lines, which is only read later for the lines that are
+        actually needed. Other files, e.g. remote or compressed ones, fall back
+        to computing the field from the dask array.
+        """
+        records = self._memmap_line_records()
+        if records is None:
+            return self._dask_array[group][field].compute()
+        return np.array(records[group][field])
+
+    def _memmap_line_records(self):
+        """Memory map the line records, or return None if the file is not a readable local file."""
+        if not isinstance(self.filename, (str, Path)) or not os.path.isfile(self.filename):
+            return None
+        try:
+            return np.memmap(self.filename, mode="r", dtype=self._dask_array.dtype,
+                             offset=self.header_type.itemsize, shape=self._dask_array.shape)
+        except (OSError, ValueError) as err:
+            logger.debug("Could not memory map %s, reading the line records with dask: %s", self.filename, err)
+            return None
 
     def _update_attrs(self, dataset, dataset_info):
         """Update dataset attributes."""
@@ -924,6 +964,12 @@ def read_header(filename):
     return recarray2dict(hdr)
 
 
+def read_trailer(filename, offset):
+    """Read SEVIRI L1.5 native trailer starting at the given offset."""
+    data = fromfile(filename, dtype=native_trailer, count=1, offset=offset)
+    return recarray2dict(data)
+
+
 def _get_array(filename=None, hdr_size=None, block_info=None):
     """Get the numpy array for the SEVIRI data."""
     output_block_info = block_info[None]
@@ -41,6 +41,8 @@ Resampling algorithms
     "bucket_sum", "Sum Bucket Resampling", :class:`~satpy.resample.bucket.BucketSum`
     "bucket_count", "Count Bucket Resampling", :class:`~satpy.resample.bucket.BucketCount`
     "bucket_fraction", "Fraction Bucket Resampling", :class:`~satpy.resample.bucket.BucketFraction`
+    "bucket_stats", "Sum, Count, Average and Fraction Bucket Resampling", \
+    :class:`~satpy.resample.bucket.BucketStatistics`
     "gradient_search", "Gradient Search Resampling", :func:`~pyresample.gradient.create_gradient_search_resampler`
 
 The resampling algorithm used can be specified with the ``resampler`` keyword
@@ -82,6 +84,15 @@ resolution area:
 Providing an area that is neither the minimum or maximum resolution area
 may work, but behavior is currently undefined.
 
+When reducing the resolution, the data is averaged by default. The
+``aggregation`` keyword argument selects another reduction, ``"max"``,
+``"min"`` or ``"mode"``, the latter giving the most frequent value of
+categorical data:
+
+.. code-block:: python
+
+    >>> new_scn = scn.resample(scn.coarsest_area(), resampler='native', aggregation='mode')
+
 Caching for geostationary data
 ------------------------------
 
@@ -98,6 +109,64 @@ target pixels don't change over time.
 See the documentation for specific algorithms to see availability and
 limitations of caching for that algorithm.
 
+When many processes resample data between the same areas, the ``nearest`` and
+``bilinear`` resamplers can instead share their indices through a
+:class:`~satpy.resample.index_store.ResampleIndexStore`:
+
+    >>> new_scn = scn.resample('euro4', index_store='/path/to/index_store')
+
+The indices are memory mapped read-only, so that all processes share one copy of
+them, and the store can be size limited and filled in advance. See
+:mod:`satpy.resample.index_store` for details.
+
+Resampling many bands together
+------------------------------
+
+Scenes with many bands on the same area, like the 16 channels of ABI or AHI,
+can be resampled in one pass per source area with ``batch=True``. The 2D
+datasets sharing their source area are stacked along an extra dimension,
+resampled together and split again with their attributes:
+
+    >>> new_scn = scn.resample('euro4', resampler='nearest', batch=True)
+
+This makes the dask graphs faster to build. It is supported by the ``nearest``
+and ``bilinear`` resamplers, for swath data only when passing
+``mask_area=False`` to ``nearest``. The other datasets are resampled one by one.
+
+Resampling to many areas
+------------------------
+
+Regional products made from the same scene can be resampled with one call to
+:meth:`~satpy.scene.Scene.resample_many`, which returns a new scene for each
+target area:
+
+    >>> scenes = scn.resample_many({"europe": "euro4", "scandinavia": "scan2"}, resampler="nearest")
+    >>> scenes["europe"].save_datasets()
+
+All the new scenes share the data read from the files and the modifiers
+applied to it, which are then computed only once when the scenes are computed
+together, for example with :func:`dask.compute`. The scenes can also be saved
+in one computation by passing the arguments to
+:meth:`~satpy.scene.Scene.save_datasets`, where ``{target}`` in ``filename``
+and ``base_dir`` is replaced by the name of each target:
+
+    >>> scn.resample_many({"europe": "euro4", "scandinavia": "scan2"},
+    ...                   save_kwargs={"base_dir": "/tmp/{target}", "writer": "geotiff"})
+
+Bucket statistics
+-----------------
+
+The bucket resamplers share the indices of the bins between the same swath
+and target area, so computing several statistics of a swath locates its
+pixels in the target grid only once. These indices can also be stored in
+``cache_dir`` for other processes. The ``bucket_stats`` resampler computes
+the sum, count, average and fractions of categories in one pass over the
+data, and returns them along a ``statistic`` dimension:
+
+    >>> stats_scn = scn.resample('euro4', resampler='bucket_stats',
+    ...                          statistics=('count', 'average'))
+    >>> average = stats_scn['cloud_type'].sel(statistic='average')
+
 Create custom area definition
 -----------------------------
 
@@ -206,3 +206,73 @@ def resample_dataset(dataset, destination_area, **kwargs):
     new_data.attrs.update(area=destination_area)
 
     return new_data
+
+
+# The bilinear resampler of pyresample keeps the coordinates of the extra
+# dimensions of the data for the next calls, except for "bands". Batches only
+# contain 2D datasets so this name can't clash with their dimensions.
+BATCH_DIM = "bands"
+
+
+def get_batch_key(dataset, resampler_instance, **kwargs):
+    """Get the key of the datasets that can be resampled together with *dataset*.
+
+    Returns:
+        A hashable key, equal for datasets which :func:`resample_datasets` can
+        resample in one pass, or None if *dataset* must be resampled alone.
+
+    """
+    from pyresample.geometry import SwathDefinition
+
+    if not getattr(resampler_instance, "supports_batches", False) or dataset.dims != ("y", "x"):
+        return None
+    # the mask of swath data depends on the values of each dataset
+    if isinstance(resampler_instance.source_geo_def, SwathDefinition) and kwargs.get("mask_area") is not False:
+        return None
+    chunks = dataset.chunks if dataset.chunks is not None else dataset.shape
+    fill_value = kwargs.get("fill_value", _get_fill_value(dataset))
+    return id(resampler_instance), dataset.shape, chunks, dataset.dtype.str, str(fill_value)
+
+
+def resample_datasets(datasets, destination_area, **kwargs):
+    """Resample 2D datasets sharing the same source area in one pass.
+
+    The datasets are stacked along an extra dimension, resampled together
+    and split again, so the resampling indices are applied once for all of
+    them. Only datasets with the same key from :func:`get_batch_key` should
+    be resampled together.
+
+    Args:
+        datasets (list): DataArrays to resample.
+        destination_area: The destination onto which to project the data.
+        **kwargs: The extra parameters to pass to the resampler objects.
+
+    Returns:
+        The list of resampled DataArrays, like the ones returned by
+        :func:`resample_dataset` for every dataset.
+
+    """
+    import dask.array as da
+    import xarray as xr
+
+    first = datasets[0]
+    source_area = first.attrs["area"]
+    fill_value = kwargs.pop("fill_value", _get_fill_value(first))
+    if isinstance(first.data, da.Array):
+        stacked_data = da.stack([dataset.data for dataset in datasets])
+    else:
+        stacked_data = np.stack([dataset.data for dataset in datasets])
+    stacked = xr.DataArray(stacked_data, dims=(BATCH_DIM,) + first.dims,
+                           coords={dim: first.coords[dim] for dim in first.dims if dim in first.coords},
+                           attrs={"area": source_area})
+    new_stacked = resample(source_area, stacked, destination_area, fill_value=fill_value, **kwargs)
+    new_datasets = []
+    for idx, dataset in enumerate(datasets):
+        new_data = new_stacked.isel({BATCH_DIM: idx}, drop=True)
+        new_data = _update_resampled_coords(dataset, new_data, destination_area)
+        new_data.name = dataset.name
+        new_data.attrs = dataset.attrs.copy()
+        new_data.attrs.update(new_stacked.attrs)
+        new_data.attrs.update(area=destination_area)
+        new_datasets.append(new_data)
+    return new_datasets
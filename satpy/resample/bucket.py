@@ -1,10 +1,12 @@
 """Bucket resamplers."""
 
+from collections import OrderedDict
 from logging import getLogger
 
 import dask.array as da
 import numpy as np
 import xarray as xr
+import zarr
 from pyresample.resampler import BaseResampler as PRBaseResampler
 
 from satpy.resample.base import _update_resampled_coords
@@ -14,46 +16,84 @@ LOG = getLogger(__name__)
 
 CHUNK_SIZE = get_legacy_chunk_size()
 
+# number of pairs of source and target geometries whose bucket indices are kept in memory
+MEMORY_CACHE_SIZE = 8
+BUCKET_INDICES = {"x_idxs": "source", "y_idxs": "source"}
+
+_BUCKET_RESAMPLERS: OrderedDict = OrderedDict()
+
 
 class BucketResamplerBase(PRBaseResampler):
     """Base class for bucket resampling which implements averaging."""
 
+    # dimension of the results returned in a dict by compute
+    result_dim = "categories"
+
     def __init__(self, source_geo_def, target_geo_def):
         """Initialize bucket resampler."""
         super(BucketResamplerBase, self).__init__(source_geo_def, target_geo_def)
         self.resampler = None
 
-    def precompute(self, **kwargs):
-        """Create X and Y indices and store them for later use."""
+    def precompute(self, cache_dir=None, **kwargs):
+        """Create X and Y indices and store them for later use.
+
+        The indices are kept in memory and shared by all the bucket
+        resamplers between the same source and target geometries, so that
+        for example the average, sum and count of a swath use the same
+        indices. If *cache_dir* is given, the indices are computed once and
+        stored in this directory, to be read again by other processes.
+
+        """
+        cache_key = self.get_hash()
+        resampler = _BUCKET_RESAMPLERS.get(cache_key)
+        if resampler is None:
+            resampler = self._create_bucket_resampler(cache_dir)
+            _BUCKET_RESAMPLERS[cache_key] = resampler
+            while len(_BUCKET_RESAMPLERS) > MEMORY_CACHE_SIZE:
+                _BUCKET_RESAMPLERS.popitem(last=False)
+        _BUCKET_RESAMPLERS.move_to_end(cache_key)
+        self.resampler = resampler
+
+    def _create_bucket_resampler(self, cache_dir):
         from pyresample import bucket
 
         LOG.debug("Initializing bucket resampler.")
         source_lons, source_lats = self.source_geo_def.get_lonlats(
             chunks=CHUNK_SIZE)
-        self.resampler = bucket.BucketResampler(self.target_geo_def,
-                                                source_lons,
-                                                source_lats)
+        resampler = bucket.BucketResampler(self.target_geo_def,
+                                           source_lons,
+                                           source_lats)
+        if cache_dir:
+            filename = self._create_cache_filename(cache_dir, prefix="bucket_lut-")
+            try:
+                indices = _load_bucket_indices(filename)
+                LOG.debug("Read pre-computed bucket indices from %s", filename)
+            except IOError:
+                indices = _save_bucket_indices(resampler, filename)
+            _apply_bucket_indices(resampler, indices)
+        return resampler
 
     def compute(self, data, **kwargs):
         """Call the resampling."""
         raise NotImplementedError("Use the sub-classes")
 
-    def resample(self, data, **kwargs):  # noqa: D417
+    def resample(self, data, cache_dir=None, **kwargs):  # noqa: D417
         """Resample `data` by calling `precompute` and `compute` methods.
 
         Args:
             data (xarray.DataArray): Data to be resampled
+            cache_dir (str): Directory to store the bucket indices in
 
         Returns (xarray.DataArray): Data resampled to the target area
 
         """
-        self.precompute(**kwargs)
+        self.precompute(cache_dir=cache_dir, **kwargs)
         attrs = data.attrs.copy()
         data_arr = data.data
         dims = _get_dims(data)
         LOG.debug("Resampling %s", str(data.attrs.get("_satpy_id", "unknown")))
         result = self.compute(data_arr, **kwargs)
-        coords, result, dims = _check_coords_results_dims(result, data, dims)
+        coords, result, dims = _check_coords_results_dims(result, data, dims, self.result_dim)
 
         self._adjust_attrs(attrs)
 
@@ -74,6 +114,30 @@ class BucketResamplerBase(PRBaseResampler):
             attrs["standard_name"] = "number_of_observations"
 
 
+def _load_bucket_indices(filename):
+    try:
+        fid = zarr.open(filename, mode="r")
+        return {idx_name: np.array(fid[idx_name]) for idx_name in BUCKET_INDICES}
+    except (ValueError, KeyError):
+        raise IOError
+
+
+def _save_bucket_indices(resampler, filename):
+    LOG.info("Saving bucket indices to %s", filename)
+    indices = dict(zip(BUCKET_INDICES, da.compute(*(getattr(resampler, idx_name) for idx_name in BUCKET_INDICES))))
+    zarr_out = xr.Dataset({idx_name: (dim, indices[idx_name]) for idx_name, dim in BUCKET_INDICES.items()})
+    zarr_out.to_zarr(filename)
+    return indices
+
+
+def _apply_bucket_indices(resampler, indices):
+    """Replace the indices of a pyresample bucket resampler with precomputed ones."""
+    chunks = resampler.idxs.chunks
+    resampler.x_idxs = da.from_array(indices["x_idxs"], chunks=chunks)
+    resampler.y_idxs = da.from_array(indices["y_idxs"], chunks=chunks)
+    resampler.idxs = resampler.y_idxs * resampler.target_area.shape[1] + resampler.x_idxs
+
+
 def _get_dims(data):
     if data.ndim == 3 and data.dims[0] == "bands":
         dims = ("bands", "y", "x")
@@ -85,16 +149,16 @@ def _get_dims(data):
     return dims
 
 
-def _check_coords_results_dims(result, data, dims):
+def _check_coords_results_dims(result, data, dims, result_dim="categories"):
     coords = {}
     if "bands" in data.coords:
         coords["bands"] = data.coords["bands"]
-    # Fractions are returned in a dict
+    # Fractions and statistics are returned in a dict
     elif isinstance(result, dict):
-        coords["categories"] = sorted(result.keys())
-        dims = ("categories", "y", "x")
+        coords[result_dim] = sorted(result.keys())
+        dims = (result_dim, "y", "x")
         new_result = []
-        for cat in coords["categories"]:
+        for cat in coords[result_dim]:
             new_result.append(result[cat])
         result = da.stack(new_result)
     if result.ndim > len(dims):
@@ -225,11 +289,114 @@ class BucketFraction(BucketResamplerBase):
         return result
 
 
+class BucketStatistics(BucketResamplerBase):
+    """Class for bucket resampling computing several statistics in one pass.
+
+    This resampler bins the data once and derives the sum, the number of
+    occurences, the average and the fraction of each category of the
+    values closest to each bin, which are otherwise computed by
+    :class:`BucketSum`, :class:`BucketCount`, :class:`BucketAvg` and
+    :class:`BucketFraction` with one pass over the data each. The result has
+    a ``statistic`` dimension with the names of the statistics, and
+    ``fraction_<category>`` for the fractions.
+
+    Parameters
+    ----------
+    statistics : (iterable) default: `("sum", "count", "average")`
+        Statistics to compute, among "sum", "count", "average" and
+        "fraction".
+    fill_value : (float) default: `np.nan`
+        Fill value to mark missing/invalid values in the input data, as
+        well as in the average and fractions of empty buckets.
+    skipna : (bool) default: `True`
+        If True, skips missing values for the sum and average calculation.
+        If False, sets the sum and average of the buckets containing
+        missing values to `fill_value`.
+    categories : (iterable) default: `None`
+        Categories of the fractions. If None, they are determined from the
+        data by computing it.
+
+    """
+
+    result_dim = "statistic"
+
+    def compute(self, data, statistics=("sum", "count", "average"), fill_value=np.nan, skipna=True,
+                categories=None, **kwargs):
+        """Call the resampling."""
+        if data.ndim > 2:
+            raise ValueError("BucketStatistics not implemented for 3D datasets")
+        unknown = set(statistics) - set(BUCKET_STATISTICS)
+        if unknown:
+            raise ValueError(f"Unknown bucket statistics {sorted(unknown)}, use some of {BUCKET_STATISTICS}.")
+        if "fraction" not in statistics:
+            categories = []
+        elif categories is None:
+            LOG.warning("No categories given, need to compute the data.")
+            categories = np.unique(np.asarray(data))
+        binned = _bin_statistics(self.resampler.idxs, data, self.target_geo_def.size, fill_value, categories)
+        counts, valid_counts, sums = binned[0], binned[1], binned[2]
+        results = {}
+        if "sum" in statistics:
+            results["sum"] = sums if skipna else da.where(counts > valid_counts, fill_value, sums)
+        if "count" in statistics:
+            results["count"] = counts
+        if "average" in statistics:
+            average = sums / da.where(valid_counts == 0, np.nan, valid_counts)
+            if not skipna:
+                average = da.where(counts > valid_counts, np.nan, average)
+            results["average"] = da.where(np.isnan(average), fill_value, average)
+        for cat, cat_counts in zip(categories, binned[3:]):
+            results[f"fraction_{cat}"] = da.where(counts == 0, fill_value, cat_counts / counts)
+        shape = self.target_geo_def.shape
+        return {name: result.reshape(shape) for name, result in results.items()}
+
+
+BUCKET_STATISTICS = ("sum", "count", "average", "fraction")
+
+
+def _bin_statistics(idxs, data, out_size, fill_value, categories):
+    """Bin the data in one pass.
+
+    Returns the number of values, the number of valid values, the sum of the
+    valid values and the number of values of each category in each bin.
+
+    """
+    data = da.asarray(data).ravel()
+    if idxs.chunks != data.chunks:
+        idxs = da.rechunk(idxs, data.chunks)
+    binned = da.blockwise(_bin_block, "ijk", idxs, "i", data, "i",
+                          out_size=out_size, fill_value=fill_value, categories=categories,
+                          new_axes={"j": 3 + len(categories), "k": out_size},
+                          adjust_chunks={"i": lambda _: 1},
+                          meta=np.array((), dtype=np.float64))
+    return binned.sum(axis=0)
+
+
+def _bin_block(idxs, data, out_size, fill_value, categories):
+    inside = idxs >= 0
+    idxs = idxs[inside]
+    data = data[inside]
+    valid = ~_get_invalid_mask(data, fill_value)
+    valid_idxs = idxs[valid]
+    binned = [np.bincount(idxs, minlength=out_size),
+              np.bincount(valid_idxs, minlength=out_size),
+              np.bincount(valid_idxs, weights=data[valid], minlength=out_size)]
+    binned.extend(np.bincount(idxs[data == cat], minlength=out_size) for cat in categories)
+    return np.stack(binned).astype(np.float64)[np.newaxis]
+
+
+def _get_invalid_mask(data, fill_value):
+    if np.isnan(fill_value):
+        return np.isnan(data)
+    return (data == fill_value) | np.isnan(data)
+
+
 def get_resampler_classes():
     """Get bucket resampler classes."""
     return {
         "bucket_avg": BucketAvg,
         "bucket_sum": BucketSum,
         "bucket_count": BucketCount,
-        "bucket_fraction": BucketFraction
+        "bucket_fraction": BucketFraction,
+        "bucket_stats": BucketStatistics,
     }
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Store of precomputed resampling indices shared between processes.
+
+The ``nearest`` and ``bilinear`` resamplers can store the index arrays they
+compute for a pair of source and target geometries in a
+:class:`ResampleIndexStore` by passing its directory as ``index_store``::
+
+    >>> new_scn = scn.resample('euro4', index_store='/path/to/index_store')
+
+Contrary to the ``cache_dir`` zarr caches, every index array is stored as a
+separate ``.npy`` file and loaded as a read-only memory map. Many worker
+processes using the same indices then share a single copy of them in the
+operating system's page cache instead of each holding its own copy in
+memory.
+
+The total size of the store can be limited with the
+``resample_index_store_max_size`` setting (in bytes, see
+:doc:`../../config`). When the store grows larger than this, the least
+recently used entries are removed.
+
+Indices for fixed areas can be computed in advance with the
+``satpy_prewarm_resample_indices`` command, for example::
+
+    satpy_prewarm_resample_indices /path/to/index_store --sources msg_seviri_fes_3km --targets euro4 germ
+
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import satpy
+
+LOG = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".npy"
+
+
+class ResampleIndexStore:
+    """On-disk store of resampling index arrays.
+
+    Every entry is a directory named after its key holding one ``.npy`` file
+    per index array. Entries are written to a temporary directory first and
+    then renamed, so concurrent processes never see partially written
+    entries.
+
+    Args:
+        directory: Directory of the store, created if needed.
+        max_size: Maximum total size of the store in bytes. Defaults to the
+            ``resample_index_store_max_size`` setting, ``None`` means no limit.
+
+    """
+
+    def __init__(self, directory, max_size=None):
+        """Set up the store."""
+        self.directory = os.fspath(directory)
+        if max_size is None:
+            max_size = satpy.config.get("resample_index_store_max_size", None)
+        self.max_size = max_size
+
+    def __repr__(self):
+        """Represent the store."""
+        return f"{self.__class__.__name__}({self.directory!r}, max_size={self.max_size!r})"
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, key)
+
+    def __contains__(self, key):
+        """Check if an entry exists."""
+        return os.path.isdir(self._entry_path(key))
+
+    def load(self, key, names=None):
+        """Load the index arrays of an entry as read-only memory maps.
+
+        Args:
+            key: Key of the entry.
+            names: Names of the index arrays the entry must hold. All the
+                arrays of the entry are loaded by default.
+
+        Raises:
+            KeyError: If there is no entry for *key*, if it is missing one of
+                the arrays in *names* or if it is removed by another process
+                while being loaded.
+
+        """
+        path = self._entry_path(key)
+        try:
+            fnames = [fname for fname in os.listdir(path) if fname.endswith(INDEX_SUFFIX)]
+            arrays = {fname[:-len(INDEX_SUFFIX)]: np.load(os.path.join(path, fname), mmap_mode="r")
+                      for fname in fnames}
+            # the modification time of the entry is used for the LRU eviction
+            os.utime(path)
+        except OSError:
+            # the entry is missing or being removed by another process
+            raise KeyError(key)
+        if names is not None and not set(names).issubset(arrays):
+            raise KeyError(key)
+        return arrays
+
+    def save(self, key, arrays):
+        """Save the index arrays of an entry and evict old entries if needed.
+
+        Args:
+            key: Key of the entry.
+            arrays: Dictionary of array names and numpy arrays.
+
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = tempfile.mkdtemp(prefix=".tmp-", dir=self.directory)
+        try:
+            for name, arr in arrays.items():
+                np.save(os.path.join(tmp_path, name + INDEX_SUFFIX), np.asarray(arr))
+            os.rename(tmp_path, self._entry_path(key))
+        except OSError:
+            # most likely another process saved the same entry in the meantime
+            LOG.debug("Could not add %s to the resampling index store", key)
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        self.evict(keep=(key,))
+
+    def entries(self):
+        """Get the entries with their last access time and size in bytes, least recently used first."""
+        entries = []
+        try:
+            dir_entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return entries
+        for entry in dir_entries:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            try:
+                size = sum(sub_entry.stat().st_size for sub_entry in os.scandir(entry.path))
+                entries.append((entry.name, entry.stat().st_mtime, size))
+            except FileNotFoundError:
+                continue
+        return sorted(entries, key=lambda entry: entry[1])
+
+    def evict(self, keep=()):
+        """Remove the least recently used entries until the store fits into ``max_size``.
+
+        Args:
+            keep: Keys of the entries that must not be removed, even if the
+                store is still too large without them.
+
+        """
+        if self.max_size is None:
+            return
+        entries = self.entries()
+        total_size = sum(size for _, _, size in entries)
+        for key, _, size in entries:
+            if total_size <= self.max_size:
+                break
+            if key in keep:
+                continue
+            LOG.debug("Removing %s from the resampling index store", key)
+            shutil.rmtree(self._entry_path(key), ignore_errors=True)
+            total_size -= size
+
+    def clear(self):
+        """Remove all entries."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def get_index_store(index_store):
+    """Get a :class:`ResampleIndexStore` from a store or the path of its directory."""
+    if isinstance(index_store, ResampleIndexStore):
+        return index_store
+    return ResampleIndexStore(index_store)
+
+
+def prewarm_indices(index_store, sources, targets, resampler="nearest", **kwargs):
+    """Compute and store the resampling indices for all pairs of source and target areas.
+
+    Args:
+        index_store: :class:`ResampleIndexStore` or path of its directory.
+        sources: Source area definitions or names of areas in ``areas.yaml``.
+        targets: Target area definitions or names of areas in ``areas.yaml``.
+        resampler: Name of the resampler, ``"nearest"`` or ``"bilinear"``.
+        kwargs: Other keyword arguments for the resampler's ``precompute``
+            method, e.g. ``radius_of_influence``. These must be the same as
+            the ones used later when resampling, otherwise the stored indices
+            are not found.
+
+    """
+    from satpy.area import get_area_def
+    from satpy.resample.kdtree import get_resampler_classes
+
+    index_store = get_index_store(index_store)
+    resampler_class = get_resampler_classes()[resampler]
+    for source in sources:
+        source_area = get_area_def(source) if isinstance(source, str) else source
+        for target in targets:
+            target_area = get_area_def(target) if isinstance(target, str) else target
+            LOG.info("Computing %s resampling indices from %s to %s", resampler,
+                     source_area.area_id, target_area.area_id)
+            resampler_instance = resampler_class(source_area, target_area)
+            resampler_instance.precompute(index_store=index_store, **kwargs)
+
+
+def prewarm_indices_cmd(argv=None):
+    """Call 'prewarm_indices' function from console script 'satpy_prewarm_resample_indices'."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Precompute resampling indices for fixed areas.")
+    parser.add_argument("store_dir",
+                        help="Directory of the resampling index store.")
+    parser.add_argument("--sources", nargs="+", required=True,
+                        help="Names of the source areas in areas.yaml.")
+    parser.add_argument("--targets", nargs="+", required=True,
+                        help="Names of the target areas in areas.yaml.")
+    parser.add_argument("--resampler", default="nearest", choices=["nearest", "bilinear"],
+                        help="Resampler to compute the indices for.")
+    parser.add_argument("--radius-of-influence", type=float,
+                        help="Search radius in meters, the resampler's default if not given.")
+    parser.add_argument("--max-size", type=int,
+                        help="Maximum size of the store in bytes. Overrides "
+                             "'SATPY_RESAMPLE_INDEX_STORE_MAX_SIZE'.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    kwargs = {}
+    if args.radius_of_influence is not None:
+        kwargs["radius_of_influence"] = args.radius_of_influence
+    index_store = ResampleIndexStore(args.store_dir, max_size=args.max_size)
+    prewarm_indices(index_store, args.sources, args.targets, resampler=args.resampler, **kwargs)
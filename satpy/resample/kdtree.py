@@ -11,6 +11,7 @@ import zarr
 from pyresample.resampler import BaseResampler as PRBaseResampler
 
 from satpy.resample.base import _update_resampled_coords
+from satpy.resample.index_store import get_index_store
 from satpy.utils import get_legacy_chunk_size
 
 LOG = getLogger(__name__)
@@ -38,9 +39,16 @@ class KDTreeResampler(PRBaseResampler):
     argument is provided to `precompute` which occurs by default for
     `SwathDefinition` source areas.
 
+    Alternatively, the indices can be stored in a
+    :class:`~satpy.resample.index_store.ResampleIndexStore` shared between
+    processes by providing `index_store`.
+
     Args:
         cache_dir (str): Long term storage directory for intermediate
                          results.
+        index_store (str or ResampleIndexStore): Store, or directory of the
+                         store, for the resampling indices. Takes precedence
+                         over `cache_dir`.
         mask (bool): Force resampled data's invalid pixel mask to be used
                      when searching for nearest neighbor pixels. By
                      default this is True for SwathDefinition source
@@ -51,6 +59,9 @@ class KDTreeResampler(PRBaseResampler):
 
     """
 
+    # several 2D datasets can be resampled together along an extra dimension
+    supports_batches = True
+
     def __init__(self, source_geo_def, target_geo_def):
         """Init KDTreeResampler."""
         super(KDTreeResampler, self).__init__(source_geo_def, target_geo_def)
@@ -58,7 +69,7 @@ class KDTreeResampler(PRBaseResampler):
         self._index_caches = {}
 
     def precompute(self, mask=None, radius_of_influence=None, epsilon=0,
-                   cache_dir=None, **kwargs):
+                   cache_dir=None, index_store=None, **kwargs):
         """Create a KDTree structure and store it for later use.
 
         Note: The `mask` keyword should be provided if geolocation may be valid
@@ -67,11 +78,12 @@ class KDTreeResampler(PRBaseResampler):
         """
         from pyresample.kd_tree import XArrayResamplerNN
         del kwargs
-        if mask is not None and cache_dir is not None:
-            LOG.warning("Mask and cache_dir both provided to nearest "
+        if mask is not None and (cache_dir is not None or index_store is not None):
+            LOG.warning("Mask and cache_dir or index_store both provided to nearest "
                         "resampler. Cached parameters are affected by "
                         "masked pixels. Will not cache results.")
             cache_dir = None
+            index_store = None
 
         if radius_of_influence is None and not hasattr(self.source_geo_def, "geocentric_resolution"):
             radius_of_influence = self._adjust_radius_of_influence(radius_of_influence)
@@ -87,12 +99,12 @@ class KDTreeResampler(PRBaseResampler):
             self.resampler = XArrayResamplerNN(**kwargs)
 
         try:
-            self.load_neighbour_info(cache_dir, mask=mask, **kwargs)
+            self.load_neighbour_info(cache_dir, mask=mask, index_store=index_store, **kwargs)
             LOG.debug("Read pre-computed kd-tree parameters")
         except IOError:
             LOG.debug("Computing kd-tree parameters")
             self.resampler.get_neighbour_info(mask=mask)
-            self.save_neighbour_info(cache_dir, mask=mask, **kwargs)
+            self.save_neighbour_info(cache_dir, mask=mask, index_store=index_store, **kwargs)
 
     def _adjust_radius_of_influence(self, radius_of_influence):
         """Adjust radius of influence."""
@@ -122,9 +134,12 @@ class KDTreeResampler(PRBaseResampler):
         setattr(self.resampler, idx_name, val)
         return val
 
-    def load_neighbour_info(self, cache_dir, mask=None, **kwargs):
-        """Read index arrays from either the in-memory or disk cache."""
+    def load_neighbour_info(self, cache_dir, mask=None, index_store=None, **kwargs):
+        """Read index arrays from either the in-memory cache, the index store or disk cache."""
         mask_name = getattr(mask, "name", None)
+        if mask_name not in self._index_caches and index_store:
+            self._index_caches[mask_name] = self._load_neighbour_info_from_store(
+                index_store, mask_name, **kwargs)
         cached = {}
         for idx_name in NN_COORDINATES:
             if mask_name in self._index_caches:
@@ -153,9 +168,18 @@ class KDTreeResampler(PRBaseResampler):
             raise IOError
         return cache
 
-    def save_neighbour_info(self, cache_dir, mask=None, **kwargs):
-        """Cache resampler's index arrays if there is a cache dir."""
-        if cache_dir:
+    def _load_neighbour_info_from_store(self, index_store, mask_name, **kwargs):
+        key = "nn_lut-" + self.get_hash(mask=mask_name, **kwargs)
+        try:
+            return get_index_store(index_store).load(key, names=NN_COORDINATES)
+        except KeyError:
+            raise IOError
+
+    def save_neighbour_info(self, cache_dir, mask=None, index_store=None, **kwargs):
+        """Cache resampler's index arrays if there is an index store or a cache dir."""
+        if index_store:
+            self._save_neighbour_info_to_store(index_store, mask, **kwargs)
+        elif cache_dir:
             mask_name = getattr(mask, "name", None)
             cache = self._read_resampler_attrs()
             filename = self._create_cache_filename(
@@ -176,6 +200,26 @@ class KDTreeResampler(PRBaseResampler):
             # Delete the kdtree, it's not needed anymore
             self.resampler.delayed_kdtree = None
 
+    def _save_neighbour_info_to_store(self, index_store, mask, **kwargs):
+        mask_name = getattr(mask, "name", None)
+        cache = self._read_resampler_attrs()
+        index_store = get_index_store(index_store)
+        key = "nn_lut-" + self.get_hash(mask=mask_name, **kwargs)
+        LOG.info("Saving kd_tree neighbour info to %s", index_store)
+        arrays = dict(zip(cache.keys(), da.compute(*cache.values())))
+        index_store.save(key, arrays)
+        try:
+            # use the memory mapped arrays from the store from now on
+            arrays = self._load_neighbour_info_from_store(index_store, mask_name, **kwargs)
+        except OSError:
+            # another process removed the entry already, keep the arrays in memory
+            LOG.debug("Could not read %s back from the resampling index store", key)
+        self._index_caches[mask_name] = arrays
+        for idx_name, val in self._index_caches[mask_name].items():
+            self._apply_cached_index(val, idx_name)
+        # Delete the kdtree, it's not needed anymore
+        self.resampler.delayed_kdtree = None
+
     def _read_resampler_attrs(self):
         """Read certain attributes from the resampler for caching."""
         return {attr_name: getattr(self.resampler, attr_name)
@@ -200,6 +244,9 @@ class BilinearResampler(PRBaseResampler):
     Args:
         cache_dir (str): Long term storage directory for intermediate
                          results.
+        index_store (str or ResampleIndexStore): Store, or directory of the
+                         store, for the resampling indices shared between
+                         processes. Takes precedence over `cache_dir`.
         radius_of_influence (float): Search radius cut off distance in meters
         epsilon (float): Allowed uncertainty in meters. Increasing uncertainty
                          reduces execution time.
@@ -208,13 +255,15 @@ class BilinearResampler(PRBaseResampler):
 
     """
 
+    supports_batches = True
+
     def __init__(self, source_geo_def, target_geo_def):
         """Init BilinearResampler."""
         super(BilinearResampler, self).__init__(source_geo_def, target_geo_def)
         self.resampler = None
 
     def precompute(self, mask=None, radius_of_influence=50000, epsilon=0,
-                   reduce_data=True, cache_dir=False, **kwargs):
+                   reduce_data=True, cache_dir=False, index_store=None, **kwargs):
         """Create bilinear coefficients and store them for later use."""
         try:
             from pyresample.bilinear import XArrayBilinearResampler
@@ -233,17 +282,25 @@ class BilinearResampler(PRBaseResampler):
 
             self.resampler = XArrayBilinearResampler(**kwargs)
             try:
-                self.load_bil_info(cache_dir, **kwargs)
+                self.load_bil_info(cache_dir, index_store=index_store, **kwargs)
                 LOG.debug("Loaded bilinear parameters")
             except IOError:
                 LOG.debug("Computing bilinear parameters")
                 self.resampler.get_bil_info()
                 LOG.debug("Saving bilinear parameters.")
-                self.save_bil_info(cache_dir, **kwargs)
+                self.save_bil_info(cache_dir, index_store=index_store, **kwargs)
 
-    def load_bil_info(self, cache_dir, **kwargs):
-        """Load bilinear resampling info from cache directory."""
-        if cache_dir:
+    def load_bil_info(self, cache_dir, index_store=None, **kwargs):
+        """Load bilinear resampling info from the index store or cache directory."""
+        if index_store:
+            try:
+                arrays = get_index_store(index_store).load("bil_lut-" + self.get_hash(**kwargs),
+                                                           names=BIL_COORDINATES)
+            except KeyError:
+                raise IOError
+            for name, arr in arrays.items():
+                setattr(self.resampler, name, da.from_array(arr, chunks=CHUNK_SIZE))
+        elif cache_dir:
             filename = self._create_cache_filename(cache_dir,
                                                    prefix="bil_lut-",
                                                    **kwargs)
@@ -259,9 +316,14 @@ class BilinearResampler(PRBaseResampler):
         else:
             raise IOError
 
-    def save_bil_info(self, cache_dir, **kwargs):
-        """Save bilinear resampling info to cache directory."""
-        if cache_dir:
+    def save_bil_info(self, cache_dir, index_store=None, **kwargs):
+        """Save bilinear resampling info to the index store or cache directory."""
+        if index_store:
+            arrays = da.compute(*(getattr(self.resampler, name) for name in BIL_COORDINATES))
+            LOG.info("Saving BIL neighbour info to %s", index_store)
+            get_index_store(index_store).save("bil_lut-" + self.get_hash(**kwargs),
+                                              dict(zip(BIL_COORDINATES, arrays)))
+        elif cache_dir:
             filename = self._create_cache_filename(cache_dir,
                                                    prefix="bil_lut-",
                                                    **kwargs)
@@ -1,15 +1,17 @@
 """Native resampler."""
 
-import warnings
-from math import lcm  # type: ignore
+import itertools
+import operator
 
 import dask.array as da
 import numpy as np
 import xarray as xr
+from dask.base import tokenize
+from dask.highlevelgraph import HighLevelGraph
 from pyresample.resampler import BaseResampler as PRBaseResampler
 
 from satpy.resample.base import _update_resampled_coords
-from satpy.utils import PerformanceWarning, get_legacy_chunk_size
+from satpy.utils import get_legacy_chunk_size
 
 CHUNK_SIZE = get_legacy_chunk_size()
 
@@ -18,7 +20,16 @@ class NativeResampler(PRBaseResampler):
     """Expand or reduce input datasets to be the same shape.
 
     If data is higher resolution (more pixels) than the destination area
-    then data is averaged to match the destination resolution.
+    then data is averaged to match the destination resolution. Other
+    reductions can be chosen with the ``aggregation`` keyword argument:
+    ``"max"``, ``"min"``, or ``"mode"`` to get the most frequent value of
+    categorical data like cloud types or land classes::
+
+        new_scn = scn.resample(scn.coarsest_area(), resampler="native", aggregation="mode")
+
+    The aggregated chunks follow the chunks of the input data, which doesn't
+    need to be rechunked when the chunk sizes are not multiples of the
+    aggregation factor.
 
     If data is lower resolution (less pixels) than the destination area
     then data is repeated to match the destination resolution.
@@ -37,7 +48,7 @@ class NativeResampler(PRBaseResampler):
                                                      **kwargs)
 
     @classmethod
-    def _expand_reduce(cls, d_arr, repeats):
+    def _expand_reduce(cls, d_arr, repeats, aggregation="mean"):
         """Expand reduce."""
         d_arr = _ensure_dask_array(d_arr)
         if all(x == 1 for x in repeats.values()):
@@ -45,15 +56,24 @@ class NativeResampler(PRBaseResampler):
         if all(x >= 1 for x in repeats.values()):
             return _replicate(d_arr, repeats)
         if all(x <= 1 for x in repeats.values()):
-            # reduce
-            y_size = 1. / repeats[0]
-            x_size = 1. / repeats[1]
-            return _aggregate(d_arr, y_size, x_size)
+            factors = tuple(1. / repeats[axis] for axis in range(d_arr.ndim))
+            return _aggregate(d_arr, factors, aggregation)
         raise ValueError("Must either expand or reduce in both "
                          "directions")
 
-    def compute(self, data, expand=True, **kwargs):
-        """Resample data with NativeResampler."""
+    def compute(self, data, expand=True, aggregation="mean", **kwargs):
+        """Resample data with NativeResampler.
+
+        Args:
+            data: Data to resample.
+            expand: Resample to the largest area when several target areas
+                are given, otherwise to the smallest one.
+            aggregation: Reduction used to aggregate data to a lower
+                resolution, one of ``"mean"`` (default), ``"max"``, ``"min"``
+                and ``"mode"``.
+            kwargs: Ignored keyword arguments.
+
+        """
         if isinstance(self.target_geo_def, (list, tuple)):
             # find the highest/lowest area among the provided
             test_func = max if expand else min
@@ -65,7 +85,7 @@ class NativeResampler(PRBaseResampler):
         # convert xarray backed with numpy array to dask array
         repeats = _get_repeats(target_geo_def, data)
 
-        d_arr = self._expand_reduce(data.data, repeats)
+        d_arr = self._expand_reduce(data.data, repeats, aggregation=aggregation)
         new_data = xr.DataArray(d_arr, dims=data.dims)
         return _update_resampled_coords(data, new_data, target_geo_def)
 
@@ -103,31 +123,146 @@ def _get_axes(data):
     return y_axis, x_axis
 
 
-def _aggregate(d, y_size, x_size):
-    """Average every 4 elements (2x2) in a 2D array."""
-    if d.ndim != 2:
-        # we can't guarantee what blocks we are getting and how
-        # it should be reshaped to do the averaging.
-        raise ValueError("Can't aggregrate (reduce) data arrays with "
-                         "more than 2 dimensions.")
-    if not (x_size.is_integer() and y_size.is_integer()):
+def _aggregate(d, factors, aggregation="mean"):
+    """Reduce every block of ``factors`` elements of an array to one element.
+
+    The reduced chunks follow the input chunks, so the input array is never
+    rechunked. When a block of elements crosses the boundary between two
+    input chunks, the task computing the output chunk takes the elements it
+    needs from both input chunks.
+
+    """
+    reduce_func = _get_reduce_func(aggregation)
+    factors = tuple(_get_aggregation_factor(d, axis, factor) for axis, factor in enumerate(factors))
+    axes_pieces = [_get_aggregated_chunk_pieces(chunks, factor) for chunks, factor in zip(d.chunks, factors)]
+    new_chunks = tuple(tuple(size for size, _ in pieces) for pieces in axes_pieces)
+    dtype = _get_aggregated_dtype(d.dtype, aggregation)
+    name = "aggregate-" + tokenize(d, factors, aggregation)
+    dsk = {}
+    for out_idx in itertools.product(*(range(len(pieces)) for pieces in axes_pieces)):
+        block_pieces = [axes_pieces[axis][idx][1] for axis, idx in enumerate(out_idx)]
+        dsk[(name,) + out_idx] = (_reduce_pieces, _get_pieces_tasks(d.name, block_pieces), factors, reduce_func)
+    graph = HighLevelGraph.from_collections(name, dsk, dependencies=[d])
+    return da.Array(graph, name, chunks=new_chunks, meta=np.array((), dtype=dtype))
+
+
+def _get_aggregation_factor(d, axis, factor):
+    if not float(factor).is_integer():
         raise ValueError("Aggregation factors are not integers")
-    y_size = int(y_size)
-    x_size = int(x_size)
-    d = _rechunk_if_nonfactor_chunks(d, y_size, x_size)
-    new_chunks = (tuple(int(x / y_size) for x in d.chunks[0]),
-                  tuple(int(x / x_size) for x in d.chunks[1]))
-    return da.core.map_blocks(_mean, d, y_size, x_size,
-                              meta=np.array((), dtype=d.dtype),
-                              dtype=d.dtype, chunks=new_chunks)
+    factor = int(factor)
+    if d.shape[axis] % factor != 0:
+        raise ValueError("Aggregation requires arrays with shapes divisible by the factor.")
+    return factor
+
+
+def _get_aggregated_chunk_pieces(chunks, factor):
+    """Get the size of the aggregated chunks and the pieces of input chunks they are made of.
+
+    The pieces are ``(chunk_index, slice)`` tuples. Each output chunk ends at
+    the last complete block of ``factor`` elements of an input chunk, so the
+    output chunks have the same number of chunks as the input, except input
+    chunks smaller than the factor.
+
+    """
+    if factor == 1:
+        return [(size, [(idx, slice(None))]) for idx, size in enumerate(chunks)]
+    bounds = np.cumsum((0,) + tuple(chunks))
+    out_bounds = sorted(set(int(bound) // factor for bound in bounds))
+    aggregated = []
+    for out_start, out_end in zip(out_bounds[:-1], out_bounds[1:]):
+        start, end = out_start * factor, out_end * factor
+        pieces = []
+        for idx, (chunk_start, chunk_end) in enumerate(zip(bounds[:-1], bounds[1:])):
+            if chunk_start < end and chunk_end > start:
+                piece = slice(int(max(start, chunk_start) - chunk_start), int(min(end, chunk_end) - chunk_start))
+                if piece == slice(0, int(chunk_end - chunk_start)):
+                    piece = slice(None)
+                pieces.append((idx, piece))
+        aggregated.append((out_end - out_start, pieces))
+    return aggregated
+
+
+def _get_pieces_tasks(name, block_pieces):
+    """Get the tasks getting the input pieces of an output chunk, in nested lists when there are several."""
+    if all(len(pieces) == 1 for pieces in block_pieces):
+        return _get_piece_task(name, tuple(pieces[0] for pieces in block_pieces))
+    return _get_nested_pieces_tasks(name, block_pieces, ())
+
+
+def _get_nested_pieces_tasks(name, block_pieces, in_pieces):
+    if len(in_pieces) == len(block_pieces):
+        return _get_piece_task(name, in_pieces)
+    return [_get_nested_pieces_tasks(name, block_pieces, in_pieces + (piece,))
+            for piece in block_pieces[len(in_pieces)]]
+
+
+def _get_piece_task(name, in_pieces):
+    key = (name,) + tuple(idx for idx, _ in in_pieces)
+    slices = tuple(piece for _, piece in in_pieces)
+    if all(slc == slice(None) for slc in slices):
+        return key
+    return (operator.getitem, key, slices)
+
 
+def _reduce_pieces(pieces, factors, reduce_func):
+    data = np.block(pieces) if isinstance(pieces, list) else pieces
+    grouped_shape = []
+    for size, factor in zip(data.shape, factors):
+        grouped_shape.extend((size // factor, factor))
+    ndim = data.ndim
+    # put the elements of each block last, then flatten them to reduce along one axis
+    grouped = data.reshape(grouped_shape).transpose(tuple(range(0, 2 * ndim, 2)) + tuple(range(1, 2 * ndim, 2)))
+    grouped = grouped.reshape(grouped.shape[:ndim] + (-1,))
+    return reduce_func(grouped)
 
-def _mean(data, y_size, x_size):
-    rows, cols = data.shape
-    new_shape = (int(rows / y_size), int(y_size),
-                 int(cols / x_size), int(x_size))
-    data_mean = np.nanmean(data.reshape(new_shape), axis=(1, 3))
-    return data_mean
+
+def _mean(grouped):
+    return np.nanmean(grouped, axis=-1)
+
+
+def _max(grouped):
+    return np.nanmax(grouped, axis=-1)
+
+
+def _min(grouped):
+    return np.nanmin(grouped, axis=-1)
+
+
+def _mode(grouped):
+    """Get the most frequent value of each group, the smallest one for ties.
+
+    NaN values are ignored, unless all the values of the group are NaN.
+
+    """
+    values = np.sort(grouped, axis=-1)
+    positions = np.arange(values.shape[-1])
+    run_starts = np.ones(values.shape, dtype=bool)
+    run_starts[..., 1:] = values[..., 1:] != values[..., :-1]
+    run_lengths = positions - np.maximum.accumulate(np.where(run_starts, positions, 0), axis=-1)
+    # NaN values are all different from each other, so they never make the longest run
+    longest_run_ends = np.argmax(run_lengths, axis=-1)
+    return np.take_along_axis(values, longest_run_ends[..., np.newaxis], axis=-1)[..., 0]
+
+
+AGGREGATIONS = {
+    "mean": _mean,
+    "max": _max,
+    "min": _min,
+    "mode": _mode,
+}
+
+
+def _get_reduce_func(aggregation):
+    try:
+        return AGGREGATIONS[aggregation]
+    except KeyError:
+        raise ValueError(f"Unknown aggregation '{aggregation}', use one of {sorted(AGGREGATIONS)}.") from None
+
+
+def _get_aggregated_dtype(dtype, aggregation):
+    if aggregation == "mean" and not np.issubdtype(dtype, np.inexact):
+        return np.dtype(np.float64)
+    return dtype
 
 
 def _replicate(d_arr, repeats):
@@ -161,33 +296,6 @@ def _repeat_by_factor(data, block_info=None):
     return out_data
 
 
-def _rechunk_if_nonfactor_chunks(dask_arr, y_size, x_size):
-    new_chunks = list(dask_arr.chunks)
-    for dim_idx, agg_size in enumerate([y_size, x_size]):
-        if dask_arr.shape[dim_idx] % agg_size != 0:
-            raise ValueError("Aggregation requires arrays with shapes divisible by the factor.")
-        need_rechunk = _check_chunking(new_chunks, dask_arr, dim_idx, agg_size)
-    if need_rechunk:
-        warnings.warn(
-            "Array chunk size is not divisible by aggregation factor. "
-            "Re-chunking to continue native resampling.",
-            PerformanceWarning,
-            stacklevel=5
-        )
-        dask_arr = dask_arr.rechunk(tuple(new_chunks))
-    return dask_arr
-
-
-def _check_chunking(new_chunks, dask_arr, dim_idx, agg_size):
-    need_rechunk = False
-    for chunk_size in dask_arr.chunks[dim_idx]:
-        if chunk_size % agg_size != 0:
-            need_rechunk = True
-            new_dim_chunk = lcm(chunk_size, agg_size)
-            new_chunks[dim_idx] = new_dim_chunk
-    return need_rechunk
-
-
 def get_resampler_classes():
     """Get classes based on native resampler."""
     return {"native": NativeResampler}
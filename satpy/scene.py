@@ -29,6 +29,7 @@ import xarray as xr
 from pyresample.geometry import AreaDefinition, BaseDefinition, CoordinateDefinition, SwathDefinition
 from xarray import DataArray
 
+from satpy._area_slices import get_area_slices
 from satpy.area import get_area_def
 from satpy.composites.config_loader import load_compositor_configs_for_sensors
 from satpy.composites.core import IncompatibleAreas
@@ -60,6 +61,24 @@ def _aggregate_data_array(data_array, func, **coarsen_kwargs):
     return out
 
 
+def _get_target_save_kwargs(save_kwargs, target_name):
+    """Replace ``{target}`` in the output paths of the save keyword arguments."""
+    target_kwargs = save_kwargs.copy()
+    for key in ("filename", "base_dir"):
+        if isinstance(target_kwargs.get(key), str):
+            target_kwargs[key] = target_kwargs[key].replace("{target}", target_name)
+    return target_kwargs
+
+
+def _check_target_save_kwargs(save_kwargs, target_names):
+    """Check that the targets are not all saved to the same output paths."""
+    if len(target_names) < 2:
+        return
+    if not any("{target}" in str(save_kwargs.get(key, "")) for key in ("filename", "base_dir")):
+        raise ValueError("Saving several targets requires '{target}' in the 'filename' or 'base_dir' "
+                         "save keyword arguments, otherwise the targets overwrite each other.")
+
+
 class DelayedGeneration(KeyError):
     """Mark that a dataset can't be generated without further modification."""
 
@@ -624,7 +643,7 @@ class Scene:
                 "crop_area", "crop_area", "crop_xy",
                 src_area.crs, src_area.width, src_area.height,
                 xy_bbox)
-        x_slice, y_slice = src_area.get_area_slices(dst_area)
+        x_slice, y_slice = get_area_slices(src_area, dst_area)
         return src_area[y_slice, x_slice], y_slice, x_slice
 
     def _slice_datasets(self, dataset_ids, slice_key, new_area, area_only=True):
@@ -861,21 +880,21 @@ class Scene:
 
         return dataset
 
-    def _resampled_scene(self, new_scn, destination_area, reduce_data=True,
+    def _resampled_scene(self, new_scn, destination_area, reduce_data=True, batch=False,
                          **resample_kwargs):
         """Resample `datasets` to the `destination` area.
 
         If data reduction is enabled, some local caching is perfomed in order to
         avoid recomputation of area intersections.
         """
-        from satpy.resample.base import resample_dataset
-
         new_datasets = {}
         datasets = list(new_scn._datasets.values())
         destination_area = self._get_finalized_destination_area(destination_area, new_scn)
 
         resamplers = {}
         reductions = {}
+        batched = self._resample_batches(datasets, destination_area, reduce_data, resamplers, reductions,
+                                         resample_kwargs) if batch else {}
         for dataset, parent_dataset in dataset_walker(datasets):
             ds_id = DataID.from_dataarray(dataset)
             pres = None
@@ -892,20 +911,63 @@ class Scene:
                 else:
                     replace_anc(dataset, pres)
                 continue
-            LOG.debug("Resampling %s", ds_id)
-            source_area = dataset.attrs["area"]
-            dataset, source_area = self._reduce_data(dataset, source_area, destination_area,
-                                                     reduce_data, reductions, resample_kwargs)
-            self._prepare_resampler(source_area, destination_area, resamplers, resample_kwargs)
-            kwargs = resample_kwargs.copy()
-            kwargs["resampler"] = resamplers[source_area]
-            res = resample_dataset(dataset, destination_area, **kwargs)
+            res = batched.get(ds_id)
+            if res is None:
+                res = self._resample_dataset(dataset, destination_area, reduce_data, resamplers, reductions,
+                                             resample_kwargs)
             new_datasets[ds_id] = res
             if ds_id in new_scn._datasets:
                 new_scn._datasets[ds_id] = res
             if parent_dataset is not None:
                 replace_anc(res, pres)
 
+    def _resample_dataset(self, dataset, destination_area, reduce_data, resamplers, reductions,
+                          resample_kwargs):
+        from satpy.resample.base import resample_dataset
+
+        LOG.debug("Resampling %s", DataID.from_dataarray(dataset))
+        source_area = dataset.attrs["area"]
+        dataset, source_area = self._reduce_data(dataset, source_area, destination_area,
+                                                 reduce_data, reductions, resample_kwargs)
+        self._prepare_resampler(source_area, destination_area, resamplers, resample_kwargs)
+        kwargs = resample_kwargs.copy()
+        kwargs["resampler"] = resamplers[source_area]
+        return resample_dataset(dataset, destination_area, **kwargs)
+
+    def _resample_batches(self, datasets, destination_area, reduce_data, resamplers, reductions,
+                          resample_kwargs):
+        """Resample together the datasets sharing their source area and resampler.
+
+        Returns:
+            The resampled datasets by DataID, for the datasets which could be
+            batched with others.
+
+        """
+        from satpy.resample.base import get_batch_key, resample_datasets
+
+        batches = {}
+        for dataset in datasets:
+            source_area = dataset.attrs.get("area")
+            if source_area is None:
+                continue
+            dataset, source_area = self._reduce_data(dataset, source_area, destination_area,
+                                                     reduce_data, reductions, resample_kwargs)
+            self._prepare_resampler(source_area, destination_area, resamplers, resample_kwargs)
+            key = get_batch_key(dataset, resamplers[source_area], **resample_kwargs)
+            if key is not None:
+                batches.setdefault(key, []).append(dataset)
+
+        batched = {}
+        for batch in batches.values():
+            if len(batch) < 2:
+                continue
+            LOG.debug("Resampling %s together", ", ".join(str(dataset.attrs.get("name")) for dataset in batch))
+            kwargs = resample_kwargs.copy()
+            kwargs["resampler"] = resamplers[batch[0].attrs["area"]]
+            for dataset, res in zip(batch, resample_datasets(batch, destination_area, **kwargs)):
+                batched[DataID.from_dataarray(dataset)] = res
+        return batched
+
     def _get_finalized_destination_area(self, destination_area, new_scn):
         if isinstance(destination_area, str):
             destination_area = get_area_def(destination_area)
@@ -938,12 +1000,8 @@ class Scene:
                         factor = resample_kwargs.get("shape_divisible_by", 2)
                     else:
                         factor = None
-                    try:
-                        slice_x, slice_y = source_area.get_area_slices(
-                            destination_area, shape_divisible_by=factor)
-                    except TypeError:
-                        slice_x, slice_y = source_area.get_area_slices(
-                            destination_area)
+                    slice_x, slice_y = get_area_slices(source_area, destination_area,
+                                                       shape_divisible_by=factor)
                     source_area = source_area[slice_y, slice_x]
                     reductions[key] = (slice_x, slice_y), source_area
                 dataset = self._slice_data(source_area, (slice_x, slice_y), dataset)
@@ -961,6 +1019,7 @@ class Scene:
             unload: bool = True,
             resampler: str | None = None,
             reduce_data: bool = True,
+            batch: bool = False,
             **resample_kwargs,
     ) -> Scene:
         """Resample datasets and return a new scene.
@@ -983,6 +1042,13 @@ class Scene:
                 information.
             reduce_data: Reduce data by matching the input and output
                 areas and slicing the data arrays (default: True)
+            batch: Resample all the 2D datasets sharing their source area
+                in one pass, by stacking them along an extra dimension
+                (default: False). This makes smaller dask graphs for scenes
+                with many bands. Only the 'nearest' and 'bilinear'
+                resamplers support it, and 'nearest' only for swath data when
+                ``mask_area=False`` is passed, as the mask of swath data
+                depends on the values of every dataset.
             resample_kwargs: Remaining keyword arguments to pass to individual
                 resampler classes. See the individual resampler class
                 documentation :mod:`here <satpy.resample>` for available
@@ -993,7 +1059,7 @@ class Scene:
             destination = self.finest_area(datasets)
         new_scn = self.copy(datasets=datasets)
         self._resampled_scene(new_scn, destination, resampler=resampler,
-                              reduce_data=reduce_data, **resample_kwargs)
+                              reduce_data=reduce_data, batch=batch, **resample_kwargs)
 
         # regenerate anything from the wishlist that needs it (combining
         # multiple resolutions, etc.)
@@ -1002,6 +1068,63 @@ class Scene:
 
         return new_scn
 
+    def resample_many(
+            self,
+            destinations: dict[str, AreaDefinition | CoordinateDefinition | str],
+            datasets: Iterable | None = None,
+            generate: bool = True,
+            unload: bool = True,
+            save_kwargs: dict | None = None,
+            **resample_kwargs,
+    ) -> dict[str, Scene]:
+        """Resample datasets to several areas and return a new scene for each of them.
+
+        All the new scenes are built from the same source data arrays, so the
+        data read from the files and the modifiers applied to it are shared
+        by the dask graphs of every target. Computing the scenes together,
+        for example with ``save_kwargs``, reads and modifies the source data
+        only once for all the targets, instead of once per call to
+        :meth:`resample`.
+
+        Args:
+            destinations: Areas to resample to, by target name. The areas can
+                be area definitions or names of areas.
+            datasets: Limit datasets to resample to these specified
+                data arrays. By default all currently loaded
+                datasets are resampled.
+            generate: Generate any requested composites that could not
+                be previously due to incompatible areas (default: True).
+            unload: Remove any datasets no longer needed after
+                requested composites have been generated (default: True).
+            save_kwargs: If given, save the datasets of all the new scenes
+                with these keyword arguments to :meth:`save_datasets`, and
+                compute all the saves together. ``{target}`` in the
+                ``filename`` and ``base_dir`` arguments is replaced by the
+                name of the target, to write each target to its own files.
+            resample_kwargs: Remaining keyword arguments to pass to
+                :meth:`resample`, like ``resampler``, ``reduce_data`` or the
+                arguments of the resampler classes.
+
+        Returns:
+            The resampled scenes, by target name.
+
+        Raises:
+            ValueError: If ``save_kwargs`` are given for several targets
+                without ``{target}`` in ``filename`` or ``base_dir``.
+
+        """
+        if save_kwargs is not None:
+            _check_target_save_kwargs(save_kwargs, destinations)
+        new_scenes = {name: self.resample(destination, datasets=datasets, generate=generate,
+                                          unload=unload, **resample_kwargs)
+                      for name, destination in destinations.items()}
+        if save_kwargs is not None:
+            from satpy.writers.core.compute import compute_writer_results
+            results = [new_scn.save_datasets(compute=False, **_get_target_save_kwargs(save_kwargs, name))
+                       for name, new_scn in new_scenes.items()]
+            compute_writer_results(results)
+        return new_scenes
+
     def show(self, dataset_id, overlay=None):
         """Show the *dataset* on screen as an image.
 
@@ -1354,6 +1477,83 @@ class Scene:
 
         return new_scn
 
+    def merge_equivalent_tasks(self, datasets=None):
+        """Merge the equivalent dask tasks of the datasets.
+
+        Composites and modifiers applied to the same inputs can produce
+        equivalent dask tasks with different names, which are computed again
+        for every composite. This merges the tasks calling the same functions
+        with the same arguments, so that inputs shared by many composites,
+        like corrected bands, are read and computed only once when the
+        datasets are computed or saved together::
+
+            scn.load(["true_color", "natural_color", "airmass"])
+            scn = scn.merge_equivalent_tasks()
+            scn.save_datasets()
+
+        Args:
+            datasets (list): DataIDs of the datasets to process. All datasets
+                are processed by default.
+
+        Returns:
+            A copy of the Scene with the new datasets.
+
+        """
+        from satpy._scene_dedup import merge_equivalent_tasks
+        new_scn = self.copy()
+        data_ids = list(new_scn.keys()) if datasets is None else [new_scn[ds].attrs["_satpy_id"] for ds in datasets]
+        data_arrays = merge_equivalent_tasks([new_scn._datasets[data_id] for data_id in data_ids])
+        for data_id, data_arr in zip(data_ids, data_arrays):
+            new_scn._datasets[data_id] = data_arr
+        return new_scn
+
+    def plan(self, wishlist=None, area=None, writer=None, memory_limit=None,
+             load_kwargs=None, resample_kwargs=None, writer_kwargs=None):
+        """Estimate the resources needed to load, resample and save datasets.
+
+        The datasets are loaded lazily in a copy of this Scene, optionally
+        resampled to ``area`` and enhanced for ``writer``, and the resulting
+        dask graphs are inspected without computing anything. This can be
+        used to size the memory of the workers before processing large
+        scenes::
+
+            plan = scn.plan(["true_color"], area="euro4", writer="geotiff",
+                            memory_limit="4GiB")
+            print(plan)
+            with dask.config.set({"array.chunk-size": plan.suggested_chunk_size}):
+                scn.load(["true_color"])
+
+        The chunk size suggestion only affects readers using
+        :func:`~satpy.utils.get_chunk_size_limit` to chunk their data.
+
+        Args:
+            wishlist (Iterable): Datasets to load, as in :meth:`load`. If not
+                provided, the datasets already in the Scene are planned.
+            area: Area to resample the datasets to, as in :meth:`resample`.
+            writer (str): Name of the writer the datasets would be saved
+                with. Image writers include the enhancement of the datasets
+                in the plan. Products are assumed to be kept in memory when
+                no writer is given.
+            memory_limit (int or str): Memory available to a worker, in
+                bytes or as a string like ``"4GiB"``, used to suggest a chunk
+                size.
+            load_kwargs (dict): Additional keyword arguments for :meth:`load`.
+            resample_kwargs (dict): Additional keyword arguments for
+                :meth:`resample`.
+            writer_kwargs (dict): Additional keyword arguments to create the
+                writer.
+
+        Returns:
+            :class:`~satpy._scene_plan.ScenePlan` with the estimated peak
+            memory, number of tasks, bytes read per file and suggested chunk
+            size.
+
+        """
+        from satpy._scene_plan import plan_scene
+        return plan_scene(self, wishlist=wishlist, area=area, writer=writer, memory_limit=memory_limit,
+                          load_kwargs=load_kwargs, resample_kwargs=resample_kwargs,
+                          writer_kwargs=writer_kwargs)
+
     @staticmethod
     def _get_writer_by_ext(extension):
         """Find the writer matching the ``extension``.
@@ -1396,6 +1596,59 @@ class Scene:
         LOG.warning("The following datasets were not created and may require "
                     "resampling to be generated: {}".format(missing_str))
 
+    def add_files(self, filenames):
+        """Add files arriving after the Scene was created to its readers.
+
+        This is meant for near real-time processing of segmented data (e.g.
+        from the ``ahi_hsd`` or ``fci_l1c_nc`` readers): the Scene can be
+        created and the datasets loaded as soon as the first segments
+        arrive, the missing segments being padded, and the later segments
+        added when they arrive::
+
+            >>> scn = Scene(reader="ahi_hsd", filenames=first_segments)
+            >>> scn.load(["B03"])
+            >>> scn.save_datasets()
+            >>> scn.add_files(next_segments)
+            >>> scn.load(["B03"])
+
+        The datasets loaded from the readers getting new files, and all the
+        composites, are removed from the Scene, so that loading them again
+        reads the new segments too. The datasets added to the Scene by the
+        user are kept. See
+        :meth:`~satpy.readers.core.yaml_reader.GEOSegmentYAMLReader.get_available_segments`
+        for the segments available from segmented readers.
+
+        Args:
+            filenames (Iterable or dict): Files to add, or a mapping of reader
+                names to the files to add to each reader. The files the
+                readers already have are ignored.
+
+        """
+        if isinstance(filenames, str):
+            raise ValueError("'filenames' must be a list of files: Scene.add_files([filename])")
+        if isinstance(filenames, dict):
+            reader_filenames = filenames
+        else:
+            reader_filenames = {reader_name: filenames for reader_name in self._readers}
+        updated_readers = set()
+        for reader_name, reader_files in reader_filenames.items():
+            if self._readers[reader_name].add_files(reader_files):
+                updated_readers.add(reader_name)
+        if updated_readers:
+            self._remove_datasets_from_readers(updated_readers)
+
+    def _remove_datasets_from_readers(self, reader_names):
+        """Remove the datasets loaded from *reader_names* and the composites, which may depend on them."""
+        for ds_id in list(self._datasets.keys()):
+            try:
+                node = self._dependency_tree.getitem(ds_id)
+            except KeyError:
+                continue
+            if isinstance(node, CompositorNode) or (isinstance(node, ReaderNode) and
+                                                    node.reader_name in reader_names):
+                LOG.debug("Unloading dataset to read it again: %r", ds_id)
+                del self._datasets[ds_id]
+
     def unload(self, keepables=None):
         """Unload all unneeded datasets.
 
@@ -46,8 +46,16 @@ def _reset_satpy_config(tmpdir):
 @pytest.fixture(autouse=True)
 def _clear_function_caches():
     """Clear out global function-level caches that may cause conflicts between tests."""
+    from satpy import _area_slices
     from satpy.composites.config_loader import load_compositor_configs_for_sensor
+    from satpy.modifiers.angles import clear_geometry_memos
+    from satpy.readers.core.registry import clear_registries
+    from satpy.resample import bucket
     load_compositor_configs_for_sensor.cache_clear()
+    clear_geometry_memos()
+    clear_registries()
+    _area_slices._MEMORY_CACHE.clear()
+    bucket._BUCKET_RESAMPLERS.clear()
 
 
 @pytest.fixture
@@ -70,6 +70,41 @@ class TestEnhancer:
         assert lines[1].startswith("  reader=")
         assert lines[2].startswith("    platform_name=")
 
+    def test_cached_tree(self, tmp_path):
+        """Test that decision trees built from configuration files are cached."""
+        from unittest import mock
+
+        import satpy
+        from satpy.enhancements.enhancer import EnhancementDecisionTree
+
+        config_file = tmp_path / "generic.yaml"
+        config_file.write_text("""enhancements:
+  default:
+    operations: []
+  enh1:
+    name: ch1
+    operations: [{name: stretch}]
+""")
+        sensor_file = tmp_path / "abi.yaml"
+        sensor_file.write_text("""enhancements:
+  enh2:
+    name: ch2
+    sensor: abi
+    operations: [{name: gamma}]
+""")
+        with satpy.config.set(cache_yaml_configs=True, cache_dir=str(tmp_path / "cache")):
+            EnhancementDecisionTree(config_file).add_config_to_tree(sensor_file)
+            with mock.patch.object(EnhancementDecisionTree, "_build_tree") as build_tree:
+                tree = EnhancementDecisionTree(config_file)
+                tree.add_config_to_tree(sensor_file)
+            build_tree.assert_not_called()
+            assert tree.find_match(name="ch1")["operations"] == [{"name": "stretch"}]
+            assert tree.find_match(name="ch2", sensor="abi")["operations"] == [{"name": "gamma"}]
+            assert tree.find_match(name="ch3")["operations"] == []
+            with mock.patch.object(EnhancementDecisionTree, "_build_tree") as build_tree:
+                tree.add_config_to_tree({"enh2": {"name": "ch2", "operations": []}})
+            build_tree.assert_called_once()
+
 
 def test_xrimage_1d():
     """Conversion to image."""
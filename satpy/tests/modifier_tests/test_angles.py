@@ -298,6 +298,132 @@ class TestAngleGeneration:
         zarr_dirs = glob(str(tmp_path / "*.zarr"))
         assert len(zarr_dirs) == 0
 
+    def test_cache_info_and_eviction(self, tmp_path):
+        """Test cache statistics and removal of least recently used cache entries."""
+        import os
+
+        from satpy.modifiers.angles import _ZARR_ENTRIES_IN_USE, cache_to_zarr_if
+
+        @cache_to_zarr_if("cache_lonlats")
+        def _fake_func(value, chunks):
+            return da.full((10, 10), value, chunks=chunks), da.zeros((10, 10), chunks=chunks)
+
+        chunks = ((10,), (10,))
+        with satpy.config.set(cache_lonlats=True, cache_dir=str(tmp_path)):
+            _fake_func(1, chunks)
+            _fake_func(1, chunks)
+            info = _fake_func.cache_info()
+            assert (info.hits, info.misses, info.evictions) == (1, 1, 0)
+            assert info.bytes_written == info.currsize > 0
+            entry_size = info.currsize
+            assert len(glob(str(tmp_path / "*.zarr"))) == 2
+            assert not glob(str(tmp_path / ".tmp-*"))
+
+            with satpy.config.set(zarr_cache_max_size=int(entry_size * 2.5)):
+                _fake_func(2, chunks)
+                # pretend the entries were returned by another process that is done with them
+                _ZARR_ENTRIES_IN_USE.clear()
+                for zarr_dir in glob(str(tmp_path / "*.zarr")):
+                    os.utime(zarr_dir, (0, 0))
+                # use the first entry so that the second one is the least recently used
+                _fake_func(1, chunks)
+                res = _fake_func(3, chunks)
+            np.testing.assert_equal(res[0].compute(), 3)
+            info = _fake_func.cache_info()
+            assert (info.hits, info.misses, info.evictions) == (2, 3, 1)
+            assert len(glob(str(tmp_path / "*.zarr"))) == 4
+
+            with satpy.config.set(zarr_cache_max_age=60):
+                _ZARR_ENTRIES_IN_USE.clear()
+                for zarr_dir in glob(str(tmp_path / "*.zarr")):
+                    os.utime(zarr_dir, (0, 0))
+                _fake_func(4, chunks)
+            assert _fake_func.cache_info().evictions == 3
+            assert len(glob(str(tmp_path / "*.zarr"))) == 2
+            _fake_func.cache_clear()
+
+    def test_eviction_keeps_entries_in_use(self, tmp_path):
+        """Test that cache entries that may still be read by lazy arrays are not removed."""
+        from satpy.modifiers.angles import _ZARR_ENTRIES_IN_USE, cache_to_zarr_if
+
+        @cache_to_zarr_if("cache_lonlats")
+        def _fake_func(value, chunks):
+            return (da.full((10, 10), value, chunks=chunks),)
+
+        chunks = ((10,), (10,))
+        with satpy.config.set(cache_lonlats=True, cache_dir=str(tmp_path), zarr_cache_max_size=1):
+            res1 = _fake_func(1.0, chunks)
+            _fake_func(2.0, chunks)
+            np.testing.assert_equal(res1[0].compute(), 1.0)
+            assert len(glob(str(tmp_path / "*.zarr"))) == 2
+
+            # entries returned by other processes are kept while recently used
+            _ZARR_ENTRIES_IN_USE.clear()
+            res3 = _fake_func(3.0, chunks)
+            assert len(glob(str(tmp_path / "*.zarr"))) == 3
+            with satpy.config.set(zarr_cache_min_age=0):
+                res4 = _fake_func(4.0, chunks)
+            assert len(glob(str(tmp_path / "*.zarr"))) == 2
+            np.testing.assert_equal(res3[0].compute(), 3.0)
+            np.testing.assert_equal(res4[0].compute(), 4.0)
+            _fake_func.cache_clear()
+
+    def test_eviction_of_entries_used_earlier(self, tmp_path):
+        """Test that entries used by this process are removed once no dask array reads them anymore."""
+        import gc
+
+        from satpy.modifiers.angles import _ZARR_ENTRIES_IN_USE, cache_to_zarr_if
+
+        @cache_to_zarr_if("cache_lonlats")
+        def _fake_func(value, chunks):
+            return (da.full((10, 10), value, chunks=chunks),)
+
+        chunks = ((10,), (10,))
+        with satpy.config.set(cache_lonlats=True, cache_dir=str(tmp_path), zarr_cache_max_size=1,
+                              zarr_cache_min_age=0):
+            derived = _fake_func(1.0, chunks)[0] + 1
+            gc.collect()
+            _fake_func(2.0, chunks)
+            # the first entry is still read by the derived array
+            assert len(glob(str(tmp_path / "*.zarr"))) == 2
+            np.testing.assert_equal(derived.compute(), 2.0)
+
+            del derived
+            gc.collect()
+            res = _fake_func(3.0, chunks)
+            assert len(glob(str(tmp_path / "*.zarr"))) == 1
+            assert len(_ZARR_ENTRIES_IN_USE) == 1
+            np.testing.assert_equal(res[0].compute(), 3.0)
+            _fake_func.cache_clear()
+
+    def test_geometry_memo(self):
+        """Test that the same geometry is only generated once."""
+        from satpy.modifiers.angles import _get_valid_lonlats, get_angles, get_cos_sza
+
+        data = _get_angle_test_data()
+        angles1 = get_angles(data)
+        angles2 = get_angles(data.copy())
+        # same graph keys, so dask computes them once when used together
+        for angle_arr1, angle_arr2 in zip(angles1, angles2):
+            assert angle_arr1.data.name == angle_arr2.data.name
+        assert get_cos_sza(data).data is get_cos_sza(data).data
+        info = _get_valid_lonlats.__wrapped__.cache_info()
+        assert info.misses == 1
+        assert info.currsize == 1
+
+        other_time = data.copy()
+        other_time.attrs["start_time"] = data.attrs["start_time"] + dt.timedelta(seconds=30)
+        assert get_cos_sza(other_time).data is not get_cos_sza(data).data
+        with satpy.config.set(geometry_memo_time_bucket=600):
+            assert get_cos_sza(other_time).data is get_cos_sza(data).data
+
+        with satpy.config.set(geometry_memo_max_entries=1):
+            other_chunks = data.chunk(5)
+            get_cos_sza(other_chunks)
+            assert _get_valid_lonlats.__wrapped__.cache_info().currsize == 1
+        with satpy.config.set(geometry_memo_max_entries=0):
+            assert get_cos_sza(data).data is not get_cos_sza(data).data
+
     def test_cached_no_chunks_fails(self, tmp_path):
         """Test that trying to pass non-dask arrays and no chunks fails."""
         from satpy.modifiers.angles import _sanitize_args_with_chunks, cache_to_zarr_if
@@ -384,6 +384,29 @@ class TestAHIHSDFileHandler:
             assert data.dtype == data.compute().dtype
             assert data.dtype == np.float32
 
+    def test_read_band_with_cached_header(self, hsd_file_jp01, tmp_path):
+        """Test that cached headers are used for a second file handler on the same file."""
+        import satpy
+        filename_info = {"segment": 1, "total_segments": 1}
+        filetype_info = {"file_type": "blahB01"}
+        key = {"name": "B01", "calibration": "counts", "resolution": 1000}
+        ds_info = {"units": "%", "standard_name": "toa_bidirectional_reflectance",
+                   "wavelength": 2, "resolution": 1000}
+        with satpy.config.set(cache_dir=str(tmp_path / "cache"), cache_file_headers=True):
+            with warnings.catch_warnings(record=True) as expected_warnings:
+                warnings.simplefilter("always")
+                expected = AHIHSDFileHandler(hsd_file_jp01, filename_info, filetype_info).read_band(key, ds_info)
+            with mock.patch("satpy.readers.ahi_hsd.np.fromfile", side_effect=AssertionError), \
+                    warnings.catch_warnings(record=True) as cached_warnings:
+                warnings.simplefilter("always")
+                fh = AHIHSDFileHandler(hsd_file_jp01, filename_info, filetype_info)
+                data = fh.read_band(key, ds_info)
+        np.testing.assert_array_equal(data.compute(), expected.compute())
+        # the header checks are still warned about when the header comes from the cache
+        header_warnings = [str(w.message) for w in expected_warnings if "header size" in str(w.message)]
+        assert header_warnings
+        assert [str(w.message) for w in cached_warnings if "header size" in str(w.message)] == header_warnings
+
     @mock.patch("satpy.readers.ahi_hsd.AHIHSDFileHandler._read_data")
     @mock.patch("satpy.readers.ahi_hsd.AHIHSDFileHandler._mask_invalid")
     @mock.patch("satpy.readers.ahi_hsd.AHIHSDFileHandler.calibrate")
@@ -113,6 +113,8 @@ class TestHDF5FileHandler(unittest.TestCase):
 
     def tearDown(self):
         """Remove the previously created test file."""
+        from satpy.readers.core.hdf5 import FILE_POOL
+        FILE_POOL.close()
         os.remove("test.h5")
 
     def test_all_basic(self):
@@ -160,3 +162,77 @@ class TestHDF5FileHandler(unittest.TestCase):
 
         assert file_handler[dsname].data.name == file_handler[dsname].data.name
         assert file_handler[dsname].data.name.startswith("/" + dsname)
+
+    def test_file_handle_reused(self):
+        """Test that repeated dataset access reuses one pooled file handle."""
+        from unittest import mock
+
+        from satpy.readers.core.hdf5 import FILE_POOL, HDF5FileHandler
+        file_handler = HDF5FileHandler("test.h5", {}, {})
+        assert "test.h5" in FILE_POOL
+
+        with mock.patch("satpy.readers.core.hdf5.h5py.File") as h5_file:
+            for ds_name in ("test_group/ds1_f", "test_group/ds1_i", "ds2_f", "ds2_i"):
+                data = file_handler[ds_name].compute()
+                assert data.shape == (10, 100)
+            assert isinstance(file_handler["ds2_f/attr/test_ref"], np.ndarray)
+            h5_file.assert_not_called()
+
+    def test_file_pool_eviction(self):
+        """Test that the least recently used file is closed when the pool is full."""
+        import shutil
+
+        import satpy
+        from satpy.readers.core.hdf5 import FILE_POOL, HDF5FileHandler
+        shutil.copy("test.h5", "test2.h5")
+        try:
+            with satpy.config.set({"readers.hdf5_max_open_files": 1}):
+                fh1 = HDF5FileHandler("test.h5", {}, {})
+                fh2 = HDF5FileHandler("test2.h5", {}, {})
+                assert len(FILE_POOL) == 1
+                assert "test2.h5" in FILE_POOL
+                arr1 = fh1["ds2_f"]
+                arr2 = fh2["ds2_f"]
+                np.testing.assert_allclose(arr1.values, arr2.values)
+                assert len(FILE_POOL) == 1
+        finally:
+            FILE_POOL.close()
+            os.remove("test2.h5")
+
+    def test_file_replaced_on_disk(self):
+        """Test that a file replaced on disk is opened again instead of serving stale data."""
+        import h5py
+
+        from satpy.readers.core.hdf5 import FILE_POOL, HDF5FileHandler
+        file_handler = HDF5FileHandler("test.h5", {}, {})
+        np.testing.assert_array_equal(file_handler["ds2_i"].values, np.arange(10 * 100).reshape((10, 100)))
+
+        with h5py.File("test_new.h5", "w") as h:
+            h.create_dataset("ds2_i", data=np.zeros((10, 100), dtype=np.int32))
+        os.replace("test_new.h5", "test.h5")
+        with FILE_POOL.open("test.h5") as file_handle:
+            np.testing.assert_array_equal(file_handle["ds2_i"][()], 0)
+
+    def test_file_object_closed_on_eviction(self):
+        """Test that the file object of a remote file is closed when the file leaves the pool."""
+        import fsspec
+
+        from satpy.readers.core.hdf5 import FILE_POOL
+        from satpy.readers.core.remote import FSFile
+        fs_file = FSFile(fsspec.open(os.path.abspath("test.h5")))
+        with FILE_POOL.open(fs_file) as file_handle:
+            np.testing.assert_array_equal(file_handle["ds2_i"][0, :3], [0, 1, 2])
+        f_obj = FILE_POOL._files[fs_file].file_obj
+        assert not f_obj.closed
+        FILE_POOL.close()
+        assert f_obj.closed
+
+    def test_pooled_dataset_pickles(self):
+        """Test that the dask array of a pooled dataset can be pickled and computed."""
+        import pickle
+
+        from satpy.readers.core.hdf5 import FILE_POOL, HDF5FileHandler
+        file_handler = HDF5FileHandler("test.h5", {}, {})
+        data = pickle.loads(pickle.dumps(file_handler["test_group/ds1_i"].data))
+        FILE_POOL.close()
+        np.testing.assert_array_equal(data.compute(), np.arange(10 * 100).reshape((10, 100)))
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the on-disk file header cache."""
+
+import os
+import threading
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import satpy
+from satpy.readers.core import header_cache
+from satpy.readers.core.header_cache import cached_file_header, clear_cache, get_cache_dir
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    """Create a small data file."""
+    filename = tmp_path / "data.bin"
+    filename.write_bytes(b"some header")
+    return filename
+
+
+def _read_header(filename):
+    with open(filename, "rb") as fd:
+        return {"content": fd.read(), "array": np.arange(3)}
+
+
+class TestCachedFileHeader:
+    """Test the cached_file_header function."""
+
+    def test_disabled_by_default(self, data_file, tmp_path):
+        """Test that nothing is cached unless configured."""
+        read_func = mock.Mock(wraps=_read_header)
+        with satpy.config.set(cache_dir=str(tmp_path / "cache")):
+            cached_file_header(data_file, "test", read_func, data_file)
+            cached_file_header(data_file, "test", read_func, data_file)
+            assert not os.path.exists(get_cache_dir())
+        assert read_func.call_count == 2
+
+    def test_cached_result_reused(self, data_file, tmp_path):
+        """Test that the header is read only once when caching."""
+        read_func = mock.Mock(wraps=_read_header)
+        with satpy.config.set(cache_dir=str(tmp_path / "cache"), cache_file_headers=True):
+            res1 = cached_file_header(data_file, "test", read_func, data_file)
+            res2 = cached_file_header(data_file, "test", read_func, data_file)
+            res3 = cached_file_header(data_file, "other", read_func, data_file)
+        assert read_func.call_count == 2
+        assert res1["content"] == res2["content"] == res3["content"] == b"some header"
+        np.testing.assert_array_equal(res2["array"], np.arange(3))
+
+    def test_modified_file_read_again(self, data_file, tmp_path):
+        """Test that a changed file is not served from the cache."""
+        with satpy.config.set(cache_dir=str(tmp_path / "cache"), cache_file_headers=True):
+            cached_file_header(data_file, "test", _read_header, data_file)
+            data_file.write_bytes(b"new header content")
+            res = cached_file_header(data_file, "test", _read_header, data_file)
+        assert res["content"] == b"new header content"
+
+    def test_corrupt_cache_file(self, data_file, tmp_path):
+        """Test that an unreadable cache entry is replaced."""
+        with satpy.config.set(cache_dir=str(tmp_path / "cache"), cache_file_headers=True):
+            cached_file_header(data_file, "test", _read_header, data_file)
+            for root, _, files in os.walk(get_cache_dir()):
+                for fname in files:
+                    with open(os.path.join(root, fname), "wb") as fd:
+                        fd.write(b"garbage")
+            res = cached_file_header(data_file, "test", _read_header, data_file)
+            assert res["content"] == b"some header"
+            res = cached_file_header(data_file, "test", mock.Mock(side_effect=AssertionError), data_file)
+            assert res["content"] == b"some header"
+
+    def test_uncacheable(self, data_file, tmp_path):
+        """Test that files and values which can't be cached are still read."""
+        with satpy.config.set(cache_dir=str(tmp_path / "cache"), cache_file_headers=True):
+            res = cached_file_header(tmp_path / "missing.bin", "test", lambda: 5)
+            assert res == 5
+            lock = cached_file_header(data_file, "test", threading.Lock)
+            assert lock is not None
+            assert not any(files for _, _, files in os.walk(get_cache_dir()))
+
+    def test_clear_cache(self, data_file, tmp_path):
+        """Test removing all cached headers."""
+        with satpy.config.set(cache_dir=str(tmp_path / "cache"), cache_file_headers=True):
+            cached_file_header(data_file, "test", _read_header, data_file)
+            assert os.path.isdir(get_cache_dir())
+            clear_cache()
+            assert not os.path.exists(get_cache_dir())
+
+    def test_eviction(self, data_file, tmp_path, monkeypatch):
+        """Test that the least recently used headers are removed when the cache is too large."""
+        monkeypatch.setattr(header_cache, "_bytes_written", 0)
+        with satpy.config.set(cache_dir=str(tmp_path / "cache"), cache_file_headers=True,
+                              file_header_cache_max_size=None):
+            cached_file_header(data_file, "first", _read_header, data_file)
+            cached_file_header(data_file, "second", _read_header, data_file)
+            (first, _, size), (second, _, _) = sorted(header_cache._get_cache_entries())
+            os.utime(first, (0, 0))
+            os.utime(second, (1, 1))
+            # using the first header makes it the most recently used one
+            cached_file_header(data_file, "first", mock.Mock(side_effect=AssertionError), data_file)
+            entries = {path for path, _, _ in header_cache._get_cache_entries()}
+            assert entries == {first, second}
+
+        with satpy.config.set(cache_dir=str(tmp_path / "cache"), cache_file_headers=True,
+                              file_header_cache_max_size=int(size * 2.5)):
+            cached_file_header(data_file, "third", _read_header, data_file)
+            entries = [path for path, _, _ in header_cache._get_cache_entries()]
+        assert len(entries) == 2
+        assert first in entries
+        assert second not in entries
+
+    def test_new_entry_never_evicted(self, data_file, tmp_path, monkeypatch):
+        """Test that the header just cached is kept even if it is larger than the maximum size."""
+        monkeypatch.setattr(header_cache, "_bytes_written", 0)
+        read_func = mock.Mock(wraps=_read_header)
+        with satpy.config.set(cache_dir=str(tmp_path / "cache"), cache_file_headers=True,
+                              file_header_cache_max_size=1):
+            cached_file_header(data_file, "first", read_func, data_file)
+            cached_file_header(data_file, "second", read_func, data_file)
+            assert len(header_cache._get_cache_entries()) == 1
+            cached_file_header(data_file, "second", read_func, data_file)
+        assert read_func.call_count == 2
@@ -190,6 +190,19 @@ class TestHRITFileHandler:
         res = self.reader.read_band("VIS006", None)
         assert res.compute().shape == (464, 3712)
 
+    @pytest.mark.parametrize("chunk_pixels", [8, 4000, 2 ** 20])
+    def test_read_band_in_chunks(self, stub_hrit_file, chunk_pixels):
+        """Test that reading in chunks gives the same result as unpacking the whole segment."""
+        from satpy.readers.core.seviri import dec10216
+        self.reader.filename = os.fspath(stub_hrit_file)
+        raw = np.fromfile(stub_hrit_file, dtype=np.uint8, offset=mda["total_header_length"])
+        expected = dec10216(raw).reshape((464, 3712))
+
+        with mock.patch("satpy.readers.core.hrit.HRITSegment.chunk_pixels", chunk_pixels):
+            res = self.reader.read_band("VIS006", None).compute()
+        np.testing.assert_array_equal(res, expected)
+        assert res.dtype == np.uint16
+
     def test_read_band_FSFile(self, stub_hrit_file):
         """Test reading a single band from an FSFile."""
         import fsspec
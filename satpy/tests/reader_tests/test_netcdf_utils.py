@@ -229,6 +229,30 @@ class TestNetCDF4FileHandler(unittest.TestCase):
         h.__del__()
         assert not h.file_handle.isopen()
 
+    def test_cached_file_content(self):
+        """Test that the file content is taken from the file header cache when enabled."""
+        import tempfile
+        from unittest import mock
+
+        import netCDF4
+
+        import satpy
+        from satpy.readers.core.netcdf import NetCDF4FileHandler
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                satpy.config.set(cache_dir=cache_dir, cache_file_headers=True):
+            expected = NetCDF4FileHandler("test.nc", {}, {})
+            with mock.patch.object(NetCDF4FileHandler, "_collect_attrs", side_effect=AssertionError):
+                file_handler = NetCDF4FileHandler("test.nc", {}, {}, cache_var_size=1000)
+
+        assert list(file_handler.file_content) == list(expected.file_content)
+        assert file_handler["ds2_f/attr/test_attr_str"] == "test_string"
+        assert file_handler["/attrs"] == expected["/attrs"]
+        assert file_handler["test_group/ds1_i/shape"] == (10, 100)
+        assert isinstance(file_handler.file_content["test_group/ds1_i"], netCDF4.Variable)
+        assert isinstance(file_handler.file_content["test_group"], netCDF4.Group)
+        assert sorted(file_handler.cached_file_content.keys()) == ["ds2_s", "ds2_sc"]
+        np.testing.assert_array_equal(file_handler["test_group/ds1_i"], np.arange(10 * 100).reshape((10, 100)))
+
     def test_filenotfound(self):
         """Test that error is raised when file not found."""
         from satpy.readers.core.netcdf import NetCDF4FileHandler
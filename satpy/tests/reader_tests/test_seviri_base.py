@@ -41,6 +41,7 @@ from satpy.readers.core.seviri import (
     pad_data_vertically,
     round_nom_time,
 )
+from satpy.tests.utils import RANDOM_GEN
 from satpy.utils import get_legacy_chunk_size
 
 CHUNK_SIZE = get_legacy_chunk_size()
@@ -65,6 +66,31 @@ class SeviriBaseTest(unittest.TestCase):
         exp = np.array([4,  16,  64, 257], dtype=np.uint16)
         np.testing.assert_equal(res, exp)
 
+    def test_dec10216_out(self):
+        """Test the dec10216 function unpacking into a given array."""
+        out = np.zeros(8, dtype=np.uint16)
+        res = dec10216(np.array([255] * 5 + [1] * 5 + [0, 0], dtype=np.uint8), out=out)
+        assert res is out
+        np.testing.assert_equal(out, [1023] * 4 + [4, 16, 64, 257])
+        with pytest.raises(ValueError, match="Output array"):
+            dec10216(np.ones(10, dtype=np.uint8), out=np.zeros(4, dtype=np.uint16))
+        with pytest.raises(ValueError, match="contiguous"):
+            dec10216(np.ones(10, dtype=np.uint8), out=np.zeros(16, dtype=np.uint16)[::2])
+
+    def test_dec10216_lines(self):
+        """Test the dec10216 function on packed lines, numpy and dask."""
+        packed = RANDOM_GEN.integers(0, 256, size=(6, 10), dtype=np.uint8)
+        exp = dec10216(packed.ravel()).reshape((6, 8))
+        np.testing.assert_equal(dec10216(packed), exp)
+        np.testing.assert_equal(dec10216(packed, lines=slice(2, 4)), exp[2:4])
+        res = dec10216(da.from_array(packed, chunks=(2, 5)))
+        assert res.chunks == ((2, 2, 2), (8,))
+        np.testing.assert_equal(res.compute(), exp)
+        res = dec10216(da.from_array(packed.ravel(), chunks=7))
+        np.testing.assert_equal(res.compute(), exp.ravel())
+        with pytest.raises(ValueError, match="multiple of 5"):
+            dec10216(packed[:, :7])
+
     def test_chebyshev(self):
         """Test the chebyshev function."""
         coefs = [1, 2, 3, 4]
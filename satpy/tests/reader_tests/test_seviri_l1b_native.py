@@ -33,11 +33,13 @@ import xarray as xr
 from pytest_lazy_fixtures import lf
 
 from satpy.readers.core.eum import recarray2dict, time_cds_short
+from satpy.readers.core.utils import fromfile
 from satpy.readers.seviri_l1b_native import (
     ASCII_STARTSWITH,
     ImageBoundaries,
     NativeMSGFileHandler,
     Padder,
+    _get_array,
     get_available_channels,
     has_archive_header,
 )
@@ -925,6 +927,7 @@ class TestNativeMSGDataset:
         with mock.patch("satpy.readers.seviri_l1b_native.NativeMSGFileHandler.__init__",
                         return_value=None):
             fh = NativeMSGFileHandler(filename=None, filename_info={}, filetype_info=None)
+            fh.filename = None
             fh.header = header
             fh.trailer = trailer
             fh.mda = mda
@@ -1007,6 +1010,42 @@ class TestNativeMSGDataset:
         assert file_handler.end_time == dt.datetime(2006, 1, 1, 12, 30, 0)
         assert_attrs_equal(xarr.attrs, expected.attrs, tolerance=1e-4)
 
+    def test_get_dataset_acq_time_from_file(self, file_handler, tmp_path):
+        """Test that the acquisition times are read from the file without computing the image data."""
+        filename = tmp_path / "native.nat"
+        header_size = 16
+        filename.write_bytes(b"\0" * header_size + self._fake_data().tobytes())
+        file_handler.filename = str(filename)
+        file_handler.header_type = np.dtype((np.void, header_size))
+        dataset_id = make_dataid(name="VIS006", resolution=3000, calibration="counts")
+        dataset_info = {"units": "1", "wavelength": (1, 2, 3), "standard_name": "counts"}
+        with mock.patch.object(da.Array, "compute", side_effect=AssertionError):
+            xarr = file_handler.get_dataset(dataset_id, dataset_info)
+        expected = self._exp_data_array()
+        xr.testing.assert_equal(xarr, expected)
+
+    def test_get_dataset_cropped_reads_covering_lines_only(self, file_handler, tmp_path):
+        """Test that a cropped channel only reads the line blocks covering the crop."""
+        filename = tmp_path / "native.nat"
+        header_size = 16
+        data = self._fake_data()
+        filename.write_bytes(b"\0" * header_size + data.tobytes())
+        file_handler.filename = str(filename)
+        file_handler.header_type = np.dtype((np.void, header_size))
+        # one record per line with the channels inside, like in real files, and one block per line
+        line_dtype = np.dtype([("visir", data.dtype["visir"], (2,))])
+        file_handler._dask_array = da.map_blocks(_get_array, dtype=line_dtype, chunks=((1, 1, 1, 1),),
+                                                 meta=np.array([], dtype=line_dtype),
+                                                 filename=str(filename), hdr_size=header_size)
+        dataset_id = make_dataid(name="VIS006", resolution=3000, calibration="counts")
+        dataset_info = {"units": "1", "wavelength": (1, 2, 3), "standard_name": "counts"}
+        xarr = file_handler.get_dataset(dataset_id, dataset_info)
+
+        with mock.patch("satpy.readers.seviri_l1b_native.fromfile", wraps=fromfile) as read:
+            cropped = xarr[2:3].compute()
+        assert [call.kwargs["offset"] for call in read.call_args_list] == [header_size + 2 * line_dtype.itemsize]
+        xr.testing.assert_equal(cropped, self._exp_data_array()[2:3])
+
     def test_time(self, file_handler):
         """Test start/end nominal/observation time handling."""
         assert dt.datetime(2006, 1, 1, 12, 15, 9, 304888) == file_handler.observation_start_time
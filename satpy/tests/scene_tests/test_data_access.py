@@ -14,12 +14,14 @@
 # You should have received a copy of the GNU General Public License along with
 # satpy.  If not, see <http://www.gnu.org/licenses/>.
 """Unit tests for data access methods and properties of the Scene class."""
+import datetime as dt
 import math
 
 import numpy as np
 import pytest
 import xarray as xr
 from dask import array as da
+from pyresample.geometry import AreaDefinition
 
 from satpy import Scene
 from satpy.dataset.dataid import default_id_keys_config
@@ -393,3 +395,98 @@ class TestComputePersist:
         scene.load(["ds1"])
         scene = scene.chunk(chunks=2)
         assert scene["ds1"].data.chunksize == (2, 2)
+
+
+def _count_blocks(block, calls):
+    calls.append(block.shape)
+    return block
+
+
+class TestMergeEquivalentTasks:
+    """Test merging the equivalent dask tasks of the datasets."""
+
+    def _create_scene(self, calls):
+        data = np.arange(16.0).reshape(4, 4)
+        scene = Scene()
+        for name, suffix in (("a", 1), ("b", 2)):
+            inputs = da.from_array(data, chunks=2, name=f"input-{suffix}")
+            counted = inputs.map_blocks(_count_blocks, calls, name=f"counted-{suffix}", meta=np.array((), dtype=float))
+            scene[name] = xr.DataArray(counted * suffix + 1, dims=("y", "x"), attrs={"name": name})
+        scene["c"] = xr.DataArray(data, dims=("y", "x"), attrs={"name": "c"})
+        return scene
+
+    def test_equivalent_tasks_computed_once(self):
+        """Test that equivalent tasks of different datasets are computed once."""
+        calls = []
+        scene = self._create_scene(calls)
+        new_scene = scene.merge_equivalent_tasks()
+        a, b = da.compute(new_scene["a"].data, new_scene["b"].data)
+        assert len(calls) == 4
+        np.testing.assert_array_equal(a, np.arange(16.0).reshape(4, 4) + 1)
+        np.testing.assert_array_equal(b, np.arange(16.0).reshape(4, 4) * 2 + 1)
+        assert new_scene["a"].attrs["name"] == "a"
+        assert new_scene["c"] is scene["c"]
+        assert new_scene["a"].data.name == scene["a"].data.name
+
+        calls.clear()
+        da.compute(scene["a"].data, scene["b"].data)
+        assert len(calls) == 8
+
+    def test_selected_datasets(self):
+        """Test merging the tasks of some datasets only."""
+        calls = []
+        scene = self._create_scene(calls)
+        new_scene = scene.merge_equivalent_tasks(datasets=["a"])
+        assert new_scene["b"] is scene["b"]
+        da.compute(new_scene["a"].data, new_scene["b"].data)
+        assert len(calls) == 8
+
+    def test_identical_outputs(self):
+        """Test merging datasets computed by the same tasks."""
+        data = np.arange(16.0).reshape(4, 4)
+        scene = Scene()
+        scene["a"] = xr.DataArray(da.from_array(data, chunks=2, name="input-1") + 1, dims=("y", "x"))
+        scene["b"] = xr.DataArray(da.from_array(data, chunks=2, name="input-2") + 1, dims=("y", "x"))
+        new_scene = scene.merge_equivalent_tasks()
+        # "b" only aliases the chunks of "a"
+        assert len(new_scene["b"].data.dask) == len(new_scene["a"].data.dask) + 4
+        np.testing.assert_array_equal(new_scene["b"].values, data + 1)
+
+    def test_modifiers_and_compositors(self):
+        """Test merging the tasks of real modifiers and compositors applied to an input read twice."""
+        from dask.highlevelgraph import HighLevelGraph
+
+        from satpy._scene_plan import _get_layer_chunk_sizes
+        from satpy.composites.arithmetic import DifferenceCompositor, RatioCompositor
+        from satpy.modifiers.geometry import SunZenithCorrector
+
+        calls = []
+        area = AreaDefinition("test", "test", "test", "+proj=geos +lon_0=0 +h=35785831 +a=6378169 +b=6356583.8",
+                              4, 4, (-5e6, -5e6, 5e6, 5e6))
+        attrs = {"area": area, "start_time": dt.datetime(2020, 1, 1, 12), "end_time": dt.datetime(2020, 1, 1, 12, 10),
+                 "units": "%", "calibration": "reflectance", "sensor": "seviri", "modifiers": ()}
+
+        def _read(name, suffix, offset):
+            inputs = da.from_array(np.arange(16.0).reshape(4, 4) + offset, chunks=2, name=f"input-{suffix}")
+            counted = inputs.map_blocks(_count_blocks, calls, name=f"read-{suffix}", meta=np.array((), dtype=float))
+            return xr.DataArray(counted, dims=("y", "x"), attrs=attrs | {"name": name})
+
+        sunz = SunZenithCorrector(name="sunz_corrected", max_sza=None)
+        other = _read("other", "other", 100)
+        scene = Scene()
+        scene["diff"] = DifferenceCompositor("diff")([sunz([_read("vis", 1, 50)]), other])
+        scene["ratio"] = RatioCompositor("ratio")([sunz([_read("vis", 2, 50)]), other])
+        expected = da.compute(scene["diff"].data, scene["ratio"].data)
+        calls.clear()
+
+        new_scene = scene.merge_equivalent_tasks()
+        results = da.compute(new_scene["diff"].data, new_scene["ratio"].data)
+        assert len(calls) == 8
+        np.testing.assert_allclose(results[0], expected[0])
+        np.testing.assert_allclose(results[1], expected[1])
+        # the layers keep their annotations, and the duplicated reading is replaced by the one of "diff"
+        graph = new_scene["ratio"].data.dask
+        orig_sizes = _get_layer_chunk_sizes(HighLevelGraph.merge(scene["diff"].data.dask, scene["ratio"].data.dask))
+        assert _get_layer_chunk_sizes(graph) == {name: orig_sizes[name] for name in graph.layers}
+        assert "read-1" in graph.layers
+        assert "read-2" not in graph.layers
@@ -218,6 +218,29 @@ class TestLoadingReaderDatasets:
                                       "loading something that's already "
                                       "loaded")
 
+    def test_add_files(self):
+        """Test adding files to a Scene after loading datasets."""
+        from satpy.readers.core.yaml_reader import FileYAMLReader
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        scene.load(["ds1", "comp1"])
+        scene["user_data"] = xr.DataArray(da.zeros((2, 2)), dims=("y", "x"))
+        ds1_id = make_dataid(name="ds1", resolution=250, calibration="reflectance", modifiers=tuple())
+
+        scene.add_files(["fake1_1.txt"])
+        assert {ds_id["name"] for ds_id in scene.keys()} == {"ds1", "comp1", "user_data"}
+
+        scene.add_files(["fake1_2.txt", "fake1_1.txt", "fake2_1.txt"])
+        assert scene._readers["fake1"].info["filenames"] == ["fake1_1.txt", "fake1_2.txt"]
+        assert [fh.filename for fh in scene._readers["fake1"].file_handlers["fake_file1"]] == [
+            "fake1_1.txt", "fake1_2.txt"]
+        assert {ds_id["name"] for ds_id in scene.keys()} == {"user_data"}
+
+        load_mock = spy_decorator(FileYAMLReader.load)
+        with mock.patch.object(FileYAMLReader, "load", load_mock):
+            scene.load(["ds1", "comp1"])
+        load_mock.mock.assert_called_once_with({ds1_id})
+        assert {ds_id["name"] for ds_id in scene.keys()} == {"ds1", "comp1", "user_data"}
+
     def test_load_ds1_unknown_modifier(self):
         """Test loading one dataset with no loaded compositors."""
         scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
@@ -0,0 +1,114 @@
+# Copyright (c) 2026 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the resource planning of the Scene."""
+
+import dask
+import dask.array as da
+import pytest
+from dask.core import flatten
+from pyresample.geometry import AreaDefinition
+
+from satpy import Scene
+from satpy._scene_plan import _estimate_peak_memory
+from satpy.tests.utils import assert_maximum_dask_computes
+
+# NOTE:
+# The following fixtures are not defined in this file, but are used and injected by Pytest:
+# - include_test_etc
+
+
+def _get_output_keys(*arrays):
+    return {key for arr in arrays for key in flatten(arr.__dask_keys__())}
+
+
+class TestEstimatePeakMemory:
+    """Test the estimation of the peak memory of dask graphs."""
+
+    def test_outputs_kept(self):
+        """Test that computed outputs are kept until the end."""
+        arr = da.ones((100, 100), chunks=50) + 1
+        peak, largest_chunk = _estimate_peak_memory(arr.__dask_graph__(), _get_output_keys(arr))
+        chunk_bytes = 50 * 50 * 8
+        assert largest_chunk == chunk_bytes
+        # all 4 output chunks and the input of the last one
+        assert peak == 5 * chunk_bytes
+
+    def test_outputs_released(self):
+        """Test that outputs written to disk are released as they are produced."""
+        arr = da.ones((100, 100), chunks=50) + 1
+        peak, _ = _estimate_peak_memory(arr.__dask_graph__(), _get_output_keys(arr), outputs_kept=False)
+        assert peak == 2 * 50 * 50 * 8
+
+
+@pytest.mark.usefixtures("include_test_etc")
+class TestScenePlan:
+    """Test planning the resources needed by a Scene."""
+
+    def test_plan_wishlist(self):
+        """Test planning the loading of composites and datasets."""
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        with assert_maximum_dask_computes(0):
+            plan = scene.plan(["comp1", "ds1"])
+        assert not scene.keys()
+        assert sorted(data_id["name"] for data_id in plan.datasets) == ["comp1", "ds1"]
+        ds1_info = next(info for data_id, info in plan.datasets.items() if data_id["name"] == "ds1")
+        assert ds1_info["shape"] == (20, 20)
+        assert plan.bytes_per_file == {"fake1_1.txt": 20 * 20 * 8}
+        assert plan.bytes_read == 20 * 20 * 8
+        assert plan.task_count > 0
+        assert plan.peak_memory >= sum(info["nbytes"] for info in plan.datasets.values())
+        assert plan.suggested_chunk_size is None
+        assert "Estimated peak memory" in str(plan)
+
+    def test_plan_loaded_datasets(self):
+        """Test planning the datasets already loaded in the Scene."""
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        scene.load(["ds1"])
+        plan = scene.plan()
+        assert [data_id["name"] for data_id in plan.datasets] == ["ds1"]
+
+    def test_plan_missing_datasets(self):
+        """Test that planning fails when no datasets can be loaded."""
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        with pytest.raises(KeyError):
+            scene.plan()
+
+    def test_plan_resampled(self):
+        """Test planning the resampling of the datasets."""
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        area = AreaDefinition("test", "test", "test", {"proj": "eqc", "lon_0": 0},
+                              40, 40, (-1e6, -1e6, 1e6, 1e6))
+        plan = scene.plan(["ds1"], area=area, resample_kwargs={"resampler": "nearest"})
+        assert next(iter(plan.datasets.values()))["shape"] == (40, 40)
+        assert plan.bytes_per_file == {"fake1_1.txt": 20 * 20 * 8}
+
+    def test_plan_image_writer(self):
+        """Test that planning for an image writer includes the enhancement."""
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        plan = scene.plan(["ds1"])
+        writer_plan = scene.plan(["ds1"], writer="simple_image")
+        assert writer_plan.task_count > plan.task_count
+
+    def test_suggested_chunk_size(self):
+        """Test that the chunk size is scaled to fit the memory limit."""
+        scene = Scene(filenames=["fake1_1.txt"], reader="fake1")
+        with dask.config.set({"array.chunk-size": "64MiB"}):
+            plan = scene.plan(["ds1"])
+            small_plan = scene.plan(["ds1"], memory_limit=plan.peak_memory // 2)
+            large_plan = scene.plan(["ds1"], memory_limit="1GiB")
+        assert small_plan.suggested_chunk_size == 32 * 2 ** 20
+        # the data is already smaller than the configured chunk size
+        assert large_plan.suggested_chunk_size == 64 * 2 ** 20
@@ -21,6 +21,7 @@ import pytest
 import xarray as xr
 from dask import array as da
 
+import satpy.resample.base
 from satpy import Scene
 from satpy.dataset.dataid import default_id_keys_config
 from satpy.tests.utils import make_cid, make_dataid
@@ -331,9 +332,9 @@ class TestSceneResampling:
             # once for default (reduce_data=True)
             # once for kwarg forced to `True`
             assert slice_data.call_count == 2 * 3
-            # get area slices is called again, once per area
-            assert get_area_slices.call_count == 2
-            assert get_area_slices_big.call_count == 2
+            # the area slices are cached between resamplings
+            assert get_area_slices.call_count == 1
+            assert get_area_slices_big.call_count == 1
 
     def test_resample_ancillary(self):
         """Test that the Scene reducing data does not affect final output."""
@@ -415,6 +416,97 @@ class TestSceneResampling:
         assert new_scene2["comp19"].shape == (20, 20, 3)
         assert new_scene3["comp19"].shape == (20, 20, 3)
 
+    @pytest.mark.parametrize("resampler", ["nearest", "bilinear"])
+    def test_resample_batch(self, resampler):
+        """Test that resampling datasets together gives the same results."""
+        from pyresample import create_area_def
+        src_area = create_area_def("src", 4087, resolution=1000, center=(0, 0), shape=(20, 20))
+        dst_area = create_area_def("dst", 4087, resolution=1500, center=(0, 0), shape=(10, 10))
+        scene = Scene()
+        anc = xr.DataArray(da.ones((20, 20), chunks=10), dims=("y", "x"), attrs={"name": "anc", "area": src_area})
+        for idx in range(3):
+            scene[f"band{idx}"] = xr.DataArray(
+                da.arange(400.0, chunks=100).reshape((20, 20)).rechunk(10) * (idx + 1),
+                dims=("y", "x"),
+                attrs={"name": f"band{idx}", "area": src_area, "ancillary_variables": [anc] if idx == 0 else []})
+        scene["rgb"] = xr.DataArray(da.zeros((3, 20, 20), chunks=10), dims=("bands", "y", "x"),
+                                    coords={"bands": ["R", "G", "B"]}, attrs={"name": "rgb", "area": src_area})
+
+        with mock.patch("satpy.resample.base.resample_datasets",
+                        wraps=satpy.resample.base.resample_datasets) as resample_datasets:
+            batch_scene = scene.resample(dst_area, resampler=resampler, batch=True)
+        single_scene = scene.resample(dst_area, resampler=resampler)
+
+        resample_datasets.assert_called_once()
+        assert len(resample_datasets.call_args[0][0]) == 3
+        for name in ("band0", "band1", "band2", "rgb"):
+            batch_res = batch_scene[name]
+            single_res = single_scene[name]
+            assert batch_res.dims == single_res.dims
+            assert batch_res.attrs["area"] is dst_area
+            assert batch_res.attrs["name"] == name
+            np.testing.assert_allclose(batch_res.values, single_res.values)
+            xr.testing.assert_identical(batch_res.coords.to_dataset(), single_res.coords.to_dataset())
+        assert batch_scene["band0"].attrs["ancillary_variables"][0].attrs["area"] is dst_area
+
+    @staticmethod
+    def _make_counted_scene():
+        """Create a scene whose source chunks record each time they are computed."""
+        from pyresample import create_area_def
+        src_area = create_area_def("src", 4087, resolution=1000, center=(0, 0), shape=(20, 20))
+        computed_blocks = []
+
+        def _count_block(block, block_info=None):
+            computed_blocks.append(block_info[0]["chunk-location"])
+            return block
+
+        data = da.arange(400.0, chunks=100).reshape((20, 20)).rechunk(10)
+        scene = Scene()
+        scene["band"] = xr.DataArray(data.map_blocks(_count_block, meta=np.array((), dtype=float)),
+                                     dims=("y", "x"), attrs={"name": "band", "area": src_area})
+        destinations = {
+            "west": create_area_def("west", 4087, resolution=1000, center=(-2500, 0), shape=(10, 10)),
+            "east": create_area_def("east", 4087, resolution=1000, center=(2500, 0), shape=(10, 10)),
+        }
+        return scene, destinations, computed_blocks
+
+    def test_resample_many(self):
+        """Test resampling to several areas from a shared source graph."""
+        import dask
+
+        scene, destinations, computed_blocks = self._make_counted_scene()
+        new_scenes = scene.resample_many(destinations, resampler="nearest")
+
+        assert list(new_scenes) == ["west", "east"]
+        for name, new_scene in new_scenes.items():
+            assert new_scene["band"].attrs["area"] is destinations[name]
+        west, east = dask.compute(new_scenes["west"]["band"], new_scenes["east"]["band"])
+        assert len(computed_blocks) == 4
+        np.testing.assert_allclose(west.values, scene.resample(destinations["west"])["band"].values)
+        np.testing.assert_allclose(east.values, scene.resample(destinations["east"])["band"].values)
+
+    def test_resample_many_save(self, tmp_path):
+        """Test saving all the targets in one computation."""
+        scene, destinations, computed_blocks = self._make_counted_scene()
+        new_scenes = scene.resample_many(
+            destinations, resampler="nearest",
+            save_kwargs={"writer": "simple_image", "base_dir": str(tmp_path / "{target}"),
+                         "filename": "{target}_{name}.png"})
+
+        assert set(new_scenes) == {"west", "east"}
+        assert (tmp_path / "west" / "west_band.png").exists()
+        assert (tmp_path / "east" / "east_band.png").exists()
+        assert len(computed_blocks) == 4
+
+    def test_resample_many_save_same_paths(self, tmp_path):
+        """Test that saving several targets to the same files is refused."""
+        scene, destinations, computed_blocks = self._make_counted_scene()
+        with pytest.raises(ValueError, match="{target}"):
+            scene.resample_many(destinations, resampler="nearest",
+                                save_kwargs={"writer": "simple_image", "base_dir": str(tmp_path)})
+        assert not list(tmp_path.iterdir())
+        assert not computed_blocks
+
     @mock.patch("satpy.resample.base.resample_dataset")
     def test_no_generate_comp10(self, rs):
         """Test generating a composite after loading."""
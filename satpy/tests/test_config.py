@@ -31,7 +31,7 @@ import pytest
 
 import satpy
 from satpy import DatasetDict, available_writers
-from satpy._config import cached_entry_point
+from satpy._config import _get_satpy_entry_points, cached_entry_point
 from satpy.composites.config_loader import load_compositor_configs_for_sensors
 
 # NOTE:
@@ -293,6 +293,7 @@ class TestPluginsConfigs:
     def setup_class(cls):
         """Set up the class of tests with a clean environment."""
         cached_entry_point.cache_clear()
+        _get_satpy_entry_points.cache_clear()
 
     def teardown_method(self):
         """Tear down the test.
@@ -301,6 +302,7 @@ class TestPluginsConfigs:
 
         """
         cached_entry_point.cache_clear()
+        _get_satpy_entry_points.cache_clear()
 
     def test_get_plugin_configs(self, fake_composite_plugin_etc_path):
         """Check that the plugin configs are looked for."""
@@ -503,6 +505,70 @@ def test_is_writable():
     assert not _is_writable("/foo/bar")
 
 
+def test_yaml_config_cache(tmp_path):
+    """Test caching of parsed YAML configuration files."""
+    from satpy._yaml_cache import clear_cache, get_cache_dir, load_yaml_file
+
+    config_file = tmp_path / "my_reader.yaml"
+    config_file.write_text("reader:\n  name: my_reader\n  sensors: [abi]\n")
+    with satpy.config.set(cache_yaml_configs=True, cache_dir=str(tmp_path / "cache")):
+        conf = load_yaml_file(config_file)
+        assert conf == {"reader": {"name": "my_reader", "sensors": ["abi"]}}
+        assert len(list(Path(get_cache_dir()).glob("*/*.pkl"))) == 1
+        conf["reader"]["name"] = "modified"
+
+        with mock.patch("satpy._yaml_cache._parse_yaml_file") as parse:
+            assert load_yaml_file(config_file)["reader"]["name"] == "my_reader"
+        parse.assert_not_called()
+
+        config_file.write_text("reader:\n  name: my_new_reader\n")
+        assert load_yaml_file(config_file) == {"reader": {"name": "my_new_reader"}}
+        assert len(list(Path(get_cache_dir()).glob("*/*.pkl"))) == 2
+
+        clear_cache()
+        assert not os.path.exists(get_cache_dir())
+
+
+def test_merged_yaml_config_cache(tmp_path):
+    """Test caching of configurations merged from several YAML files."""
+    from satpy._yaml_cache import load_merged_yaml_files
+
+    base_file = tmp_path / "base.yaml"
+    base_file.write_text("reader:\n  name: my_reader\n  sensors: [abi]\n")
+    user_file = tmp_path / "user.yaml"
+    user_file.write_text("reader:\n  sensors: [ahi]\n")
+    with satpy.config.set(cache_yaml_configs=True, cache_dir=str(tmp_path / "cache")):
+        conf = load_merged_yaml_files([base_file, user_file])
+        assert conf == {"reader": {"name": "my_reader", "sensors": ["ahi"]}}
+        conf["reader"]["name"] = "modified"
+
+        with mock.patch("satpy._yaml_cache.load_yaml_file") as load:
+            assert load_merged_yaml_files([base_file, user_file])["reader"]["name"] == "my_reader"
+        load.assert_not_called()
+
+        assert load_merged_yaml_files([user_file, base_file])["reader"]["sensors"] == ["abi"]
+        user_file.write_text("reader:\n  sensors: [fci]\n")
+        assert load_merged_yaml_files([base_file, user_file])["reader"]["sensors"] == ["fci"]
+
+
+def test_yaml_config_memory_cache_is_bounded(tmp_path):
+    """Test that only the last used entries are kept in memory."""
+    from satpy import _yaml_cache
+
+    config_files = []
+    for idx in range(3):
+        config_files.append(tmp_path / f"config{idx}.yaml")
+        config_files[-1].write_text(f"value: {idx}\n")
+    with satpy.config.set(cache_yaml_configs=True, cache_dir=str(tmp_path / "cache")), \
+            mock.patch.object(_yaml_cache, "MEMORY_CACHE_SIZE", 2), \
+            mock.patch.object(_yaml_cache, "_MEMORY_CACHE", _yaml_cache.OrderedDict()):
+        for config_file in config_files:
+            _yaml_cache.load_yaml_file(config_file)
+        _yaml_cache.load_yaml_file(config_files[1])
+        expected = [_yaml_cache._get_cache_id(config_files[idx], _yaml_cache.UnsafeLoader) for idx in (2, 1)]
+        assert list(_yaml_cache._MEMORY_CACHE) == expected
+
+
 def _is_writable(directory):
     import tempfile
     try:
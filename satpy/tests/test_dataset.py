@@ -751,6 +751,92 @@ class TestIDQueryInteractions(unittest.TestCase):
         assert res[0]["name"] == "HRV"
 
 
+def _get_indexed_dataids():
+    dataids = []
+    for idx, (wl_min, wl_max) in enumerate(((0.5, 0.7), (0.8, 0.9), (1.5, 1.7), (10.0, 12.0))):
+        for resolution in (250, 500, 1000):
+            for calibration in ("reflectance", "radiance", "counts"):
+                for modifiers in ((), ("sunz_corrected",)):
+                    dataids.append(make_dataid(name=f"C{idx:02d}", wavelength=(wl_min, (wl_min + wl_max) / 2, wl_max),
+                                               resolution=resolution, calibration=calibration,
+                                               modifiers=modifiers))
+    dataids.append(make_cid(name="true_color", resolution=500))
+    dataids.append(make_cid(name="overview"))
+    return dataids
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        DataQuery(name="C01"),
+        DataQuery(name="C01", resolution=500),
+        DataQuery(name="C01", resolution=[250, 500], calibration="radiance"),
+        DataQuery(name="C02", modifiers=("sunz_corrected",)),
+        DataQuery(wavelength=0.85),
+        DataQuery(wavelength=11, calibration="counts", resolution=1000),
+        DataQuery(wavelength=5),
+        DataQuery(name="true_color"),
+        DataQuery(name="true_color", resolution=1000),
+        DataQuery(name="overview", resolution=500),
+        DataQuery(name="unknown"),
+        DataQuery(name="*", resolution=250),
+    ],
+)
+def test_dataid_index_matches_filter_dataids(query):
+    """Test that the DataID index finds the same DataIDs as a full scan."""
+    from satpy.dataset.data_dict import DataIDIndex
+
+    dataids = _get_indexed_dataids()
+    index = DataIDIndex(dataids)
+    assert len(index) == len(dataids)
+    assert index.filter_dataids(query) == query.filter_dataids(sorted(dataids))
+
+    for dataid in dataids[::2]:
+        index.discard(dataid)
+    assert index.filter_dataids(query) == query.filter_dataids(sorted(dataids[1::2]))
+
+
+def test_dataset_dict_index_follows_changes():
+    """Test that lookups in a DatasetDict see added, updated and removed items."""
+    from satpy.dataset.data_dict import DatasetDict
+
+    dataids = _get_indexed_dataids()
+    dsd = DatasetDict()
+    dsd.update({dataid: {"name": dataid["name"]} for dataid in dataids[:10]})
+    assert dsd.get_key(DataQuery(name="C00", resolution=250), num_results=0, best=False) == \
+        DataQuery(name="C00", resolution=250).filter_dataids(sorted(dataids[:6]))
+    dsd[dataids[-1]] = {"name": "overview"}
+    assert dsd.get_key("overview") == dataids[-1]
+    del dsd["overview"]
+    assert "overview" not in dsd
+    dsd.pop(dataids[0])
+    assert dataids[0] not in dsd.get_key("C00", num_results=0, best=False)
+    dsd.clear()
+    assert "C00" not in dsd
+
+
+def test_dataset_dict_index_is_updated_in_place():
+    """Test that adding items updates the index instead of rebuilding it."""
+    import pickle
+    from unittest import mock
+
+    from satpy.dataset.data_dict import DataIDIndex, DatasetDict
+
+    dataids = _get_indexed_dataids()
+    dsd = DatasetDict()
+    index = dsd._dataid_index
+    with mock.patch.object(DataIDIndex, "__init__", side_effect=AssertionError("index rebuilt")):
+        for dataid in dataids:
+            dsd[dataid] = {"name": dataid["name"]}
+        dsd |= {dataids[0]: {"name": dataids[0]["name"]}}
+    assert dsd._dataid_index is index
+    assert list(index) == sorted(dataids)
+
+    unpickled = pickle.loads(pickle.dumps(dsd))
+    assert unpickled.get_key(DataQuery(name="C00", resolution=250), num_results=0, best=False) == \
+        dsd.get_key(DataQuery(name="C00", resolution=250), num_results=0, best=False)
+
+
 def test_frequency_quadruple_side_band_class_method_convert():
     """Test the frequency double side band object: test the class method convert."""
     frq_qdsb = FrequencyQuadrupleSideBand(57, 0.322, 0.05, 0.036)
@@ -36,7 +36,7 @@ from pytest_lazy_fixtures import lf as lazy_fixture
 
 from satpy.dataset.data_dict import get_key
 from satpy.dataset.dataid import DataID, ModifierTuple, WavelengthRange
-from satpy.readers.core.grouping import find_files_and_readers
+from satpy.readers.core.grouping import _parse_files_in_batches, find_files_and_readers
 from satpy.readers.core.remote import open_file_or_filename
 
 # NOTE:
@@ -446,6 +446,14 @@ class TestReaderLoader(unittest.TestCase):
         assert "abi_l1b" in readers
         assert len(list(readers["abi_l1b"].available_dataset_ids)) == 0
 
+    def test_reader_only_kwargs_not_passed_to_file_handlers(self):
+        """Test that reader-only keyword arguments are not passed to the file handlers."""
+        from satpy.readers.core.loading import _get_reader_kwargs
+        kwargs = {"filter_parameters": {"area": None}, "parallel_init": 4, "calibrate": True}
+        reader_kwargs, fh_kwargs = _get_reader_kwargs(None, kwargs)
+        assert reader_kwargs == {None: kwargs}
+        assert fh_kwargs == {None: {"calibrate": True}}
+
     def test_yaml_error_message(self):
         """Test that YAML errors are logged properly."""
         import logging
@@ -679,6 +687,32 @@ class TestYAMLFiles:
         assert "viirs_l1b" in reader_names
         assert len(reader_names) == len(list(glob_config("readers/*.yaml")))
 
+    def test_reader_registry(self):
+        """Test matching files to readers without creating the readers."""
+        from satpy.readers.core.registry import ReaderRegistry, get_cache_dir, get_reader_registry
+
+        abi_file = "OR_ABI-L1b-RadC-M3C01_G16_s20171171502203_e20171171504576_c20171171505018.nc"
+        registry = get_reader_registry()
+        assert get_reader_registry() is registry
+        assert len(os.listdir(get_cache_dir())) == 1
+        assert registry.match_files([abi_file, "unknown.txt"]) == {"abi_l1b": {abi_file}}
+        assert registry.match_files([abi_file], sensor="viirs") == {}
+        assert registry.files_for_reader("viirs_sdr", [abi_file]) == set()
+
+        loaded_registry = ReaderRegistry.from_json(registry.to_json())
+        assert loaded_registry.readers == registry.readers
+        abi_configs = registry.readers["abi_l1b"]["config_files"]
+        assert loaded_registry.reader_for_config_files(abi_configs) == "abi_l1b"
+
+        from satpy.readers.core.config import BaseLoader, available_readers
+        assert available_readers(yaml_loader=BaseLoader) == sorted(registry.readers)
+
+        from satpy.readers.core import grouping
+        with mock.patch.object(grouping, "load_reader", wraps=grouping.load_reader) as load_reader:
+            groups = grouping.group_files([abi_file])
+        assert groups == [{"abi_l1b": [abi_file]}]
+        load_reader.assert_called_once()
+
 
 class TestGroupFiles(unittest.TestCase):
     """Test the 'group_files' utility function."""
@@ -962,6 +996,149 @@ class TestGroupFiles(unittest.TestCase):
                 time_threshold=35,
                 missing="hopkin green frog")
 
+    def test_many_files_same_as_per_file_grouping(self):
+        """Test that grouping in batches gives the same groups as grouping the files one by one."""
+        from satpy.readers.core.grouping import group_files
+        rng = np.random.default_rng(42)
+        start = dt.datetime(2017, 4, 27)
+        files = []
+        for slot in range(48):
+            for channel in range(1, 17):
+                for platform in ("G16", "G17"):
+                    stime = start + dt.timedelta(minutes=5 * slot, seconds=int(rng.integers(0, 30)))
+                    etime = stime + dt.timedelta(minutes=2)
+                    files.append(f"OR_ABI-L1b-RadC-M3C{channel:02d}_{platform}_"
+                                 f"s{stime:%Y%j%H%M%S}0_e{etime:%Y%j%H%M%S}0_c{etime:%Y%j%H%M%S}0.nc")
+        for kwargs in ({}, {"time_threshold": 20}, {"group_keys": ("start_time", "platform_shortname")},
+                       {"group_keys": ("platform_shortname", "start_time")}, {"group_keys": ("scan_mode",)}):
+            with mock.patch("satpy.readers.core.grouping._get_sorted_file_groups") as per_file_grouping:
+                groups = group_files(files, reader="abi_l1b", **kwargs)
+            per_file_grouping.assert_not_called()
+            with mock.patch("satpy.readers.core.grouping._can_parse_in_batches", return_value=False):
+                expected = group_files(files, reader="abi_l1b", **kwargs)
+            assert groups == expected
+
+    def test_invalid_field_not_matched_in_batches(self):
+        """Test that files whose fields can't be converted don't match when parsing in batches."""
+        from satpy.readers.core.grouping import group_files
+        files = ["HS_H08_20171117_1500_B01_FLDK_R10_S0110.DAT", "HS_H08_20171317_1500_B01_FLDK_R10_S0110.DAT"]
+        with pytest.raises(ValueError, match="No matching readers found for these files: HS_H08_20171317"):
+            group_files(files, reader="ahi_hsd")
+        groups = group_files(files[:1], reader="ahi_hsd")
+        assert groups == [{"ahi_hsd": files[:1]}]
+
+    def test_mixed_group_key_values_fall_back_to_per_file_grouping(self):
+        """Test grouping files in batches with a group key missing from the files of only one reader."""
+        from satpy.readers.core.grouping import group_files
+        files = (self.g16_files +
+                 ["HS_H08_20171117_1500_B01_FLDK_R10_S0110.DAT", "HS_H08_20171117_1500_B01_FLDK_R10_S0210.DAT"])
+        kwargs = {"reader": ["abi_l1b", "ahi_hsd"], "group_keys": ("start_time", "segment")}
+        with mock.patch("satpy.readers.core.grouping._parse_files_in_batches",
+                        wraps=_parse_files_in_batches) as parse_files_in_batches:
+            groups = group_files(files, **kwargs)
+        assert parse_files_in_batches.call_count == 2
+        with mock.patch("satpy.readers.core.grouping._can_parse_in_batches", return_value=False):
+            expected = group_files(files, **kwargs)
+        assert groups == expected
+
+
+class TestFileGrouper:
+    """Test grouping files incrementally."""
+
+    @staticmethod
+    def _ahi_files(band, time="1500", platform="H08"):
+        return [f"HS_{platform}_20171117_{time}_B{band:02d}_FLDK_R10_S{segment:02d}10.DAT"
+                for segment in range(1, 11)]
+
+    def test_group_returned_when_complete(self):
+        """Test that a group is returned when all segments of the required file types are there."""
+        from satpy.readers.core.grouping import FileGrouper
+        grouper = FileGrouper("ahi_hsd", required_filetypes=["hsd_b01", "hsd_b03"])
+        b01 = self._ahi_files(1)
+        b03 = self._ahi_files(3)
+        next_b01 = self._ahi_files(1, time="1510")
+        for filename in b01 + b03[:-1] + next_b01[:3]:
+            assert grouper.add(filename) == []
+        assert grouper.add(b01[0]) == []
+        with mock.patch.object(grouper, "_parse", wraps=grouper._parse) as parse:
+            groups = grouper.add(b03[-1])
+        parse.assert_called_once_with(b03[-1])
+        assert groups == [{"ahi_hsd": sorted(b01 + b03)}]
+        assert grouper.waiting_groups == [{"ahi_hsd": next_b01[:3]}]
+
+    def test_same_groups_as_group_files(self):
+        """Test that files are grouped like with group_files."""
+        from satpy.readers.core.grouping import FileGrouper, group_files
+        files = self._ahi_files(1) + self._ahi_files(1, time="1510") + self._ahi_files(1, platform="H09")
+        grouper = FileGrouper("ahi_hsd")
+        for filename in reversed(files):
+            assert grouper.add(filename) == []
+        assert grouper.flush() == group_files(files, reader="ahi_hsd")
+        assert grouper.waiting_groups == []
+
+    def test_timeout(self):
+        """Test that incomplete groups are returned when they time out."""
+        from satpy.readers.core.grouping import FileGrouper
+        grouper = FileGrouper("ahi_hsd", required_filetypes={"ahi_hsd": ["hsd_b01"]}, timeout=60)
+        first = self._ahi_files(1)[:5]
+        second = self._ahi_files(1, time="1510")[:5]
+        for filename in first:
+            assert grouper.add(filename, now=0) == []
+        assert grouper.add(second[0], now=30) == []
+        assert grouper.expire(now=59) == []
+        assert grouper.add(second[1], now=60) == [{"ahi_hsd": first}]
+        assert grouper.expire(now=90) == [{"ahi_hsd": second[:2]}]
+        assert grouper.flush() == []
+
+    def test_required_filetypes_with_several_readers(self):
+        """Test that the required file types must be given per reader with several readers."""
+        from satpy.readers.core.grouping import FileGrouper
+        with pytest.raises(ValueError, match="for every reader"):
+            FileGrouper(["ahi_hsd", "abi_l1b"], required_filetypes=["hsd_b01"])
+
+    def test_unknown_file(self, caplog):
+        """Test that a file no reader can read is logged and ignored."""
+        from satpy.readers.core.grouping import FileGrouper
+        grouper = FileGrouper("ahi_hsd")
+        with caplog.at_level("WARNING"):
+            assert grouper.add("some_file.nc") == []
+        assert "some_file.nc" in caplog.text
+        assert grouper.waiting_groups == []
+
+    def test_returned_files_are_forgotten(self):
+        """Test that the files of returned groups are not remembered, and start a new group when added again."""
+        from satpy.readers.core.grouping import FileGrouper
+        grouper = FileGrouper("ahi_hsd", required_filetypes=["hsd_b01"])
+        b01 = self._ahi_files(1)
+        for filename in b01[:-1]:
+            assert grouper.add(filename) == []
+        assert grouper.add(b01[-1]) == [{"ahi_hsd": b01}]
+        assert not grouper._filenames
+        assert grouper.add(b01[0]) == []
+        assert grouper.waiting_groups == [{"ahi_hsd": b01[:1]}]
+
+
+class TestFilenamePattern:
+    """Test parsing batches of filenames with a filename pattern."""
+
+    def test_parse_columns(self):
+        """Test parsing fields into columns of distinct values."""
+        from satpy.readers.core.filename_patterns import get_filename_pattern
+        pattern = get_filename_pattern("{platform}_{start_time:%Y%m%d%H%M}_{segment:02d}.dat")
+        filenames = [os.path.join("some", "dir", "H09_202401010000_01.dat"),
+                     "H09_202401010000_02.dat",
+                     "H09_202413010000_01.dat",
+                     "H09_202401010010_01.txt",
+                     "H09_202401010010_xx.dat"]
+        matching, columns = pattern.parse_columns(filenames, ["start_time", "segment", "orbit"])
+        assert matching == filenames[:2]
+        assert columns["start_time"].values[columns["start_time"].codes[0]] == dt.datetime(2024, 1, 1)
+        np.testing.assert_array_equal(columns["start_time"].codes, [0, 0])
+        assert [columns["segment"].values[code] for code in columns["segment"].codes] == [1, 2]
+        assert columns["orbit"].values == [None]
+        np.testing.assert_array_equal(columns["orbit"].codes, [0, 0])
+        assert get_filename_pattern(pattern.pattern) is pattern
+
 
 def _generate_random_string():
     import uuid
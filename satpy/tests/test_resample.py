@@ -28,6 +28,7 @@ import pytest
 import xarray as xr
 from pyproj import CRS
 
+import satpy
 from satpy.resample.native import NativeResampler
 
 
@@ -128,6 +129,110 @@ class TestHLResample(unittest.TestCase):
         assert np.all(res.values == expected_filled)
 
 
+class TestBatchResample:
+    """Test resampling several datasets in one pass."""
+
+    def test_batch_key(self):
+        """Test which datasets can be resampled together."""
+        from satpy.resample.base import get_batch_key
+        from satpy.resample.kdtree import KDTreeResampler
+        from satpy.resample.native import NativeResampler
+
+        data, source_area, swath_data, swath_def, target_area = get_test_data()
+        resampler = KDTreeResampler(source_area, target_area)
+        key = get_batch_key(data, resampler)
+        assert key is not None
+        assert get_batch_key(data.copy(), resampler) == key
+        assert get_batch_key(data.astype(np.float32), resampler) != key
+        assert get_batch_key(data, resampler, fill_value=0) != key
+        assert get_batch_key(data.expand_dims("bands"), resampler) is None
+        assert get_batch_key(data, NativeResampler(source_area, target_area)) is None
+
+        swath_resampler = KDTreeResampler(swath_def, target_area)
+        assert get_batch_key(swath_data, swath_resampler) is None
+        assert get_batch_key(swath_data, swath_resampler, mask_area=False) is not None
+
+    def test_resample_datasets(self):
+        """Test that datasets resampled together keep their attributes and coordinates."""
+        from satpy.resample.base import resample_dataset, resample_datasets
+
+        data, _, _, _, target_area = get_test_data()
+        datasets = [data, (data + 1).assign_attrs(name="other", area=data.attrs["area"])]
+        new_datasets = resample_datasets(datasets, target_area, resampler="nearest")
+        for dataset, new_dataset in zip(datasets, new_datasets):
+            # the array name of single datasets comes from the resampler
+            expected = resample_dataset(dataset, target_area, resampler="nearest").rename(dataset.name)
+            xr.testing.assert_identical(new_dataset, expected)
+
+
+class TestAreaSlicesCache:
+    """Test the cache of the slices of areas covering other areas."""
+
+    def _get_areas(self, count=1):
+        from pyresample import create_area_def
+        source_area = create_area_def("src", 4087, resolution=1000, center=(0, 0), shape=(100, 100))
+        return source_area, [create_area_def(f"dst{idx}", 4087, resolution=1000, center=(idx * 1000, 0),
+                                             shape=(20, 20))
+                             for idx in range(count)]
+
+    def test_memory_cache(self, tmp_path):
+        """Test that the slices are computed once per pair of areas."""
+        from pyresample.geometry import AreaDefinition
+
+        from satpy._area_slices import get_area_slices
+
+        source_area, (destination_area,) = self._get_areas()
+        expected = source_area.get_area_slices(destination_area)
+        with mock.patch.object(AreaDefinition, "get_area_slices", autospec=True,
+                               side_effect=AreaDefinition.get_area_slices) as compute, \
+                satpy.config.set(cache_dir=str(tmp_path)):
+            assert get_area_slices(source_area, destination_area) == expected
+            assert get_area_slices(source_area, destination_area) == expected
+            # equal areas share their entries
+            assert get_area_slices(source_area.copy(), destination_area.copy()) == expected
+            assert compute.call_count == 1
+            get_area_slices(source_area, destination_area, shape_divisible_by=4)
+            assert compute.call_count == 2
+        assert not os.path.exists(tmp_path / "area_slices")
+
+    def test_disk_cache(self, tmp_path):
+        """Test that the slices are shared between processes on disk."""
+        from pyresample.geometry import AreaDefinition
+
+        from satpy import _area_slices
+
+        source_area, destination_areas = self._get_areas(3)
+        with satpy.config.set(cache_area_slices=True, cache_dir=str(tmp_path),
+                              area_slices_cache_max_entries=2):
+            expected = _area_slices.get_area_slices(source_area, destination_areas[0])
+            cache_files = os.listdir(_area_slices.get_cache_dir())
+            assert len(cache_files) == 1
+            _area_slices._MEMORY_CACHE.clear()
+            with mock.patch.object(AreaDefinition, "get_area_slices") as compute:
+                assert _area_slices.get_area_slices(source_area, destination_areas[0]) == expected
+            compute.assert_not_called()
+
+            # the least recently used entries are removed
+            os.utime(os.path.join(_area_slices.get_cache_dir(), cache_files[0]), (0, 0))
+            for destination_area in destination_areas[1:]:
+                _area_slices.get_area_slices(source_area, destination_area)
+            assert len(os.listdir(_area_slices.get_cache_dir())) == 2
+            assert cache_files[0] not in os.listdir(_area_slices.get_cache_dir())
+
+            _area_slices.clear_cache()
+            assert not os.path.exists(_area_slices.get_cache_dir())
+            assert not _area_slices._MEMORY_CACHE
+
+    def test_swath_not_cached(self):
+        """Test that the slices of swaths are not cached."""
+        from satpy import _area_slices
+
+        _, _, _, swath_def, target_area = get_test_data()
+        with pytest.raises(NotImplementedError):
+            _area_slices.get_area_slices(swath_def, target_area)
+        assert not _area_slices._MEMORY_CACHE
+
+
 class TestKDTreeResampler(unittest.TestCase):
     """Test the kd-tree resampler."""
 
@@ -209,6 +314,152 @@ class TestKDTreeResampler(unittest.TestCase):
         resampler.resampler.get_sample_from_neighbour_info.assert_called_with(data, fill_value)
 
 
+def _wraps_memmap(arr):
+    """Check if a dask array reads its data from a memory map."""
+    return any(isinstance(getattr(val, "value", val), np.memmap)
+               for val in dict(arr.__dask_graph__()).values())
+
+
+class TestResampleIndexStore:
+    """Test the store of precomputed resampling indices."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test that stored arrays are loaded as read-only memory maps."""
+        from satpy.resample.index_store import ResampleIndexStore
+        store = ResampleIndexStore(tmp_path / "store")
+        with pytest.raises(KeyError):
+            store.load("missing")
+        store.save("entry", {"index_array": np.arange(10), "valid_input_index": np.ones(3, dtype=bool)})
+        assert "entry" in store
+        arrays = store.load("entry")
+        assert isinstance(arrays["index_array"], np.memmap)
+        assert not arrays["index_array"].flags.writeable
+        np.testing.assert_array_equal(arrays["index_array"], np.arange(10))
+        assert arrays["valid_input_index"].dtype == bool
+        store.clear()
+        assert "entry" not in store
+
+    def test_load_incomplete_entry(self, tmp_path):
+        """Test that entries missing index arrays are not loaded."""
+        from satpy.resample.index_store import ResampleIndexStore
+        store = ResampleIndexStore(tmp_path)
+        store.save("entry", {"index_array": np.arange(10), "valid_input_index": np.ones(3, dtype=bool)})
+        os.remove(tmp_path / "entry" / "valid_input_index.npy")
+        assert set(store.load("entry")) == {"index_array"}
+        with pytest.raises(KeyError):
+            store.load("entry", names=("index_array", "valid_input_index"))
+
+    def test_load_entry_removed_by_other_process(self, tmp_path):
+        """Test that an entry removed while being loaded is reported as missing."""
+        from satpy.resample.index_store import ResampleIndexStore
+        store = ResampleIndexStore(tmp_path)
+        store.save("entry", {"index_array": np.arange(10)})
+        with mock.patch("satpy.resample.index_store.np.load", side_effect=FileNotFoundError), \
+                pytest.raises(KeyError):
+            store.load("entry")
+
+    def test_eviction(self, tmp_path):
+        """Test that the least recently used entries are removed when the store is too large."""
+        from satpy.resample.index_store import ResampleIndexStore
+        store = ResampleIndexStore(tmp_path, max_size=2500)
+        for key in ("first", "second"):
+            store.save(key, {"index_array": np.zeros(100, dtype=np.int64)})
+        os.utime(tmp_path / "first", (0, 0))
+        os.utime(tmp_path / "second", (1, 1))
+        store.load("first")
+        store.save("third", {"index_array": np.zeros(100, dtype=np.int64)})
+        assert "first" in store
+        assert "second" not in store
+        assert "third" in store
+
+    def test_eviction_keeps_new_entry(self, tmp_path):
+        """Test that saving an entry larger than the maximum size doesn't remove it right away."""
+        from satpy.resample.index_store import ResampleIndexStore
+        store = ResampleIndexStore(tmp_path, max_size=100)
+        store.save("first", {"index_array": np.zeros(100, dtype=np.int64)})
+        store.save("second", {"index_array": np.zeros(100, dtype=np.int64)})
+        assert "first" not in store
+        np.testing.assert_array_equal(store.load("second")["index_array"], 0)
+
+    def test_max_size_from_config(self, tmp_path):
+        """Test the default maximum size comes from the configuration."""
+        import satpy
+        from satpy.resample.index_store import ResampleIndexStore
+        with satpy.config.set(resample_index_store_max_size=1000):
+            assert ResampleIndexStore(tmp_path).max_size == 1000
+        assert ResampleIndexStore(tmp_path).max_size is None
+
+    def test_kd_resampling_with_index_store(self, tmp_path):
+        """Test that the kd-tree resampler reuses indices from the store."""
+        from satpy.resample.kdtree import KDTreeResampler
+        data, source_area, _, _, target_area = get_test_data()
+        data = data.copy(data=da.arange(data.size, dtype=np.float64).reshape(data.shape))
+        resampler = KDTreeResampler(source_area, target_area)
+        expected = resampler.resample(data, index_store=str(tmp_path))
+        assert len(os.listdir(tmp_path)) == 1
+
+        resampler = KDTreeResampler(source_area, target_area)
+        with mock.patch("pyresample.kd_tree.XArrayResamplerNN.get_neighbour_info") as get_neighbour_info:
+            res = resampler.resample(data, index_store=str(tmp_path))
+        get_neighbour_info.assert_not_called()
+        assert _wraps_memmap(resampler._index_caches[None]["index_array"])
+        np.testing.assert_array_equal(res.values, expected.values)
+
+    def test_kd_resampling_with_too_small_index_store(self, tmp_path):
+        """Test that the kd-tree resampler works when the store can't keep its indices."""
+        from satpy.resample.index_store import ResampleIndexStore
+        from satpy.resample.kdtree import KDTreeResampler
+        data, source_area, _, _, target_area = get_test_data()
+        data = data.copy(data=da.arange(data.size, dtype=np.float64).reshape(data.shape))
+        expected = KDTreeResampler(source_area, target_area).resample(data)
+
+        store = ResampleIndexStore(tmp_path, max_size=100)
+        resampler = KDTreeResampler(source_area, target_area)
+        with mock.patch.object(ResampleIndexStore, "load", side_effect=KeyError("removed")):
+            res = resampler.resample(data, index_store=store)
+        np.testing.assert_array_equal(res.values, expected.values)
+        # the entry just saved is kept even if it is larger than the maximum size
+        assert len(store.entries()) == 1
+
+    def test_bilinear_resampling_with_index_store(self, tmp_path):
+        """Test that the bilinear resampler reuses indices from the store."""
+        from satpy.resample.kdtree import BilinearResampler
+        data, source_area, _, _, target_area = get_test_data()
+        data = data.copy(data=da.arange(data.size, dtype=np.float64).reshape(data.shape))
+        expected = BilinearResampler(source_area, target_area).resample(data, radius_of_influence=100000)
+
+        res = BilinearResampler(source_area, target_area).resample(
+            data, radius_of_influence=100000, index_store=str(tmp_path))
+        assert len(os.listdir(tmp_path)) == 1
+        np.testing.assert_allclose(res.values, expected.values)
+
+        resampler = BilinearResampler(source_area, target_area)
+        with mock.patch("pyresample.bilinear.XArrayBilinearResampler.get_bil_info") as get_bil_info:
+            res = resampler.resample(data, radius_of_influence=100000, index_store=str(tmp_path))
+        get_bil_info.assert_not_called()
+        assert _wraps_memmap(resampler.resampler.bilinear_s)
+        np.testing.assert_allclose(res.values, expected.values)
+
+    @mock.patch("satpy.resample.index_store.prewarm_indices")
+    def test_prewarm_indices_cmd(self, prewarm_indices, tmp_path):
+        """Test the command line interface to precompute indices."""
+        from satpy.resample.index_store import prewarm_indices_cmd
+        prewarm_indices_cmd([str(tmp_path), "--sources", "src", "--targets", "euro4", "germ",
+                             "--radius-of-influence", "5000", "--max-size", "1000"])
+        index_store, sources, targets = prewarm_indices.call_args.args
+        assert index_store.max_size == 1000
+        assert sources == ["src"]
+        assert targets == ["euro4", "germ"]
+        assert prewarm_indices.call_args.kwargs == {"resampler": "nearest", "radius_of_influence": 5000.0}
+
+    def test_prewarm_indices(self, tmp_path):
+        """Test precomputing indices for areas."""
+        from satpy.resample.index_store import ResampleIndexStore, prewarm_indices
+        _, source_area, _, _, target_area = get_test_data()
+        prewarm_indices(tmp_path, [source_area], [target_area, target_area.copy(height=50, width=25)])
+        assert len(ResampleIndexStore(tmp_path).entries()) == 2
+
+
 class TestNativeResampler:
     """Tests for the 'native' resampling method."""
 
@@ -238,22 +489,67 @@ class TestNativeResampler:
         with pytest.raises(ValueError, match="[Aggregation, Expand] .*"):
             NativeResampler._expand_reduce(self.d_arr, {0: dim0_factor, 1: 1.})
 
-    def test_expand_reduce_agg_rechunk(self):
-        """Test that an incompatible factor for the chunk size is rechunked.
+    @pytest.mark.parametrize("chunks", [3, 1, ((5, 1), (2, 7, 11))])
+    def test_expand_reduce_agg_nonfactor_chunks(self, chunks):
+        """Test aggregating chunks whose size is not divisible by the factor.
 
         This can happen when a user chunks their data that makes sense for
         the overall shape of the array and for their local machine's
         performance, but the resulting resampling factor does not divide evenly
-        into that chunk size.
+        into that chunk size. The chunks are aggregated without rechunking the
+        input array.
 
         """
-        from satpy.utils import PerformanceWarning
+        import warnings
 
-        d_arr = da.zeros((6, 20), chunks=3)
-        text = "Array chunk size is not divisible by aggregation factor. Re-chunking to continue native resampling."
-        with pytest.warns(PerformanceWarning, match=text):
+        d_arr = da.arange(120.0).reshape((6, 20)).rechunk(chunks)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
             new_data = NativeResampler._expand_reduce(d_arr, {0: 0.5, 1: 0.5})
         assert new_data.shape == (3, 10)
+        assert new_data.numblocks[0] <= d_arr.numblocks[0]
+        assert new_data.numblocks[1] <= d_arr.numblocks[1]
+        new_layers = set(new_data.__dask_graph__().layers) - set(d_arr.__dask_graph__().layers)
+        assert [name.split("-")[0] for name in new_layers] == ["aggregate"]
+        expected = np.arange(120.0).reshape((3, 2, 10, 2)).mean(axis=(1, 3))
+        np.testing.assert_allclose(new_data.compute(), expected)
+
+    @pytest.mark.parametrize(
+        ("aggregation", "expected"),
+        [
+            ("mean", [[1.5, 16 / 3]]),
+            ("max", [[3.0, 6.0]]),
+            ("min", [[0.0, 4.0]]),
+            ("mode", [[0.0, 6.0]]),
+        ]
+    )
+    def test_expand_reduce_aggregations(self, aggregation, expected):
+        """Test the reductions used to aggregate data."""
+        d_arr = da.from_array(np.array([[0, 3, 6, 6],
+                                        [0, 3, np.nan, 4]]), chunks=(2, 3))
+        new_data = NativeResampler._expand_reduce(d_arr, {0: 0.5, 1: 0.5}, aggregation=aggregation)
+        np.testing.assert_allclose(new_data.compute(), expected)
+
+    def test_expand_reduce_mode_categorical(self):
+        """Test that the mode of categorical data keeps the data type and the smallest value of ties."""
+        d_arr = da.from_array(np.array([[2, 1, 5, 5, 7, 8],
+                                        [1, 2, 5, 7, 9, 9]], dtype=np.uint8), chunks=2)
+        new_data = NativeResampler._expand_reduce(d_arr, {0: 0.5, 1: 0.5}, aggregation="mode")
+        assert new_data.dtype == np.uint8
+        np.testing.assert_equal(new_data.compute(), np.array([[1, 5, 9]], dtype=np.uint8))
+
+    def test_expand_reduce_aggregate_3d(self):
+        """Test aggregating 3D data only along the reduced dimensions."""
+        d_arr = da.arange(3 * 6 * 8).reshape((3, 6, 8)).rechunk((1, 3, 3))
+        new_data = NativeResampler._expand_reduce(d_arr, {0: 1., 1: 0.5, 2: 0.5}, aggregation="max")
+        assert new_data.dtype == d_arr.dtype
+        expected = np.arange(3 * 6 * 8).reshape((3, 3, 2, 4, 2)).max(axis=(2, 4))
+        np.testing.assert_equal(new_data.compute(), expected)
+
+    def test_expand_reduce_unknown_aggregation(self):
+        """Test that unknown aggregations are refused."""
+        with pytest.raises(ValueError, match="Unknown aggregation 'median'"):
+            NativeResampler._expand_reduce(self.d_arr, {0: 0.5, 1: 0.5}, aggregation="median")
 
     def test_expand_reduce_numpy(self):
         """Test classmethod 'expand_reduce' converts numpy arrays to dask arrays."""
@@ -300,6 +596,17 @@ class TestNativeResampler:
         assert new_data.coords["x"].attrs["units"] == "meter"
         assert target_area.crs == new_data.coords["crs"].item()
 
+    def test_reduce_dims_with_aggregation(self):
+        """Test reducing native resampling with a chosen aggregation."""
+        ds1, source_area, _, _, target_area = get_test_data(input_shape=(200, 100), output_shape=(100, 50))
+        ds1 = ds1.copy(data=da.arange(200 * 100, chunks=85 * 100).reshape((200, 100)).rechunk(85))
+        resampler = NativeResampler(source_area, target_area)
+        new_data = resampler.resample(ds1, aggregation="max")
+        assert new_data.shape == (100, 50)
+        expected = np.arange(200 * 100).reshape((100, 2, 50, 2)).max(axis=(1, 3))
+        np.testing.assert_equal(new_data.values, expected)
+        assert target_area.crs == new_data.coords["crs"].item()
+
     def test_expand_without_dims(self):
         """Test expanding native resampling with no dimensions specified."""
         ds1, source_area, _, _, target_area = get_test_data(input_dims=None)
@@ -683,6 +990,94 @@ class TestBucketFraction(unittest.TestCase):
         assert np.all(res.coords["categories"] == np.array([0, 1, 2]))
 
 
+def _get_bucket_test_data():
+    """Get a random swath, categorical data with missing values on it and a target area."""
+    from pyresample import create_area_def
+    from pyresample.geometry import SwathDefinition
+
+    rng = np.random.default_rng(1)
+    lons = xr.DataArray(da.from_array(rng.uniform(-5, 5, (40, 30)), chunks=(13, 30)), dims=("y", "x"))
+    lats = xr.DataArray(da.from_array(rng.uniform(40, 50, (40, 30)), chunks=(13, 30)), dims=("y", "x"))
+    values = rng.integers(0, 4, (40, 30)).astype(float)
+    values[values == 3] = np.nan
+    values[0, :5] = 9
+    data = xr.DataArray(da.from_array(values, chunks=(10, 30)), dims=("y", "x"))
+    target_area = create_area_def("target", 4326, area_extent=(-4, 41, 4, 49), shape=(6, 8))
+    return data, SwathDefinition(lons, lats), target_area
+
+
+class TestBucketIndexCache:
+    """Test sharing and caching the bucket indices."""
+
+    def test_shared_indices(self):
+        """Test that the bucket resamplers between the same geometries share their indices."""
+        from satpy.resample.bucket import BucketAvg, BucketCount
+        _, source_swath, target_area = _get_bucket_test_data()
+        with mock.patch("pyresample.bucket.BucketResampler") as bucket_resampler:
+            avg = BucketAvg(source_swath, target_area)
+            avg.precompute()
+            count = BucketCount(source_swath, target_area)
+            count.precompute()
+        bucket_resampler.assert_called_once()
+        assert avg.resampler is count.resampler
+
+    def test_cache_dir(self, tmp_path):
+        """Test storing the bucket indices in a cache directory."""
+        from satpy.resample import bucket
+        data, source_swath, target_area = _get_bucket_test_data()
+        expected = bucket.BucketSum(source_swath, target_area).resample(data).values
+        bucket._BUCKET_RESAMPLERS.clear()
+
+        res = bucket.BucketSum(source_swath, target_area).resample(data, cache_dir=str(tmp_path))
+        np.testing.assert_allclose(res.values, expected)
+        assert len(list(tmp_path.glob("bucket_lut-*.zarr"))) == 1
+        bucket._BUCKET_RESAMPLERS.clear()
+
+        with mock.patch("satpy.resample.bucket._save_bucket_indices") as save_indices:
+            res = bucket.BucketSum(source_swath, target_area).resample(data, cache_dir=str(tmp_path))
+        save_indices.assert_not_called()
+        np.testing.assert_allclose(res.values, expected)
+
+
+class TestBucketStatistics:
+    """Test the bucket resampler computing several statistics in one pass."""
+
+    @pytest.mark.parametrize("skipna", [True, False])
+    @pytest.mark.parametrize("fill_value", [np.nan, 9.0])
+    def test_resample(self, fill_value, skipna):
+        """Test that the statistics are the same as from the single statistic resamplers."""
+        from satpy.resample.bucket import BucketAvg, BucketCount, BucketFraction, BucketStatistics, BucketSum
+        data, source_swath, target_area = _get_bucket_test_data()
+        res = BucketStatistics(source_swath, target_area).resample(
+            data, statistics=("sum", "count", "average", "fraction"), fill_value=fill_value, skipna=skipna,
+            categories=[0, 1, 2])
+
+        assert res.dims == ("statistic", "y", "x")
+        assert list(res.coords["statistic"].values) == ["average", "count", "fraction_0", "fraction_1",
+                                                        "fraction_2", "sum"]
+        average = BucketAvg(source_swath, target_area).resample(data, fill_value=fill_value, skipna=skipna)
+        np.testing.assert_allclose(res.sel(statistic="average").values, average.values)
+        count = BucketCount(source_swath, target_area).resample(data)
+        np.testing.assert_allclose(res.sel(statistic="count").values, count.values)
+        fractions = BucketFraction(source_swath, target_area).resample(data, categories=[0, 1, 2],
+                                                                       fill_value=fill_value)
+        for cat in (0, 1, 2):
+            np.testing.assert_allclose(res.sel(statistic=f"fraction_{cat}").values,
+                                       fractions.sel(categories=cat).values)
+        if np.isnan(fill_value):
+            sums = BucketSum(source_swath, target_area).resample(data, skipna=skipna)
+            np.testing.assert_allclose(res.sel(statistic="sum").values, sums.values)
+
+    def test_compute_invalid(self):
+        """Test that 3D data and unknown statistics are refused."""
+        from satpy.resample.bucket import BucketStatistics
+        bucket = BucketStatistics(mock.MagicMock(), mock.MagicMock())
+        with pytest.raises(ValueError, match="BucketStatistics not implemented for 3D datasets"):
+            bucket.compute(da.ones((3, 5, 5)))
+        with pytest.raises(ValueError, match=r"Unknown bucket statistics \['median'\]"):
+            bucket.compute(da.ones((5, 5)), statistics=("sum", "median"))
+
+
 @pytest.mark.parametrize("name",
                          ["KDTreeResampler",
                           "BilinearResampler",
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import datetime
 import logging
+import sys
 import typing
 import warnings
 from math import sqrt
@@ -314,6 +315,51 @@ class TestShowVersions:
         assert check_fake, "Did not find '__fake: not installed' in print output"
 
 
+class TestStartupReport:
+    """Test the 'startup_report' function."""
+
+    def test_startup_report_not_enabled(self, capsys):
+        """Test that the report tells how to enable profiling."""
+        from satpy.utils import startup_report
+        startup_report()
+        out, _ = capsys.readouterr()
+        assert "SATPY_PROFILE_STARTUP" in out
+
+    def test_startup_report(self, tmp_path, monkeypatch, capsys):
+        """Test that imports and configuration files are timed once profiling is enabled."""
+        from satpy import _startup_profile
+        from satpy._yaml_cache import load_yaml_file
+        from satpy.utils import startup_report
+
+        (tmp_path / "_satpy_profiled_module.py").write_text("import _satpy_profiled_child\n")
+        (tmp_path / "_satpy_profiled_child.py").write_text("x = 1\n")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("a: 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        _startup_profile.enable()
+        try:
+            import _satpy_profiled_module  # noqa: F401
+            load_yaml_file(config_file)
+            load_yaml_file(config_file)
+        finally:
+            _startup_profile.disable()
+        try:
+            import_times = _startup_profile.get_import_times()
+            cumulative, own = import_times["_satpy_profiled_module"]
+            assert cumulative >= import_times["_satpy_profiled_child"][0]
+            assert own <= cumulative
+            assert _startup_profile.get_config_times()[str(config_file)][1] == 2
+            startup_report()
+            out, _ = capsys.readouterr()
+            assert "_satpy_profiled_module" in out
+            assert str(config_file) in out
+        finally:
+            _startup_profile.clear()
+            sys.modules.pop("_satpy_profiled_module", None)
+            sys.modules.pop("_satpy_profiled_child", None)
+
+
 def test_debug_on(caplog):
     """Test that debug_on is working as expected."""
     from satpy.utils import debug, debug_off, debug_on
@@ -258,6 +258,79 @@ class TestFileFileYAMLReaderMultiplePatterns(unittest.TestCase):
         self.reader.create_filehandlers(filelist)
         assert len(self.reader.file_handlers["ftype1"]) == 3
 
+    def test_create_filehandlers_parallel(self):
+        """Check create_filehandlers with file handlers created in a thread pool."""
+        import threading
+
+        filelist = ["a001.bla", "a002.bla", "a001.bla", "a002.bla",
+                    "abcd.bla", "k001.bla", "a003.bli"]
+        threads = set()
+
+        class ThreadRecordingReader(DummyReader):
+            def __init__(self, *args):
+                threads.add(threading.get_ident())
+                super().__init__(*args)
+
+        self.config["file_types"]["ftype1"]["file_reader"] = ThreadRecordingReader
+        sequential_reader = yr.FileYAMLReader(self.config, filter_parameters=self.reader.filter_parameters)
+        sequential_reader.create_filehandlers(filelist)
+        parallel_reader = yr.FileYAMLReader(self.config, filter_parameters=self.reader.filter_parameters,
+                                            parallel_init=4)
+        parallel_reader.create_filehandlers(filelist)
+
+        assert threading.get_ident() in threads
+        assert len(threads) > 1
+        assert ([fh.filename for fh in parallel_reader.file_handlers["ftype1"]] ==
+                [fh.filename for fh in sequential_reader.file_handlers["ftype1"]])
+        assert parallel_reader.all_ids == sequential_reader.all_ids
+
+    def test_create_filehandlers_parallel_with_requirements(self):
+        """Check parallel creation of file handlers requiring other file handlers."""
+        import time
+        import warnings
+
+        running = []
+        max_running = []
+
+        class RequiringReader(DummyReader):
+            thread_safe_init = False
+
+            def __init__(self, filename, filename_info, filetype_info, *req_fh):
+                running.append(filename)
+                max_running.append(len(running))
+                time.sleep(0.01)
+                super().__init__(filename, filename_info, filetype_info)
+                self.req_fh = req_fh
+                running.remove(filename)
+
+        self.config["file_types"]["ftype2"] = {"name": "ft2",
+                                               "file_patterns": ["b{something:3s}.bla"],
+                                               "file_reader": RequiringReader,
+                                               "requires": ["ftype1"]}
+        filelist = ["a001.bla", "a002.bla", "b001.bla", "b002.bla", "b003.bla"]
+        readers = []
+        caught = []
+        for parallel_init in (None, 4):
+            reader = yr.FileYAMLReader(self.config, filter_parameters=self.reader.filter_parameters,
+                                       parallel_init=parallel_init)
+            with warnings.catch_warnings(record=True) as records:
+                warnings.simplefilter("always")
+                reader.create_filehandlers(filelist)
+            readers.append(reader)
+            caught.append([(str(rec.message), rec.filename, rec.lineno) for rec in records])
+
+        sequential_reader, parallel_reader = readers
+        assert max(max_running) == 1
+        req_filenames = [[req.filename for req in fh.req_fh] for fh in parallel_reader.file_handlers["ftype2"]]
+        assert req_filenames == [["a001.bla"], ["a002.bla"]]
+        assert req_filenames == [[req.filename for req in fh.req_fh]
+                                 for fh in sequential_reader.file_handlers["ftype2"]]
+        # the warning for the file without its required file points to the same place on both paths
+        assert len(caught[0]) == 1
+        assert "b003.bla" in caught[0][0][0]
+        assert caught[0][0][1] == yr.__file__
+        assert caught[0] == caught[1]
+
     def test_serializable(self):
         """Check that a reader is serializable by dask.
 
@@ -1060,6 +1133,20 @@ class TestGEOSegmentYAMLReader(unittest.TestCase):
         reader.create_filehandlers(["fake.nc"])
         assert [fh.filename_info["segment"] for fh in reader.file_handlers["ft1"]] == [1, 2, 3]
 
+    @patch.object(yr.FileYAMLReader, "__init__", lambda x: None)
+    def test_get_available_segments(self):
+        """Test getting the available segments of every file type."""
+        from satpy.readers.core.yaml_reader import GEOSegmentYAMLReader
+        reader = GEOSegmentYAMLReader()
+        fhs = []
+        for segment in (3, 1):
+            fake_fh = _create_mocked_basic_fh()
+            fake_fh.filename_info["segment"] = segment
+            fake_fh.filetype_info["expected_segments"] = 10
+            fhs.append(fake_fh)
+        reader.file_handlers = {"ft1": fhs, "ft2": []}
+        assert reader.get_available_segments() == {"ft1": ([1, 3], 10)}
+
     @patch.object(yr.FileYAMLReader, "__init__", lambda x: None)
     @patch("satpy.readers.core.yaml_reader.FileYAMLReader._load_dataset")
     @patch("satpy.readers.core.yaml_reader.xr")
@@ -1408,6 +1495,18 @@ class TestGEOVariableSegmentYAMLReader:
                          seg2_extent)
         fake_adef.assert_called_once_with(*expected_call)
 
+    def test_segment_heights_computed_again_with_new_files(self, GVSYReader):
+        """Test that the padded segment heights are computed again when file handlers are added."""
+        compute_heights = MagicMock(return_value=[100, 200])
+        GVSYReader.segment_heights = cache(compute_heights)
+        GVSYReader.segment_heights("ft1", 11136)
+        GVSYReader.segment_heights("ft1", 11136)
+        assert compute_heights.call_count == 1
+        with patch.object(yr.GEOSegmentYAMLReader, "create_filehandlers", return_value={}):
+            GVSYReader.create_filehandlers(["new_segment.nc"])
+        GVSYReader.segment_heights("ft1", 11136)
+        assert compute_heights.call_count == 2
+
     def test_pad_later_segments_area_for_multiple_segments_gap(self, GVSYReader, fake_adef):
         """Test _pad_later_segments_area() in the variable padding case for multiple gaps with multiple segments."""
 
@@ -577,6 +577,25 @@ def check_satpy(readers=None, writers=None, packages=None):
     show_versions(packages=packages)
 
 
+def startup_report(limit=20):
+    """Print the time spent importing modules and loading configuration files.
+
+    The times are only recorded when the ``SATPY_PROFILE_STARTUP`` environment
+    variable is set to ``1`` before satpy is imported. The same report is then
+    printed to standard error when the process exits.
+
+    Args:
+        limit (int or None): Number of the slowest modules and configuration
+            files to show, all of them if None.
+
+    Returns:
+        None.
+
+    """
+    from satpy._startup_profile import format_report
+    print(format_report(limit=limit))  # noqa: T201
+
+
 def unify_chunks(*data_arrays: xr.DataArray) -> tuple[xr.DataArray, ...]:
     """Run :func:`xarray.unify_chunks` if input dimensions are all the same size.
 
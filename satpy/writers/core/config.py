@@ -8,6 +8,7 @@ import yaml
 from yaml import UnsafeLoader
 
 from satpy._config import config_search_paths, get_entry_points_config_dirs, glob_config
+from satpy._yaml_cache import load_yaml_file
 
 LOG = logging.getLogger(__name__)
 
@@ -17,8 +18,7 @@ def read_writer_config(config_files, loader=UnsafeLoader):
     conf = {}
     LOG.debug("Reading %s", str(config_files))
     for config_file in config_files:
-        with open(config_file) as fd:
-            conf.update(yaml.load(fd.read(), Loader=loader))
+        conf.update(load_yaml_file(config_file, loader=loader))
 
     try:
         writer_info = conf["writer"]